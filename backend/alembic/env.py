@@ -13,6 +13,9 @@ from src.shared.infra.db import Base
 from src.rooms.infra.room_model_psql import RoomModel
 from src.reservations.infra.reservation_model_psql import ReservationModel
 from src.payments.infra.payment_model_psql import PaymentModel
+from src.reports.infra.occupancy_model_psql import RoomDayOccupancyModel
+from src.reservations.infra.room_change_model_psql import RoomChangeModel
+from src.reservations.infra.room_version_model_psql import RoomVersionModel
 
 # Usar metadata global de la app
 target_metadata = Base.metadata
@@ -0,0 +1,33 @@
+"""payments.reservation_id unique index
+
+Revision ID: 3c1d7e9a2b40
+Revises: 920477683691
+Create Date: 2025-10-23 10:05:17.284610
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c1d7e9a2b40'
+down_revision: Union[str, Sequence[str], None] = '920477683691'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Make the payments.reservation_id index unique (one payment per reservation).
+
+    Fails if duplicate payments already exist; remove them before upgrading.
+    """
+    op.drop_index('ix_payments_reservation_id', table_name='payments')
+    op.create_index('ix_payments_reservation_id', 'payments', ['reservation_id'], unique=True)
+
+
+def downgrade() -> None:
+    """Restore the non-unique payments.reservation_id index."""
+    op.drop_index('ix_payments_reservation_id', table_name='payments')
+    op.create_index('ix_payments_reservation_id', 'payments', ['reservation_id'])
@@ -0,0 +1,45 @@
+"""reservations (guest_email, start_date, id) covering index
+
+Revision ID: 5b8e0d3a6f17
+Revises: 7a4f2c91d8e3
+Create Date: 2025-10-28 14:22:09.640517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b8e0d3a6f17'
+down_revision: Union[str, Sequence[str], None] = '7a4f2c91d8e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace the guest_email index with a covering (guest_email, start_date, id) index.
+
+    On PostgreSQL the index is built CONCURRENTLY (outside a transaction) so bookings are not
+    blocked while it builds on a large table. The old single-column index is a prefix of the
+    new one and is dropped afterwards.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_reservations_guest_email_start_date',
+            'reservations',
+            ['guest_email', 'start_date', 'id'],
+            postgresql_include=['room_id', 'end_date', 'status'],
+            postgresql_concurrently=True,
+        )
+        op.drop_index('ix_reservations_guest_email', table_name='reservations', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Restore the single-column guest_email index."""
+    with op.get_context().autocommit_block():
+        op.create_index('ix_reservations_guest_email', 'reservations', ['guest_email'], postgresql_concurrently=True)
+        op.drop_index(
+            'ix_reservations_guest_email_start_date', table_name='reservations', postgresql_concurrently=True
+        )
@@ -0,0 +1,47 @@
+"""room_day_occupancy rollup table
+
+Revision ID: 7a4f2c91d8e3
+Revises: 3c1d7e9a2b40
+Create Date: 2025-10-27 09:41:03.118254
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a4f2c91d8e3'
+down_revision: Union[str, Sequence[str], None] = '3c1d7e9a2b40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the per-room, per-night occupancy rollup and fill it from active reservations.
+
+    On other backends than PostgreSQL run `python manage.py backfill-occupancy` afterwards.
+    """
+    op.create_table(
+        'room_day_occupancy',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('room_id', sa.String(length=36), nullable=False),
+        sa.Column('reservations', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('day', 'room_id'),
+    )
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(
+            """
+            INSERT INTO room_day_occupancy (day, room_id, reservations)
+            SELECT night::date, room_id, count(*)
+            FROM reservations, generate_series(start_date, end_date, interval '1 day') AS night
+            WHERE status = 'active'
+            GROUP BY 1, 2
+            """
+        )
+
+
+def downgrade() -> None:
+    """Drop the occupancy rollup."""
+    op.drop_table('room_day_occupancy')
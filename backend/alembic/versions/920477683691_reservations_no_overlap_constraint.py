@@ -0,0 +1,50 @@
+"""reservations no-overlap exclusion constraint
+
+Revision ID: 920477683691
+Revises: f82bc6206943
+Create Date: 2025-10-21 11:04:17.286540
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '920477683691'
+down_revision: Union[str, Sequence[str], None] = 'f82bc6206943'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Let Postgres reject overlapping ACTIVE reservations of the same room.
+
+    Date bounds are inclusive, matching ReservationRepositoryPsql.has_overlap.
+    Fails if the table already contains overlapping active rows; cancel them first.
+    SQLite has no exclusion constraints: creation is serialized per room in-process instead.
+    """
+    conn = op.get_bind()
+    if conn.dialect.name != "postgresql":
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    op.execute(
+        """
+        ALTER TABLE reservations
+        ADD CONSTRAINT ex_reservations_room_active_dates
+        EXCLUDE USING gist (
+            room_id WITH =,
+            daterange(start_date, end_date, '[]') WITH &&
+        )
+        WHERE (status = 'active')
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the exclusion constraint (the btree_gist extension is left installed)."""
+    conn = op.get_bind()
+    if conn.dialect.name != "postgresql":
+        return
+    op.execute("ALTER TABLE reservations DROP CONSTRAINT IF EXISTS ex_reservations_room_active_dates")
@@ -0,0 +1,64 @@
+"""room_changes log with a NOTIFY trigger
+
+Revision ID: 9d2c4e8f1a53
+Revises: 5b8e0d3a6f17
+Create Date: 2025-11-06 10:12:44.530918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d2c4e8f1a53'
+down_revision: Union[str, Sequence[str], None] = '5b8e0d3a6f17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the reservation change log read by every worker's change relay.
+
+    On PostgreSQL each inserted row is also sent with NOTIFY on the `room_changes` channel,
+    from the inserting transaction, so listeners receive it when (and only if) it commits.
+    """
+    op.create_table(
+        'room_changes',
+        sa.Column('id', sa.BigInteger().with_variant(sa.Integer(), 'sqlite'), autoincrement=True, nullable=False),
+        sa.Column('room_id', sa.String(length=36), nullable=False),
+        sa.Column('reservation_id', sa.String(length=36), nullable=False),
+        sa.Column('event', sa.String(length=20), nullable=False),
+        sa.Column('start_date', sa.Date(), nullable=False),
+        sa.Column('end_date', sa.Date(), nullable=False),
+        sa.Column('origin', sa.String(length=100), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sqlite_autoincrement=True,
+    )
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute(
+        """
+        CREATE FUNCTION notify_room_change() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('room_changes', row_to_json(NEW)::text);
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER room_changes_notify
+        AFTER INSERT ON room_changes
+        FOR EACH ROW EXECUTE FUNCTION notify_room_change()
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the change log and its trigger."""
+    op.drop_table('room_changes')
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("DROP FUNCTION IF EXISTS notify_room_change()")
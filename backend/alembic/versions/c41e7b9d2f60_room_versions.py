@@ -0,0 +1,33 @@
+"""room_versions counters
+
+Revision ID: c41e7b9d2f60
+Revises: 9d2c4e8f1a53
+Create Date: 2025-11-07 15:03:26.817452
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41e7b9d2f60'
+down_revision: Union[str, Sequence[str], None] = '9d2c4e8f1a53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the per-room versions the room cache is keyed on (no row means version 0)."""
+    op.create_table(
+        'room_versions',
+        sa.Column('room_id', sa.String(length=36), nullable=False),
+        sa.Column('version', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('room_id'),
+    )
+
+
+def downgrade() -> None:
+    """Drop the room versions."""
+    op.drop_table('room_versions')
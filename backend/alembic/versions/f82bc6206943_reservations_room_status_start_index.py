@@ -0,0 +1,32 @@
+"""reservations room/status/start_date index
+
+Revision ID: f82bc6206943
+Revises: 6e5d8cfb5fbb
+Create Date: 2025-10-20 09:12:41.503118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f82bc6206943'
+down_revision: Union[str, Sequence[str], None] = '6e5d8cfb5fbb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add composite index used by per-room reservation listings."""
+    op.create_index(
+        'ix_reservations_room_id_status_start_date',
+        'reservations',
+        ['room_id', 'status', 'start_date'],
+    )
+
+
+def downgrade() -> None:
+    """Drop composite per-room reservation index."""
+    op.drop_index('ix_reservations_room_id_status_start_date', table_name='reservations')
@@ -0,0 +1,49 @@
+import base64
+import json
+from datetime import date
+from typing import Any, Optional, Tuple
+
+from fastapi import HTTPException
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode the sort key of the last row of a page as an opaque cursor."""
+    raw = json.dumps(list(values), default=str, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], arity: int = 1) -> Optional[list]:
+    """Decode a cursor produced by encode_cursor, rejecting malformed values with a 400."""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(values, list) or len(values) != arity:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+
+def decode_id_cursor(cursor: Optional[str]) -> Optional[str]:
+    """Decode the id cursor of the GET /reservations and GET /payments pages."""
+    after = decode_cursor(cursor)
+    if after is None:
+        return None
+    if not isinstance(after[0], str):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return after[0]
+
+
+def decode_start_date_cursor(cursor: Optional[str]) -> Optional[Tuple[date, str]]:
+    """Decode the (start_date, id) cursor of the guest and room reservation lists."""
+    after = decode_cursor(cursor, arity=2)
+    if after is None:
+        return None
+    try:
+        return date.fromisoformat(after[0]), str(after[1])
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
@@ -0,0 +1,30 @@
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.shared.infra.query_profiler import profile_queries
+
+
+class QueryProfilingMiddleware:
+    """Adds X-DB-Query-Count and X-DB-Time (milliseconds) to every HTTP response.
+
+    Only statements run before the response starts are counted: the body of a
+    streaming response is read from the database after the headers are sent.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with profile_queries() as stats:
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers["X-DB-Query-Count"] = str(stats.count)
+                    headers["X-DB-Time"] = f"{stats.seconds * 1000:.2f}"
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
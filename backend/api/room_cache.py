@@ -0,0 +1,153 @@
+"""ETags, conditional GETs and a process-local response cache for the room read endpoints.
+
+Room payloads only change when a reservation is created or cancelled, which bumps the room's
+row in room_versions in the same transaction, whatever process makes it. Rendered bodies
+are kept in a bounded LRU under the version they were rendered at, and each request reads
+the current version (one primary-key lookup) before serving one, so a booking made through
+any worker shows up on the next read. ETags are a hash of the body: every worker computes
+the same tag for the same data, so a CDN or browser revalidating with If-None-Match gets a
+304 from any of them.
+"""
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from fastapi import Request, Response
+
+from src.shared.infra.db import get_async_read_session, get_async_session, get_read_session, get_session
+
+ROOMS_KEY = "rooms"
+
+
+def room_key(room_id: str) -> str:
+    return f"room:{room_id}"
+
+
+def etag_for(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def _matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    # Weak comparison (RFC 9110 13.1.2): W/ prefixes are ignored
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+@dataclass
+class CachedBody:
+    body: bytes
+    etag: str
+    version: int
+    stored_at: float
+
+
+class ResponseCache:
+    """Thread-safe LRU of rendered bodies, bounded by entry count and total bytes.
+
+    An entry is only served for the version it was stored with. Readers pass the version
+    read before querying the data: a booking committed in between makes the body newer
+    than its version, which costs one extra miss but never serves stale data.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 16 * 1024 * 1024, ttl_seconds: float = 30.0):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, CachedBody]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str, version: int) -> Optional[CachedBody]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.version != version or time.monotonic() - entry.stored_at > self.ttl_seconds:
+                self._drop(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, body: bytes, version: int) -> CachedBody:
+        entry = CachedBody(body=body, etag=etag_for(body), version=version, stored_at=time.monotonic())
+        if len(body) > self.max_bytes:
+            return entry
+        with self._lock:
+            self._drop(key)
+            self._entries[key] = entry
+            self._bytes += len(body)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry.body)
+
+
+def _build_default_cache() -> Optional[ResponseCache]:
+    if os.getenv("ROOM_CACHE_ENABLED", "0").lower() not in ("1", "true", "yes"):
+        return None
+    return ResponseCache(
+        max_entries=int(os.getenv("ROOM_CACHE_MAX_ENTRIES", "1024")),
+        max_bytes=int(os.getenv("ROOM_CACHE_MAX_BYTES", str(16 * 1024 * 1024))),
+        # Bookings are covered by the version; this bounds edits to the rooms themselves
+        ttl_seconds=float(os.getenv("ROOM_CACHE_TTL", "30")),
+    )
+
+
+# Process-wide cache, enabled with ROOM_CACHE_ENABLED=1
+room_cache = _build_default_cache()
+
+# With the cache on, room reads use the primary: a replica lagging behind a booking would
+# store its old body under the booking's version, and keep serving it until the next one
+get_room_session = get_session if room_cache is not None else get_read_session
+get_async_room_session = get_async_session if room_cache is not None else get_async_read_session
+
+# max-age=0 + must-revalidate: caches may store the body but revalidate every time,
+# which costs a 304 instead of a full payload while bookings still show up immediately
+CACHE_CONTROL = f"public, max-age={int(os.getenv('ROOM_CACHE_MAX_AGE', '0'))}, must-revalidate"
+
+
+def _respond(request: Request, body: bytes, etag: str) -> Response:
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if _matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def cache_enabled() -> bool:
+    """Whether routes should read the room version to pass to cached_response/store_response."""
+    return room_cache is not None
+
+
+def cached_response(request: Request, key: str, version: int) -> Optional[Response]:
+    """The response for the body cached at `version`, else None."""
+    if room_cache is None:
+        return None
+    entry = room_cache.get(key, version)
+    if entry is None:
+        return None
+    return _respond(request, entry.body, entry.etag)
+
+
+def store_response(request: Request, key: str, body: bytes, version: int) -> Response:
+    if room_cache is None:
+        return _respond(request, body, etag_for(body))
+    entry = room_cache.put(key, body, version)
+    return _respond(request, entry.body, entry.etag)
@@ -0,0 +1,175 @@
+"""Server-Sent Events feed of room availability changes (GET /rooms/events).
+
+Every reservation created or cancelled by any worker reaches this process through the
+room change relay and becomes one SSE frame, rendered once and appended to a bounded
+replay buffer. Connected clients hold no queue of their own: they remember the position of
+the last frame they sent and sleep on a shared asyncio.Event that is swapped out on every
+append, so a write wakes all idle connections with a single set() and each connection then
+copies what it missed from the buffer.
+
+Event ids are the ids of the shared change log, the same in every worker. A reconnecting
+client resumes after its Last-Event-ID on whichever worker it reaches; one whose id is no
+longer (or not yet) in that worker's buffer gets a `reset` event and must re-read GET /rooms.
+So does every client when the relay reports that changes may have been missed.
+"""
+import asyncio
+import itertools
+import os
+import threading
+from collections import deque
+from typing import AsyncIterator, Deque, List, Optional, Tuple
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+
+from api.serialization import dumps
+from src.reservations.application.reservation_events import ReservationChange, reservation_changes
+
+RESET_EVENT = "reset"
+
+
+class RoomEventBroker:
+    """Bounded replay buffer of rendered SSE frames plus a wake-up for idle streams.
+
+    Frames are numbered by a local, gapless sequence; their event ids are change log ids,
+    which arrive in commit order but not necessarily ascending on PostgreSQL. `publish` is
+    called from the relay thread: the buffer is guarded by a lock and waiters are woken on
+    their own loop.
+    """
+
+    def __init__(self, replay_size: int = 1024):
+        self._frames: Deque[Tuple[int, str, bytes]] = deque(maxlen=replay_size)
+        self._seq = 0
+        self._last_event_id: Optional[str] = None
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    @property
+    def last_seq(self) -> int:
+        return self._seq
+
+    @property
+    def last_event_id(self) -> Optional[str]:
+        return self._last_event_id
+
+    def parse_event_id(self, last_event_id: Optional[str]) -> Optional[int]:
+        """Return the sequence number of the buffered frame with this event id, else None."""
+        if not last_event_id:
+            return None
+        event_id = last_event_id.strip()
+        with self._lock:
+            # Reconnects usually resume near the end: search from the newest frame
+            for seq, frame_id, _ in reversed(self._frames):
+                if frame_id == event_id:
+                    return seq
+        return None
+
+    def publish(self, event: str, data: dict, event_id: Optional[str] = None) -> None:
+        with self._lock:
+            self._seq += 1
+            if event_id is not None:
+                self._last_event_id = event_id
+            id_line = f"id: {self._last_event_id}\n" if self._last_event_id is not None else ""
+            frame = f"{id_line}event: {event}\ndata: ".encode() + dumps(data) + b"\n\n"
+            self._frames.append((self._seq, self._last_event_id, frame))
+            loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._wake()
+        else:
+            loop.call_soon_threadsafe(self._wake)
+
+    def frames_after(self, seq: int) -> Optional[List[Tuple[int, bytes]]]:
+        """Frames published after `seq`, or None if some of them were already evicted."""
+        with self._lock:
+            if seq >= self._seq:
+                return []
+            oldest = self._frames[0][0] if self._frames else self._seq + 1
+            if seq + 1 < oldest:
+                return None
+            # Only the newest (last_seq - seq) frames are wanted: walk from the right end
+            missed = [(s, frame) for s, _, frame in itertools.islice(reversed(self._frames), self._seq - seq)]
+        missed.reverse()
+        return missed
+
+    async def wait(self, seq: int, timeout: float) -> None:
+        """Return once a frame newer than `seq` exists or after `timeout` seconds."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop, self._wakeup = loop, asyncio.Event()
+        wakeup = self._wakeup
+        if seq < self._seq:
+            return
+        try:
+            async with asyncio.timeout(timeout):
+                await wakeup.wait()
+        except TimeoutError:
+            pass
+
+    def _wake(self) -> None:
+        # Runs on the loop: release every waiter of the current generation at once
+        wakeup, self._wakeup = self._wakeup, asyncio.Event()
+        if wakeup is not None:
+            wakeup.set()
+
+    def handle_change(self, change: Optional[ReservationChange]) -> None:
+        if change is None:
+            self.publish(RESET_EVENT, {})
+            return
+        self.publish(change.event, {
+            "room_id": change.room_id,
+            "reservation_id": change.reservation_id,
+            "from": change.start_date.isoformat(),
+            "to": change.end_date.isoformat(),
+        }, event_id=str(change.id))
+
+
+room_event_broker = RoomEventBroker(replay_size=int(os.getenv("ROOM_EVENTS_REPLAY_SIZE", "1024")))
+reservation_changes.subscribe(room_event_broker.handle_change)
+
+# Comment frames keep proxies and load balancers from closing idle streams
+KEEPALIVE_SECONDS = float(os.getenv("ROOM_EVENTS_KEEPALIVE", "15"))
+RETRY_MS = int(os.getenv("ROOM_EVENTS_RETRY_MS", "3000"))
+
+
+def _reset_frame(broker: RoomEventBroker) -> bytes:
+    event_id = broker.last_event_id
+    id_line = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{id_line}event: {RESET_EVENT}\ndata: {{}}\n\n".encode()
+
+
+async def _stream(broker: RoomEventBroker, last_event_id: Optional[str]) -> AsyncIterator[bytes]:
+    seq = broker.parse_event_id(last_event_id)
+    yield f"retry: {RETRY_MS}\n\n".encode()
+    if seq is None:
+        seq = broker.last_seq
+        if last_event_id:
+            yield _reset_frame(broker)
+    # Runs until the client disconnects: the next write then fails and Starlette cancels the stream
+    while True:
+        frames = broker.frames_after(seq)
+        if frames is None:
+            # Fell behind the replay buffer: the client must re-read the rooms
+            seq = broker.last_seq
+            yield _reset_frame(broker)
+        elif frames:
+            seq = frames[-1][0]
+            yield b"".join(frame for _, frame in frames)
+        else:
+            await broker.wait(seq, KEEPALIVE_SECONDS)
+            if seq == broker.last_seq:
+                yield b": keepalive\n\n"
+
+
+def room_events_response(request: Request, broker: RoomEventBroker = room_event_broker) -> StreamingResponse:
+    return StreamingResponse(
+        _stream(broker, request.headers.get("last-event-id")),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
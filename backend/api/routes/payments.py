@@ -1,7 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
-from src.shared.infra.db import get_session
+from src.shared.infra.db import get_read_session, get_session
+from api.pagination import NEXT_CURSOR_HEADER, encode_cursor, decode_id_cursor
+from api.streaming import ndjson_response, wants_ndjson
 from api.schemas import PaymentOut, PaymentIn
+from api.serialization import fast_serialization, json_response, payment_dict
 from src.payments.application.list_payment import ListPaymentsUseCase
 from src.payments.application.create_payment import CreatePaymentUseCase
 from src.payments.infra.payment_repository_psql import PaymentRepositoryPsql
@@ -12,10 +16,28 @@ from src.reservations.infra.reservation_repository_psql import ReservationReposi
 router = APIRouter()
 
 @router.get("/payments", response_model=list[PaymentOut])
-def list_payments(session: Session = Depends(get_session)):
+def list_payments(
+    request: Request,
+    response: Response,
+    limit: int = Query(100, gt=0, le=100),
+    cursor: Optional[str] = None,
+    session: Session = Depends(get_read_session),
+):
+    if wants_ndjson(request):
+        # Full export: every payment, streamed in chunks; limit/cursor do not apply
+        return ndjson_response(
+            lambda stream_session: PaymentRepositoryPsql(stream_session).iter_all(),
+            lambda p: {"id": p.id, "reservation_id": p.reservation_id, "amount": float(p.amount)},
+        )
+    after_id = decode_id_cursor(cursor)
     payment_repo = PaymentRepositoryPsql(session)
     use_case = ListPaymentsUseCase(payment_repo)
-    data = use_case.execute()
+    data = use_case.execute(limit=limit + 1, after_id=after_id)
+    if len(data) > limit:
+        data = data[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(data[-1].id)
+    if fast_serialization:
+        return json_response([payment_dict(p) for p in data], headers=response.headers)
     return [PaymentOut(id=p.id, reservation_id=p.reservation_id, amount=float(p.amount)) for p in data]
 
 @router.post("/payments", response_model=PaymentOut, status_code=201)
@@ -35,5 +57,7 @@ def create_payment(payload: PaymentIn, session: Session = Depends(get_session)):
             raise HTTPException(status_code=400, detail="Reservation is not active")
         if "Payment already exists" in msg:
             raise HTTPException(status_code=409, detail="Payment already exists for this reservation")
+        if "Payment with this id already exists" in msg:
+            raise HTTPException(status_code=409, detail="Payment with this id already exists")
         raise HTTPException(status_code=422, detail=msg)
     return PaymentOut(id=created.id, reservation_id=created.reservation_id, amount=float(created.amount))
\ No newline at end of file
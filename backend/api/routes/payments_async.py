@@ -0,0 +1,59 @@
+from typing import Optional
+from decimal import Decimal
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.shared.infra.db import get_async_read_session, get_async_session
+from api.pagination import NEXT_CURSOR_HEADER, encode_cursor, decode_id_cursor
+from api.streaming import ndjson_response_async, wants_ndjson
+from api.schemas import PaymentOut, PaymentIn
+from api.serialization import fast_serialization, json_response, payment_dict
+from src.payments.application.list_payment import ListPaymentsUseCaseAsync
+from src.payments.application.create_payment import CreatePaymentUseCaseAsync
+from src.payments.infra.payment_repository_psql_async import PaymentRepositoryPsqlAsync
+from src.payments.domain.payment import Payment
+from src.reservations.infra.reservation_repository_psql_async import ReservationRepositoryPsqlAsync
+
+router = APIRouter()
+
+@router.get("/payments", response_model=list[PaymentOut])
+async def list_payments(
+    request: Request,
+    response: Response,
+    limit: int = Query(100, gt=0, le=100),
+    cursor: Optional[str] = None,
+    session: AsyncSession = Depends(get_async_read_session),
+):
+    if wants_ndjson(request):
+        return ndjson_response_async(
+            lambda stream_session: PaymentRepositoryPsqlAsync(stream_session).iter_all(),
+            lambda p: {"id": p.id, "reservation_id": p.reservation_id, "amount": float(p.amount)},
+        )
+    after_id = decode_id_cursor(cursor)
+    use_case = ListPaymentsUseCaseAsync(PaymentRepositoryPsqlAsync(session))
+    data = await use_case.execute(limit=limit + 1, after_id=after_id)
+    if len(data) > limit:
+        data = data[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(data[-1].id)
+    if fast_serialization:
+        return json_response([payment_dict(p) for p in data], headers=response.headers)
+    return [PaymentOut(id=p.id, reservation_id=p.reservation_id, amount=float(p.amount)) for p in data]
+
+@router.post("/payments", response_model=PaymentOut, status_code=201)
+async def create_payment(payload: PaymentIn, session: AsyncSession = Depends(get_async_session)):
+    use_case = CreatePaymentUseCaseAsync(PaymentRepositoryPsqlAsync(session), ReservationRepositoryPsqlAsync(session))
+    try:
+        created = await use_case.execute(
+            Payment(id=payload.id, reservation_id=payload.reservation_id, amount=Decimal(str(payload.amount)))
+        )
+    except ValueError as e:
+        msg = str(e)
+        if "Reservation does not exist" in msg:
+            raise HTTPException(status_code=404, detail="Reservation does not exist")
+        if "Reservation is not active" in msg:
+            raise HTTPException(status_code=400, detail="Reservation is not active")
+        if "Payment already exists" in msg:
+            raise HTTPException(status_code=409, detail="Payment already exists for this reservation")
+        if "Payment with this id already exists" in msg:
+            raise HTTPException(status_code=409, detail="Payment with this id already exists")
+        raise HTTPException(status_code=422, detail=msg)
+    return PaymentOut(id=created.id, reservation_id=created.reservation_id, amount=float(created.amount))
@@ -0,0 +1,64 @@
+from datetime import date
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from api.streaming import csv_response
+from api.schemas import OccupancyDayOut, OccupancyReportOut
+from src.reports.application.occupancy_report import OccupancyReportUseCase
+from src.reports.domain.occupancy import DayOccupancy
+from src.reports.infra.occupancy_repository_psql import OccupancyRepositoryPsql
+from src.reports.infra.reconciliation_export import csv_chunks
+from src.reports.infra.reconciliation_repository_psql import ReconciliationRepositoryPsql
+from src.shared.infra.db import get_read_session
+
+router = APIRouter()
+
+
+def _report_out(date_from: date, date_to: date, days: List[DayOccupancy]) -> OccupancyReportOut:
+    total_rooms = days[0].total_rooms if days else 0
+    occupied = sum(d.occupied_rooms for d in days)
+    available = total_rooms * len(days)
+    return OccupancyReportOut(
+        date_from=date_from,
+        date_to=date_to,
+        total_rooms=total_rooms,
+        occupied_room_nights=occupied,
+        occupancy_rate=round(occupied / available, 4) if available else 0.0,
+        days=[
+            OccupancyDayOut(day=d.day, occupied_rooms=d.occupied_rooms, occupancy_rate=round(d.occupancy_rate, 4))
+            for d in days
+        ],
+    )
+
+
+@router.get("/reports/occupancy", response_model=OccupancyReportOut)
+def occupancy_report(
+    date_from: date = Query(..., alias="from"),
+    date_to: date = Query(..., alias="to"),
+    session: Session = Depends(get_read_session),
+):
+    usecase = OccupancyReportUseCase(OccupancyRepositoryPsql(session))
+    try:
+        days = usecase.execute(date_from, date_to)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    return _report_out(date_from, date_to, days)
+
+
+# Reservations joined with their payment (CSV, streamed in chunks): finance reconciliation
+@router.get("/reports/reconciliation", response_class=StreamingResponse)
+def reconciliation_export(
+    date_from: Optional[date] = Query(None, alias="from"),
+    date_to: Optional[date] = Query(None, alias="to"),
+    status: Optional[str] = None,
+):
+    if date_from is not None and date_to is not None and date_from > date_to:
+        raise HTTPException(status_code=422, detail="from must be less than or equal to to")
+    return csv_response(
+        lambda stream_session: csv_chunks(
+            ReconciliationRepositoryPsql(stream_session).iter_rows(date_from, date_to, status)
+        ),
+        "reconciliation.csv",
+    )
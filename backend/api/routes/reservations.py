@@ -1,12 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import date
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
-from src.shared.infra.db import get_session
-from api.schemas import ReservationOut, ReservationIn
+from src.shared.infra.db import get_read_session, get_session
+from api.pagination import NEXT_CURSOR_HEADER, encode_cursor, decode_id_cursor, decode_start_date_cursor
+from api.streaming import ndjson_response, wants_ndjson
+from api.schemas import ReservationBatchIn, ReservationBatchItemOut, ReservationBatchOut, ReservationOut, ReservationIn
+from api.serialization import fast_serialization, json_response, reservation_dict
 from src.rooms.infra.room_repository_psql import RoomRepositoryPsql
 from src.rooms.application.room_service import RoomService
 from src.reservations.application.create_reservation import CreateReservationUseCase
-from src.reservations.application.cancel_reservation import CancelReservationUseCase
+from src.reservations.application.create_reservation_batch import BatchItemResult, CreateReservationBatchUseCase
+from src.reservations.application.cancel_reservation import CancelReservationUseCase, CancelRoomReservationsUseCase
 from src.reservations.application.get_reservation import GetReservationUseCase
+from src.reservations.application.availability_index import availability_index
 from src.reservations.infra.reservation_repository_psql import ReservationRepositoryPsql
 from src.reservations.domain.reservation import Reservation
 
@@ -17,7 +24,7 @@ def create_reservation(payload: ReservationIn, session: Session = Depends(get_se
     reservation_repo = ReservationRepositoryPsql(session)
     room_repo = RoomRepositoryPsql(session)
     room_service = RoomService(room_repo)
-    use_case = CreateReservationUseCase(reservation_repo, room_service)
+    use_case = CreateReservationUseCase(reservation_repo, room_service, availability_index=availability_index)
 
     reservation = Reservation(
         id=payload.id,
@@ -35,6 +42,8 @@ def create_reservation(payload: ReservationIn, session: Session = Depends(get_se
             raise HTTPException(status_code=404, detail="Room does not exist")
         if "Reservation with this id already exists" in msg:
             raise HTTPException(status_code=409, detail="Reservation with this id already exists")
+        if "overlap" in msg:
+            raise HTTPException(status_code=409, detail=msg)
         raise HTTPException(status_code=422, detail=msg)
     return ReservationOut(
         id=created.id,
@@ -45,6 +54,43 @@ def create_reservation(payload: ReservationIn, session: Session = Depends(get_se
         status=created.status,
     )
 
+def _batch_item_out(result: BatchItemResult) -> ReservationBatchItemOut:
+    # Same status codes POST /reservations would have answered for this item alone
+    if result.error is None:
+        return ReservationBatchItemOut(id=result.id, status_code=201, reservation=ReservationOut(
+            id=result.reservation.id,
+            room_id=result.reservation.room_id,
+            guest_email=result.reservation.guest_email,
+            start_date=result.reservation.start_date,
+            end_date=result.reservation.end_date,
+            status=result.reservation.status,
+        ))
+    if "room does not exist" in result.error:
+        status_code = 404
+    elif "already exists" in result.error or "overlap" in result.error:
+        status_code = 409
+    else:
+        status_code = 422
+    return ReservationBatchItemOut(id=result.id, status_code=status_code, error=result.error)
+
+@router.post("/reservations/batch", response_model=ReservationBatchOut)
+def create_reservations_batch(payload: ReservationBatchIn, session: Session = Depends(get_session)):
+    use_case = CreateReservationBatchUseCase(ReservationRepositoryPsql(session), RoomService(RoomRepositoryPsql(session)))
+    results = use_case.execute([
+        Reservation(
+            id=item.id,
+            room_id=item.room_id,
+            guest_email=item.guest_email,
+            start_date=item.start_date,
+            end_date=item.end_date,
+            status="active",
+        )
+        for item in payload.reservations
+    ])
+    items = [_batch_item_out(result) for result in results]
+    created = sum(1 for item in items if item.error is None)
+    return ReservationBatchOut(created=created, failed=len(items) - created, results=items)
+
 @router.post("/reservations/{reservation_id}/cancel", response_model=ReservationOut)
 def cancel_reservation(reservation_id: str, session: Session = Depends(get_session)):
     reservation_repo = ReservationRepositoryPsql(session)
@@ -88,9 +134,34 @@ def get_reservation(reservation_id: str, session: Session = Depends(get_session)
     )
 
 @router.get("/reservations", response_model=list[ReservationOut])
-def list_reservations(session: Session = Depends(get_session)):
+def list_reservations(
+    request: Request,
+    response: Response,
+    limit: int = Query(100, gt=0, le=100),
+    cursor: Optional[str] = None,
+    session: Session = Depends(get_read_session),
+):
+    if wants_ndjson(request):
+        # Full export: every reservation, streamed in chunks; limit/cursor do not apply
+        return ndjson_response(
+            lambda stream_session: ReservationRepositoryPsql(stream_session).iter_all(),
+            lambda r: {
+                "id": r.id,
+                "room_id": r.room_id,
+                "guest_email": r.guest_email,
+                "start_date": r.start_date,
+                "end_date": r.end_date,
+                "status": r.status,
+            },
+        )
+    after_id = decode_id_cursor(cursor)
     reservation_repo = ReservationRepositoryPsql(session)
-    rows = reservation_repo.get_all()
+    rows = reservation_repo.get_page(limit + 1, after_id=after_id)
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(rows[-1].id)
+    if fast_serialization:
+        return json_response([reservation_dict(r) for r in rows], headers=response.headers)
     return [
         ReservationOut(
             id=r.id,
@@ -104,10 +175,30 @@ def list_reservations(session: Session = Depends(get_session)):
     ]
 
 @router.get("/rooms/{room_id}/reservations", response_model=list[ReservationOut])
-def list_reservations_by_room(room_id: str, session: Session = Depends(get_session)):
+def list_reservations_by_room(
+    room_id: str,
+    response: Response,
+    status: str = "active",
+    date_from: Optional[date] = Query(None, alias="from"),
+    date_to: Optional[date] = Query(None, alias="to"),
+    limit: int = Query(100, gt=0, le=500),
+    cursor: Optional[str] = None,
+    session: Session = Depends(get_session),
+):
     reservation_repo = ReservationRepositoryPsql(session)
-    rows = reservation_repo.get_all()
-    filtered = [r for r in rows if r.room_id == room_id and r.status == "active"]
+    rows = reservation_repo.get_by_room(
+        room_id,
+        status=status,
+        date_from=date_from,
+        date_to=date_to,
+        limit=limit + 1,
+        after=decode_start_date_cursor(cursor),
+    )
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(rows[-1].start_date, rows[-1].id)
+    if fast_serialization:
+        return json_response([reservation_dict(r) for r in rows], headers=response.headers)
     return [
         ReservationOut(
             id=r.id,
@@ -117,5 +208,72 @@ def list_reservations_by_room(room_id: str, session: Session = Depends(get_sessi
             end_date=r.end_date,
             status=r.status,
         )
-        for r in filtered
-    ]
\ No newline at end of file
+        for r in rows
+    ]
+
+@router.get("/guests/{guest_email}/reservations", response_model=list[ReservationOut])
+def list_guest_reservations(
+    guest_email: str,
+    response: Response,
+    status: Optional[str] = None,
+    date_from: Optional[date] = Query(None, alias="from"),
+    date_to: Optional[date] = Query(None, alias="to"),
+    limit: int = Query(100, gt=0, le=100),
+    cursor: Optional[str] = None,
+    session: Session = Depends(get_read_session),
+):
+    if date_from is not None and date_to is not None and date_from > date_to:
+        raise HTTPException(status_code=422, detail="from must be less than or equal to to")
+    rows = ReservationRepositoryPsql(session).get_by_guest(
+        guest_email,
+        status=status,
+        date_from=date_from,
+        date_to=date_to,
+        limit=limit + 1,
+        after=decode_start_date_cursor(cursor),
+    )
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(rows[-1].start_date, rows[-1].id)
+    if fast_serialization:
+        return json_response([reservation_dict(r) for r in rows], headers=response.headers)
+    return [
+        ReservationOut(
+            id=r.id,
+            room_id=r.room_id,
+            guest_email=r.guest_email,
+            start_date=r.start_date,
+            end_date=r.end_date,
+            status=r.status,
+        )
+        for r in rows
+    ]
+
+@router.post("/rooms/{room_id}/reservations/cancel", response_model=list[ReservationOut])
+def cancel_room_reservations(
+    room_id: str,
+    date_from: date = Query(..., alias="from"),
+    date_to: date = Query(..., alias="to"),
+    session: Session = Depends(get_session),
+):
+    use_case = CancelRoomReservationsUseCase(ReservationRepositoryPsql(session), RoomService(RoomRepositoryPsql(session)))
+    try:
+        cancelled = use_case.execute(room_id, date_from, date_to)
+    except ValueError as e:
+        msg = str(e)
+        if "room does not exist" in msg:
+            raise HTTPException(status_code=404, detail="Room does not exist")
+        raise HTTPException(status_code=422, detail=msg)
+    if fast_serialization:
+        return json_response([reservation_dict(r) for r in cancelled])
+    return [
+        ReservationOut(
+            id=r.id,
+            room_id=r.room_id,
+            guest_email=r.guest_email,
+            start_date=r.start_date,
+            end_date=r.end_date,
+            status=r.status,
+        )
+        for r in cancelled
+    ]
@@ -0,0 +1,219 @@
+from datetime import date
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.shared.infra.db import get_async_read_session, get_async_session
+from api.pagination import NEXT_CURSOR_HEADER, encode_cursor, decode_id_cursor, decode_start_date_cursor
+from api.streaming import ndjson_response_async, wants_ndjson
+from api.schemas import ReservationBatchIn, ReservationBatchItemOut, ReservationBatchOut, ReservationOut, ReservationIn
+from api.serialization import fast_serialization, json_response, reservation_dict
+from src.rooms.infra.room_repository_psql_async import RoomRepositoryPsqlAsync
+from src.rooms.application.room_service import RoomServiceAsync
+from src.reservations.application.create_reservation import CreateReservationUseCaseAsync
+from src.reservations.application.create_reservation_batch import BatchItemResult, CreateReservationBatchUseCaseAsync
+from src.reservations.application.cancel_reservation import CancelReservationUseCaseAsync, CancelRoomReservationsUseCaseAsync
+from src.reservations.application.get_reservation import GetReservationUseCaseAsync
+from src.reservations.application.availability_index import availability_index
+from src.reservations.infra.reservation_repository_psql_async import ReservationRepositoryPsqlAsync
+from src.reservations.domain.reservation import Reservation
+
+router = APIRouter()
+
+def _to_out(r: Reservation) -> ReservationOut:
+    return ReservationOut(
+        id=r.id,
+        room_id=r.room_id,
+        guest_email=r.guest_email,
+        start_date=r.start_date,
+        end_date=r.end_date,
+        status=r.status,
+    )
+
+@router.post("/reservations", response_model=ReservationOut, status_code=201)
+async def create_reservation(payload: ReservationIn, session: AsyncSession = Depends(get_async_session)):
+    reservation_repo = ReservationRepositoryPsqlAsync(session)
+    room_service = RoomServiceAsync(RoomRepositoryPsqlAsync(session))
+    use_case = CreateReservationUseCaseAsync(reservation_repo, room_service, availability_index=availability_index)
+
+    reservation = Reservation(
+        id=payload.id,
+        room_id=payload.room_id,
+        guest_email=payload.guest_email,
+        start_date=payload.start_date,
+        end_date=payload.end_date,
+        status="active",
+    )
+    try:
+        created = await use_case.execute(reservation)
+    except ValueError as e:
+        msg = str(e)
+        if "room does not exist" in msg:
+            raise HTTPException(status_code=404, detail="Room does not exist")
+        if "Reservation with this id already exists" in msg:
+            raise HTTPException(status_code=409, detail="Reservation with this id already exists")
+        if "overlap" in msg:
+            raise HTTPException(status_code=409, detail=msg)
+        raise HTTPException(status_code=422, detail=msg)
+    return _to_out(created)
+
+def _batch_item_out(result: BatchItemResult) -> ReservationBatchItemOut:
+    # Same status codes POST /reservations would have answered for this item alone
+    if result.error is None:
+        return ReservationBatchItemOut(id=result.id, status_code=201, reservation=_to_out(result.reservation))
+    if "room does not exist" in result.error:
+        status_code = 404
+    elif "already exists" in result.error or "overlap" in result.error:
+        status_code = 409
+    else:
+        status_code = 422
+    return ReservationBatchItemOut(id=result.id, status_code=status_code, error=result.error)
+
+@router.post("/reservations/batch", response_model=ReservationBatchOut)
+async def create_reservations_batch(payload: ReservationBatchIn, session: AsyncSession = Depends(get_async_session)):
+    use_case = CreateReservationBatchUseCaseAsync(
+        ReservationRepositoryPsqlAsync(session), RoomServiceAsync(RoomRepositoryPsqlAsync(session))
+    )
+    results = await use_case.execute([
+        Reservation(
+            id=item.id,
+            room_id=item.room_id,
+            guest_email=item.guest_email,
+            start_date=item.start_date,
+            end_date=item.end_date,
+            status="active",
+        )
+        for item in payload.reservations
+    ])
+    items = [_batch_item_out(result) for result in results]
+    created = sum(1 for item in items if item.error is None)
+    return ReservationBatchOut(created=created, failed=len(items) - created, results=items)
+
+@router.post("/reservations/{reservation_id}/cancel", response_model=ReservationOut)
+async def cancel_reservation(reservation_id: str, session: AsyncSession = Depends(get_async_session)):
+    use_case = CancelReservationUseCaseAsync(ReservationRepositoryPsqlAsync(session))
+    try:
+        updated = await use_case.execute(reservation_id)
+    except ValueError as e:
+        msg = str(e)
+        if "reservation not found" in msg:
+            raise HTTPException(status_code=404, detail="Reservation not found")
+        if "reservation is not active" in msg:
+            raise HTTPException(status_code=409, detail="Reservation is not active")
+        raise HTTPException(status_code=422, detail=msg)
+    return _to_out(updated)
+
+@router.get("/reservations/{reservation_id}", response_model=ReservationOut)
+async def get_reservation(reservation_id: str, session: AsyncSession = Depends(get_async_session)):
+    use_case = GetReservationUseCaseAsync(ReservationRepositoryPsqlAsync(session))
+    try:
+        r = await use_case.execute(reservation_id)
+    except ValueError as e:
+        msg = str(e)
+        if "reservation not found" in msg:
+            raise HTTPException(status_code=404, detail="Reservation not found")
+        raise HTTPException(status_code=422, detail=msg)
+    return _to_out(r)
+
+@router.get("/reservations", response_model=list[ReservationOut])
+async def list_reservations(
+    request: Request,
+    response: Response,
+    limit: int = Query(100, gt=0, le=100),
+    cursor: Optional[str] = None,
+    session: AsyncSession = Depends(get_async_read_session),
+):
+    if wants_ndjson(request):
+        return ndjson_response_async(
+            lambda stream_session: ReservationRepositoryPsqlAsync(stream_session).iter_all(),
+            lambda r: {
+                "id": r.id,
+                "room_id": r.room_id,
+                "guest_email": r.guest_email,
+                "start_date": r.start_date,
+                "end_date": r.end_date,
+                "status": r.status,
+            },
+        )
+    after_id = decode_id_cursor(cursor)
+    rows = await ReservationRepositoryPsqlAsync(session).get_page(limit + 1, after_id=after_id)
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(rows[-1].id)
+    if fast_serialization:
+        return json_response([reservation_dict(r) for r in rows], headers=response.headers)
+    return [_to_out(r) for r in rows]
+
+@router.get("/rooms/{room_id}/reservations", response_model=list[ReservationOut])
+async def list_reservations_by_room(
+    room_id: str,
+    response: Response,
+    status: str = "active",
+    date_from: Optional[date] = Query(None, alias="from"),
+    date_to: Optional[date] = Query(None, alias="to"),
+    limit: int = Query(100, gt=0, le=500),
+    cursor: Optional[str] = None,
+    session: AsyncSession = Depends(get_async_session),
+):
+    rows = await ReservationRepositoryPsqlAsync(session).get_by_room(
+        room_id,
+        status=status,
+        date_from=date_from,
+        date_to=date_to,
+        limit=limit + 1,
+        after=decode_start_date_cursor(cursor),
+    )
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(rows[-1].start_date, rows[-1].id)
+    if fast_serialization:
+        return json_response([reservation_dict(r) for r in rows], headers=response.headers)
+    return [_to_out(r) for r in rows]
+
+@router.get("/guests/{guest_email}/reservations", response_model=list[ReservationOut])
+async def list_guest_reservations(
+    guest_email: str,
+    response: Response,
+    status: Optional[str] = None,
+    date_from: Optional[date] = Query(None, alias="from"),
+    date_to: Optional[date] = Query(None, alias="to"),
+    limit: int = Query(100, gt=0, le=100),
+    cursor: Optional[str] = None,
+    session: AsyncSession = Depends(get_async_read_session),
+):
+    if date_from is not None and date_to is not None and date_from > date_to:
+        raise HTTPException(status_code=422, detail="from must be less than or equal to to")
+    rows = await ReservationRepositoryPsqlAsync(session).get_by_guest(
+        guest_email,
+        status=status,
+        date_from=date_from,
+        date_to=date_to,
+        limit=limit + 1,
+        after=decode_start_date_cursor(cursor),
+    )
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(rows[-1].start_date, rows[-1].id)
+    if fast_serialization:
+        return json_response([reservation_dict(r) for r in rows], headers=response.headers)
+    return [_to_out(r) for r in rows]
+
+@router.post("/rooms/{room_id}/reservations/cancel", response_model=list[ReservationOut])
+async def cancel_room_reservations(
+    room_id: str,
+    date_from: date = Query(..., alias="from"),
+    date_to: date = Query(..., alias="to"),
+    session: AsyncSession = Depends(get_async_session),
+):
+    use_case = CancelRoomReservationsUseCaseAsync(
+        ReservationRepositoryPsqlAsync(session), RoomServiceAsync(RoomRepositoryPsqlAsync(session))
+    )
+    try:
+        cancelled = await use_case.execute(room_id, date_from, date_to)
+    except ValueError as e:
+        msg = str(e)
+        if "room does not exist" in msg:
+            raise HTTPException(status_code=404, detail="Room does not exist")
+        raise HTTPException(status_code=422, detail=msg)
+    if fast_serialization:
+        return json_response([reservation_dict(r) for r in cancelled])
+    return [_to_out(r) for r in cancelled]
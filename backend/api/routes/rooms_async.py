@@ -0,0 +1,103 @@
+from datetime import date
+from decimal import Decimal
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+
+from api.room_cache import ROOMS_KEY, cache_enabled, cached_response, get_async_room_session, room_key, store_response
+from api.room_events import room_events_response
+from api.schemas import AvailableRoomOut, RoomOut, ReservationRangeOut
+from api.serialization import available_room_dict, dumps, fast_serialization, json_response, room_dict
+from src.rooms.application.list_room import ListRoomsUseCaseAsync
+from src.rooms.application.search_available_rooms import SearchAvailableRoomsUseCaseAsync
+from src.rooms.infra.room_repository_psql_async import RoomRepositoryPsqlAsync
+from src.shared.infra.db import get_async_session
+
+router = APIRouter()
+
+# Render the bytes FastAPI would produce for the response_model, so they can be cached
+_rooms_json = TypeAdapter(List[RoomOut])
+_room_json = TypeAdapter(RoomOut)
+
+@router.get("/rooms", response_model=List[RoomOut])
+async def list_rooms(request: Request, session: AsyncSession = Depends(get_async_room_session)):
+    repo = RoomRepositoryPsqlAsync(session)
+    # Read before the rooms: a booking committed in between only costs the next read a miss
+    version = await repo.get_version() if cache_enabled() else 0
+    cached = cached_response(request, ROOMS_KEY, version)
+    if cached is not None:
+        return cached
+    usecase = ListRoomsUseCaseAsync(repo)
+    rooms = await usecase.execute()
+    if fast_serialization:
+        body = dumps([room_dict(room) for room in rooms])
+    else:
+        body = _rooms_json.dump_json([
+            RoomOut(
+                id=room.id,
+                name=room.name,
+                price_per_night=float(room.price_per_night),
+                reservation_ranges=[
+                    ReservationRangeOut(start_date=br.start_date, end_date=br.end_date)
+                    for br in room.reservation_ranges
+                ],
+            )
+            for room in rooms
+        ], by_alias=True)
+    return store_response(request, ROOMS_KEY, body, version)
+
+@router.get("/rooms/available", response_model=List[AvailableRoomOut])
+async def list_available_rooms(
+    date_from: date = Query(..., alias="from"),
+    date_to: date = Query(..., alias="to"),
+    min_price: Optional[float] = Query(None, ge=0),
+    max_price: Optional[float] = Query(None, ge=0),
+    session: AsyncSession = Depends(get_async_session),
+):
+    usecase = SearchAvailableRoomsUseCaseAsync(RoomRepositoryPsqlAsync(session))
+    try:
+        rooms = await usecase.execute(
+            date_from,
+            date_to,
+            min_price=Decimal(str(min_price)) if min_price is not None else None,
+            max_price=Decimal(str(max_price)) if max_price is not None else None,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    if fast_serialization:
+        return json_response([available_room_dict(room) for room in rooms])
+    return [
+        AvailableRoomOut(id=room.id, name=room.name, price_per_night=float(room.price_per_night))
+        for room in rooms
+    ]
+
+@router.get("/rooms/events", response_class=StreamingResponse)
+async def room_events(request: Request):
+    # Declared before /rooms/{room_id}; replaces polling GET /rooms for calendar updates
+    return room_events_response(request)
+
+@router.get("/rooms/{room_id}", response_model=RoomOut)
+async def get_room(room_id: str, request: Request, session: AsyncSession = Depends(get_async_room_session)):
+    repo = RoomRepositoryPsqlAsync(session)
+    version = await repo.get_version(room_id) if cache_enabled() else 0
+    cached = cached_response(request, room_key(room_id), version)
+    if cached is not None:
+        return cached
+    room = await repo.get_by_id(room_id)
+    if not room:
+        raise HTTPException(status_code=404, detail="Room not found")
+    if fast_serialization:
+        body = dumps(room_dict(room))
+    else:
+        body = _room_json.dump_json(RoomOut(
+            id=room.id,
+            name=room.name,
+            price_per_night=float(room.price_per_night),
+            reservation_ranges=[
+                ReservationRangeOut(start_date=br.start_date, end_date=br.end_date)
+                for br in room.reservation_ranges
+            ],
+        ), by_alias=True)
+    return store_response(request, room_key(room_id), body, version)
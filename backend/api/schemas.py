@@ -1,5 +1,6 @@
 from pydantic import BaseModel, Field, ConfigDict
 from datetime import date
+from typing import Optional
 
 class ReservationRangeOut(BaseModel):
     start_date: date = Field(..., alias="from")
@@ -12,6 +13,11 @@ class RoomOut(BaseModel):
     price_per_night: float
     reservation_ranges: list[ReservationRangeOut]
 
+class AvailableRoomOut(BaseModel):
+    id: str
+    name: str
+    price_per_night: float
+
 class ReservationIn(BaseModel):
     id: str
     room_id: str
@@ -27,6 +33,20 @@ class ReservationOut(BaseModel):
     end_date: date
     status: str
 
+class ReservationBatchIn(BaseModel):
+    reservations: list[ReservationIn] = Field(..., min_length=1, max_length=1000)
+
+class ReservationBatchItemOut(BaseModel):
+    id: str
+    status_code: int
+    reservation: Optional[ReservationOut] = None
+    error: Optional[str] = None
+
+class ReservationBatchOut(BaseModel):
+    created: int
+    failed: int
+    results: list[ReservationBatchItemOut]
+
 class PaymentOut(BaseModel):
     id: str
     reservation_id: str
@@ -35,4 +55,20 @@ class PaymentOut(BaseModel):
 class PaymentIn(BaseModel):
     id: str
     reservation_id: str
-    amount: float
\ No newline at end of file
+    amount: float
+
+
+class OccupancyDayOut(BaseModel):
+    day: date = Field(..., alias="date")
+    occupied_rooms: int
+    occupancy_rate: float
+    model_config = ConfigDict(populate_by_name=True)
+
+class OccupancyReportOut(BaseModel):
+    date_from: date = Field(..., alias="from")
+    date_to: date = Field(..., alias="to")
+    total_rooms: int
+    occupied_room_nights: int
+    occupancy_rate: float
+    days: list[OccupancyDayOut]
+    model_config = ConfigDict(populate_by_name=True)
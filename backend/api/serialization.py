@@ -0,0 +1,71 @@
+"""Fast path from domain objects straight to JSON bytes (FAST_SERIALIZATION_ENABLED=1).
+
+The regular path builds RoomOut/ReservationOut/PaymentOut models and FastAPI validates
+and serializes them again against `response_model`. Here the domain dataclasses become
+plain dicts/lists encoded by orjson (stdlib json when orjson is not installed), producing
+the same wire format: compact separators, ISO dates, floats for money and the from/to
+aliases of ReservationRangeOut.
+"""
+import json
+import os
+from datetime import date
+from typing import Any, Mapping, Optional
+
+from fastapi import Response
+
+from src.payments.domain.payment import Payment
+from src.reservations.domain.reservation import Reservation
+from src.rooms.domain.room import Room
+
+try:
+    import orjson
+except ImportError:  # optional dependency: fall back to the stdlib encoder
+    orjson = None
+
+fast_serialization = os.getenv("FAST_SERIALIZATION_ENABLED", "0").lower() in ("1", "true", "yes")
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, separators=(",", ":"), ensure_ascii=False, default=_default).encode()
+
+
+def json_response(content: Any, status_code: int = 200, headers: Optional[Mapping[str, str]] = None) -> Response:
+    # A returned Response bypasses the injected `response: Response` parameter, so headers set
+    # there (e.g. X-Next-Cursor) must be passed along explicitly
+    return Response(content=dumps(content), status_code=status_code, headers=headers, media_type="application/json")
+
+
+def room_dict(room: Room) -> dict:
+    return {
+        "id": room.id,
+        "name": room.name,
+        "price_per_night": float(room.price_per_night),
+        "reservation_ranges": [{"from": r.start_date, "to": r.end_date} for r in room.reservation_ranges],
+    }
+
+
+def available_room_dict(room: Room) -> dict:
+    return {"id": room.id, "name": room.name, "price_per_night": float(room.price_per_night)}
+
+
+def reservation_dict(reservation: Reservation) -> dict:
+    return {
+        "id": reservation.id,
+        "room_id": reservation.room_id,
+        "guest_email": reservation.guest_email,
+        "start_date": reservation.start_date,
+        "end_date": reservation.end_date,
+        "status": reservation.status,
+    }
+
+
+def payment_dict(payment: Payment) -> dict:
+    return {"id": payment.id, "reservation_id": payment.reservation_id, "amount": float(payment.amount)}
@@ -0,0 +1,91 @@
+import json
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Iterable, Iterator, TypeVar
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from api.serialization import dumps, fast_serialization
+from src.shared.infra.db import AsyncReadSessionLocal, ReadSessionLocal
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+CSV_MEDIA_TYPE = "text/csv; charset=utf-8"
+
+T = TypeVar("T")
+
+
+def _encode_line(item: dict[str, Any]) -> bytes:
+    if fast_serialization:
+        return dumps(item)
+    return json.dumps(item, default=str).encode()
+
+
+def wants_ndjson(request: Request) -> bool:
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def ndjson_response(
+    rows: Callable[[Session], Iterable[T]],
+    to_dict: Callable[[T], dict[str, Any]],
+    lines_per_chunk: int = 500,
+) -> StreamingResponse:
+    """Stream rows as newline-delimited JSON while they are read from the database.
+
+    The generator owns its session (on the read replica when one is configured):
+    request-scoped dependencies may be torn down before the body has finished streaming.
+    """
+    def body() -> Iterator[bytes]:
+        with ReadSessionLocal() as session:
+            lines: list[bytes] = []
+            for item in rows(session):
+                lines.append(_encode_line(to_dict(item)))
+                if len(lines) >= lines_per_chunk:
+                    yield b"\n".join(lines) + b"\n"
+                    lines.clear()
+            if lines:
+                yield b"\n".join(lines) + b"\n"
+
+    return StreamingResponse(body(), media_type=NDJSON_MEDIA_TYPE)
+
+
+def ndjson_response_async(
+    rows: Callable[[Any], AsyncIterable[T]],
+    to_dict: Callable[[T], dict[str, Any]],
+    lines_per_chunk: int = 500,
+) -> StreamingResponse:
+    """Async counterpart of ndjson_response, reading through an AsyncSession."""
+    async def body() -> AsyncIterator[bytes]:
+        async with AsyncReadSessionLocal() as session:
+            lines: list[bytes] = []
+            async for item in rows(session):
+                lines.append(_encode_line(to_dict(item)))
+                if len(lines) >= lines_per_chunk:
+                    yield b"\n".join(lines) + b"\n"
+                    lines.clear()
+            if lines:
+                yield b"\n".join(lines) + b"\n"
+
+    return StreamingResponse(body(), media_type=NDJSON_MEDIA_TYPE)
+
+
+def _attachment(filename: str) -> dict[str, str]:
+    return {"Content-Disposition": f'attachment; filename="{filename}"'}
+
+
+def csv_response(chunks: Callable[[Session], Iterable[bytes]], filename: str) -> StreamingResponse:
+    """Stream already encoded CSV chunks as a file download; the generator owns its read session."""
+    def body() -> Iterator[bytes]:
+        with ReadSessionLocal() as session:
+            yield from chunks(session)
+
+    return StreamingResponse(body(), media_type=CSV_MEDIA_TYPE, headers=_attachment(filename))
+
+
+def csv_response_async(chunks: Callable[[Any], AsyncIterable[bytes]], filename: str) -> StreamingResponse:
+    """Async counterpart of csv_response, reading through an AsyncSession."""
+    async def body() -> AsyncIterator[bytes]:
+        async with AsyncReadSessionLocal() as session:
+            async for chunk in chunks(session):
+                yield chunk
+
+    return StreamingResponse(body(), media_type=CSV_MEDIA_TYPE, headers=_attachment(filename))
@@ -0,0 +1,115 @@
+"""Compare the sync (threadpool) and async (AsyncSession) request paths under concurrency.
+
+Usage (from backend/):
+    python -m benchmarks.bench_async_vs_sync --concurrency 10 50 200 --requests 2000
+    DATABASE_URL=postgresql+psycopg2://... python -m benchmarks.bench_async_vs_sync
+
+Starts one uvicorn worker per mode on the same database (a copy of hotel.db by
+default), drives it with concurrent httpx clients and reports throughput and
+p50/p99 latency per concurrency level. Sync handlers are capped by the anyio
+threadpool (40 slots by default); async handlers are not.
+"""
+import argparse
+import asyncio
+import os
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(database_url: str, async_mode: bool) -> tuple[subprocess.Popen, str]:
+    port = free_port()
+    env = dict(os.environ, DATABASE_URL=database_url, ASYNC_DB_ENABLED="1" if async_mode else "0")
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR,
+        env=env,
+        stderr=subprocess.DEVNULL,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    for _ in range(100):
+        try:
+            httpx.get(f"{base_url}/rooms", timeout=1)
+            return proc, base_url
+        except httpx.HTTPError:
+            time.sleep(0.1)
+    proc.kill()
+    raise RuntimeError("server did not start")
+
+
+async def drive(base_url: str, path: str, concurrency: int, total: int) -> dict:
+    latencies: list[float] = []
+    errors = 0
+    remaining = iter(range(total))
+
+    async def worker(client: httpx.AsyncClient) -> None:
+        nonlocal errors
+        for _ in remaining:
+            started = time.perf_counter()
+            try:
+                response = await client.get(path)
+                response.raise_for_status()
+            except httpx.HTTPError:
+                # e.g. pool checkout timeouts once concurrency exceeds what the sync path can serve
+                errors += 1
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "rps": total / elapsed,
+        "p50": statistics.median(latencies),
+        "p99": latencies[int(len(latencies) * 0.99) - 1],
+        "errors": errors,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--path", default="/rooms")
+    args = parser.parse_args()
+
+    database_url = os.getenv("DATABASE_URL")
+    if database_url is None:
+        db_path = os.path.join(tempfile.mkdtemp(), "bench.db")
+        shutil.copy(os.path.join(BACKEND_DIR, "hotel.db"), db_path)
+        database_url = f"sqlite:///{db_path}"
+
+    print(f"{'mode':<6}{'conc':>6}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'errors':>8}")
+    for async_mode in (False, True):
+        proc, base_url = start_server(database_url, async_mode)
+        try:
+            for concurrency in args.concurrency:
+                stats = asyncio.run(drive(base_url, args.path, concurrency, args.requests))
+                mode = "async" if async_mode else "sync"
+                print(
+                    f"{mode:<6}{concurrency:>6}{stats['rps']:>10.0f}"
+                    f"{stats['p50']:>10.2f}{stats['p99']:>10.2f}{stats['errors']:>8}"
+                )
+        finally:
+            proc.terminate()
+            proc.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Time AvailabilityIndex.has_overlap vs ReservationRepositoryPsql.has_overlap on the same queries.
+
+Usage (from backend/):
+    python -m benchmarks.bench_availability_index --rooms 100 --reservations 4000 --queries 5000 --seed 7
+
+The defaults book about 40 short stays per room over the year, so queries both hit and miss.
+That both answer alike is checked by tests/test_availability_index.py.
+"""
+import argparse
+import random
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.shared.infra.db import Base
+from src.reservations.domain.reservation import Reservation
+from src.reservations.application.availability_index import AvailabilityIndex
+from src.reservations.application.reservation_events import RESERVATION_CANCELLED, RESERVATION_CREATED
+from src.reservations.infra.reservation_repository_psql import ReservationRepositoryPsql
+import src.rooms.infra.room_model_psql  # noqa: F401  (registers the rooms table)
+import src.payments.infra.payment_model_psql  # noqa: F401  (registers the payments table)
+
+
+def random_range(rng: random.Random) -> tuple[date, date]:
+    start = date(2025, 1, 1) + timedelta(days=rng.randrange(365))
+    return start, start + timedelta(days=rng.randrange(0, 6))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rooms", type=int, default=100)
+    parser.add_argument("--reservations", type=int, default=4_000)
+    parser.add_argument("--queries", type=int, default=5_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    engine = create_engine("sqlite://", future=True)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine, future=True, expire_on_commit=False)()
+    repo = ReservationRepositoryPsql(session)
+    index = AvailabilityIndex(ttl_seconds=float("inf"))
+    rooms = [f"room-{i}" for i in range(args.rooms)]
+
+    # Half of the rows are loaded before the index, half arrive as events afterwards.
+    # Overlapping active rows are allowed on purpose to cover legacy data.
+    created: list[Reservation] = []
+    for i in range(args.reservations):
+        start, end = random_range(rng)
+        created.append(repo.create(Reservation(f"r{i}", rng.choice(rooms), "g@example.com", start, end)))
+        if i == args.reservations // 2:
+            for room_id in rooms:
+                index.load(room_id, repo.get_by_room(room_id), index.generation(room_id))
+        elif i > args.reservations // 2:
+            index.handle_event(RESERVATION_CREATED, created[-1])
+        if created and rng.random() < 0.2:
+            victim = rng.choice(created)
+            if victim.status == "active":
+                victim.status = "cancelled"
+                index.handle_event(RESERVATION_CANCELLED, repo.cancel(victim.id))
+
+    queries = [(rng.choice(rooms), *random_range(rng)) for _ in range(args.queries)]
+    started = time.perf_counter()
+    expected = [repo.has_overlap(room_id, start, end) for room_id, start, end in queries]
+    db_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    actual = [index.has_overlap(room_id, start, end) for room_id, start, end in queries]
+    index_seconds = time.perf_counter() - started
+
+    print(f"queries={len(queries)} overlaps={sum(expected)} index agrees: {actual == expected}")
+    print(f"has_overlap (db): {db_seconds / len(queries) * 1e6:.1f} us/query")
+    print(f"availability index: {index_seconds / len(queries) * 1e6:.1f} us/query")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""List reads: Core column selects into slotted dataclasses vs the previous ORM hydration path.
+
+Usage (from backend/):
+    python -m benchmarks.bench_core_reads --reservations 1000000
+    python -m benchmarks.bench_core_reads --database-url sqlite:////tmp/big.db --compare benchmarks/results/core_reads-<stamp>.json
+
+Loads synthetic data into a throwaway SQLite database (or uses --database-url), then lists
+every reservation and every payment, and walks keyset pages of --page-size rows the way
+GET /reservations and GET /payments do, through:
+    orm   select(Model) -> ORM instance in the identity map -> dict-backed dataclass copy
+          (payments also go through Decimal(str(amount))): the repositories before this change
+    core  ReservationRepositoryPsql / PaymentRepositoryPsql: select(*COLUMNS) -> row tuple ->
+          slotted domain dataclass
+Time is the median over --repeat runs. Memory is measured in a separate run under tracemalloc:
+the peak while listing, and what the returned list keeps alive afterwards.
+"""
+import argparse
+import gc
+import os
+import statistics
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from typing import Callable, List, Optional
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from benchmarks import results
+from src.shared.infra.db import Base
+from src.shared.infra.synthetic_data import GenerationSpec, generate
+from src.payments.infra.payment_model_psql import PaymentModel
+from src.payments.infra.payment_repository_psql import PaymentRepositoryPsql
+from src.reservations.infra.reservation_model_psql import ReservationModel
+from src.reservations.infra.reservation_repository_psql import ReservationRepositoryPsql
+import src.rooms.infra.room_model_psql  # noqa: F401  (registers the rooms table)
+
+
+# The domain classes as they were before: regular (dict-backed) dataclasses
+
+@dataclass
+class OrmReservation:
+    id: str
+    room_id: str
+    guest_email: str
+    start_date: date
+    end_date: date
+    status: str = "active"
+
+
+@dataclass
+class OrmPayment:
+    id: str
+    reservation_id: str
+    amount: Decimal
+
+
+def orm_reservation(row: ReservationModel) -> OrmReservation:
+    return OrmReservation(
+        id=row.id,
+        room_id=row.room_id,
+        guest_email=row.guest_email,
+        start_date=row.start_date,
+        end_date=row.end_date,
+        status=row.status,
+    )
+
+
+def orm_payment(row: PaymentModel) -> OrmPayment:
+    return OrmPayment(id=row.id, reservation_id=row.reservation_id, amount=Decimal(str(row.amount)))
+
+
+def orm_page(session: Session, model, to_domain, limit: int, after_id: Optional[str]) -> list:
+    stmt = select(model)
+    if after_id is not None:
+        stmt = stmt.where(model.id > after_id)
+    rows = session.execute(stmt.order_by(model.id).limit(limit)).scalars().all()
+    return [to_domain(row) for row in rows]
+
+
+def walk_pages(get_page: Callable[[int, Optional[str]], list], page_size: int, pages: int) -> int:
+    after, seen = None, 0
+    for _ in range(pages):
+        page = get_page(page_size, after)
+        if not page:
+            break
+        seen += len(page)
+        after = page[-1].id
+    return seen
+
+
+def cases(factory: sessionmaker, page_size: int, pages: int) -> dict:
+    """name -> fn(session) returning what the listing keeps alive."""
+    return {
+        "reservations list, orm": lambda s: [orm_reservation(r) for r in s.query(ReservationModel).all()],
+        "reservations list, core": lambda s: ReservationRepositoryPsql(s).get_all(),
+        "payments list, orm": lambda s: [orm_payment(p) for p in s.query(PaymentModel).all()],
+        "payments list, core": lambda s: PaymentRepositoryPsql(s).get_all(),
+        f"reservations {pages} pages, orm": lambda s: walk_pages(
+            lambda limit, after: orm_page(s, ReservationModel, orm_reservation, limit, after), page_size, pages),
+        f"reservations {pages} pages, core": lambda s: walk_pages(ReservationRepositoryPsql(s).get_page, page_size, pages),
+        f"payments {pages} pages, orm": lambda s: walk_pages(
+            lambda limit, after: orm_page(s, PaymentModel, orm_payment, limit, after), page_size, pages),
+        f"payments {pages} pages, core": lambda s: walk_pages(PaymentRepositoryPsql(s).get_page, page_size, pages),
+    }
+
+
+def timed(factory: sessionmaker, fn, repeat: int) -> List[float]:
+    samples = []
+    for _ in range(repeat):
+        with factory() as session:
+            gc.collect()
+            started = time.perf_counter()
+            kept = fn(session)
+            samples.append((time.perf_counter() - started) * 1000)
+        del kept
+    return samples
+
+
+def memory(factory: sessionmaker, fn) -> dict:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        with factory() as session:
+            kept = fn(session)
+            session.expunge_all()
+        gc.collect()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    rows = kept if isinstance(kept, int) else len(kept)
+    return {"rows": rows, "peak_mib": peak / 2**20, "retained_mib": retained / 2**20}
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reservations", type=int, default=1_000_000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--pages", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--database-url", default=None, help="existing, already populated database")
+    parser.add_argument("--out-dir", default=results.RESULTS_DIR)
+    parser.add_argument("--compare", default=None, help="earlier core_reads result file (compares p50)")
+    args = parser.parse_args()
+
+    url = args.database_url or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+    engine = create_engine(url, future=True)
+    if args.database_url is None:
+        Base.metadata.create_all(bind=engine)
+        started = time.perf_counter()
+        generate(engine, GenerationSpec(rooms=1000, reservations=args.reservations), progress=lambda _: None)
+        print(f"populated {args.reservations} reservations in {time.perf_counter() - started:.1f}s")
+    factory = sessionmaker(bind=engine, future=True)
+    with factory() as session:
+        counts = (
+            session.scalar(select(func.count()).select_from(ReservationModel)),
+            session.scalar(select(func.count()).select_from(PaymentModel)),
+        )
+    print(f"{counts[0]} reservations, {counts[1]} payments\n")
+
+    measured = {}
+    print(f"{'listing':<36}{'rows':>9}{'p50 ms':>10}{'rows/s':>12}{'peak MiB':>10}{'kept MiB':>10}")
+    for name, fn in cases(factory, args.page_size, args.pages).items():
+        stats = results.summarize(timed(factory, fn, args.repeat))
+        stats.update(memory(factory, fn))
+        stats["rows_per_s"] = stats["rows"] / (stats["p50"] / 1000) if stats["p50"] else 0.0
+        measured[name] = stats
+        print(f"{name:<36}{stats['rows']:>9}{stats['p50']:>10.0f}{stats['rows_per_s']:>12,.0f}"
+              f"{stats['peak_mib']:>10.1f}{stats['retained_mib']:>10.1f}")
+
+    print("\ncore vs orm (p50 speedup, peak memory ratio):")
+    for name in measured:
+        if name.endswith(", core"):
+            orm, core = measured[name[:-len("core")] + "orm"], measured[name]
+            print(f"  {name[:-len(', core')]:<34}{orm['p50'] / core['p50']:>6.2f}x"
+                  f"{core['peak_mib'] / orm['peak_mib'] if orm['peak_mib'] else 0:>8.2f}")
+
+    path = results.save("core_reads", measured, args.out_dir)
+    print(f"\nsaved {path}")
+    if args.compare:
+        results.compare(results.load(args.compare)["results"], measured, "p50")
+
+
+if __name__ == "__main__":
+    run()
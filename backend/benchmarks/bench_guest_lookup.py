@@ -0,0 +1,112 @@
+"""Guest reservation lookup: indexed keyset query vs scanning the whole table on the client.
+
+Usage (from backend/):
+    python -m benchmarks.bench_guest_lookup --reservations 1000000
+
+Loads synthetic data into a throwaway SQLite database (or uses --database-url), adds one
+frequent guest with --guest-reservations stays, and times ReservationRepositoryPsql.get_by_guest
+(first page, a deep keyset page, a status/date filtered page) against what support tooling
+did before: stream every reservation and filter by guest. The query plan is printed so the
+use of ix_reservations_guest_email_start_date can be checked.
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+import uuid
+from datetime import date, timedelta
+
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.orm import sessionmaker
+
+from src.shared.infra.db import Base
+from src.shared.infra.synthetic_data import GenerationSpec, generate
+from src.reservations.infra.reservation_model_psql import ReservationModel
+from src.reservations.infra.reservation_repository_psql import ReservationRepositoryPsql, by_guest_stmt
+import src.payments.infra.payment_model_psql  # noqa: F401  (registers the payments table)
+
+GUEST = "frequent.guest@example.com"
+
+
+def add_frequent_guest(engine, stays: int) -> None:
+    base = date(2025, 1, 1)
+    with engine.begin() as conn:
+        conn.execute(insert(ReservationModel), [
+            {
+                "id": str(uuid.uuid4()),
+                "room_id": f"frequent-room-{i % 7}",
+                "guest_email": GUEST,
+                "start_date": base + timedelta(days=3 * i),
+                "end_date": base + timedelta(days=3 * i + 1),
+                "status": "cancelled" if i % 5 == 0 else "active",
+            }
+            for i in range(stays)
+        ])
+
+
+def time_call(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reservations", type=int, default=1_000_000)
+    parser.add_argument("--guest-reservations", type=int, default=1000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--database-url", default=None, help="existing, already populated database")
+    args = parser.parse_args()
+
+    url = args.database_url or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+    engine = create_engine(url, future=True)
+    if args.database_url is None:
+        Base.metadata.create_all(bind=engine)
+        started = time.perf_counter()
+        generate(engine, GenerationSpec(rooms=1000, reservations=args.reservations, payment_ratio=0), progress=lambda _: None)
+        print(f"populated {args.reservations} reservations in {time.perf_counter() - started:.1f}s")
+    add_frequent_guest(engine, args.guest_reservations)
+
+    session = sessionmaker(bind=engine, future=True)()
+    repo = ReservationRepositoryPsql(session)
+    pages = []
+    after = None
+    while True:
+        page = repo.get_by_guest(GUEST, limit=args.page_size, after=after)
+        if not page:
+            break
+        pages.append(after)
+        after = (page[-1].start_date, page[-1].id)
+    deep = pages[-1]
+
+    stmt = by_guest_stmt(GUEST, limit=args.page_size, after=deep)
+    compiled = stmt.compile(engine, compile_kwargs={"literal_binds": True})
+    explain = "EXPLAIN QUERY PLAN " if engine.dialect.name == "sqlite" else "EXPLAIN "
+    with engine.connect() as conn:
+        print("\nplan (deep page):")
+        for row in conn.execute(text(explain + str(compiled))):
+            print("  ", row[-1])
+
+    cases = [
+        ("first page", lambda: repo.get_by_guest(GUEST, limit=args.page_size)),
+        (f"deep page ({len(pages)})", lambda: repo.get_by_guest(GUEST, limit=args.page_size, after=deep)),
+        ("active, 2025-06..2025-12", lambda: repo.get_by_guest(
+            GUEST, status="active", date_from=date(2025, 6, 1), date_to=date(2025, 12, 31), limit=args.page_size,
+        )),
+        ("unknown guest", lambda: repo.get_by_guest("nobody@example.com", limit=args.page_size)),
+    ]
+    print(f"\n{'lookup':<28}{'median ms':>11}")
+    for name, fn in cases:
+        print(f"{name:<28}{time_call(fn, args.repeat):>11.2f}")
+        session.expunge_all()
+    scan = time_call(lambda: [r for r in repo.iter_all(10_000) if r.guest_email == GUEST], 1)
+    print(f"{'client-side filter (scan)':<28}{scan:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
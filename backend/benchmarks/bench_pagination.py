@@ -0,0 +1,97 @@
+"""Keyset vs OFFSET page latency on a large reservations/payments table.
+
+Usage (from backend/):
+    python -m benchmarks.bench_pagination --rows 1000000
+
+Builds a throwaway SQLite database (or uses --database-url) and times fetching one
+page at increasing depths. Keyset latency should stay flat; OFFSET grows with depth.
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+import uuid
+from datetime import date, timedelta
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from src.shared.infra.db import Base
+from src.reservations.infra.reservation_model_psql import ReservationModel
+from src.reservations.infra.reservation_repository_psql import ReservationRepositoryPsql
+from src.payments.infra.payment_model_psql import PaymentModel
+from src.payments.infra.payment_repository_psql import PaymentRepositoryPsql
+
+
+def populate(engine, rows: int, batch: int = 50_000) -> None:
+    base = date(2024, 1, 1)
+    with engine.begin() as conn:
+        for offset in range(0, rows, batch):
+            reservations, payments = [], []
+            for i in range(offset, min(offset + batch, rows)):
+                rid = str(uuid.UUID(int=i * 7919 + 1))
+                start = base + timedelta(days=i % 365)
+                reservations.append({
+                    "id": rid,
+                    "room_id": f"room-{i % 1000}",
+                    "guest_email": f"guest{i}@example.com",
+                    "start_date": start,
+                    "end_date": start + timedelta(days=2),
+                    "status": "active",
+                })
+                payments.append({"id": str(uuid.UUID(int=i * 104729 + 1)), "reservation_id": rid, "amount": 100})
+            conn.execute(insert(ReservationModel), reservations)
+            conn.execute(insert(PaymentModel), payments)
+
+
+def time_call(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--database-url", default=None, help="existing, already populated database")
+    args = parser.parse_args()
+
+    url = args.database_url
+    if url is None:
+        url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+    engine = create_engine(url, future=True)
+    if args.database_url is None:
+        Base.metadata.create_all(bind=engine)
+        started = time.perf_counter()
+        populate(engine, args.rows)
+        print(f"populated {args.rows} rows in {time.perf_counter() - started:.1f}s")
+
+    session = sessionmaker(bind=engine, future=True)()
+    targets = [
+        ("reservations", ReservationRepositoryPsql(session), ReservationModel),
+        ("payments", PaymentRepositoryPsql(session), PaymentModel),
+    ]
+    depths = [0, args.rows // 100, args.rows // 10, args.rows // 2, args.rows - args.page_size]
+
+    print(f"{'table':<14}{'depth':>10}{'keyset ms':>12}{'offset ms':>12}")
+    for name, repo, model in targets:
+        ordered_ids = session.query(model.id).order_by(model.id)
+        for depth in depths:
+            after_id = ordered_ids.offset(depth - 1).limit(1).scalar() if depth else None
+            keyset = time_call(lambda: repo.get_page(args.page_size, after_id=after_id), args.repeat)
+            offset = time_call(
+                lambda: session.query(model).order_by(model.id).offset(depth).limit(args.page_size).all(),
+                args.repeat,
+            )
+            session.expunge_all()
+            print(f"{name:<14}{depth:>10}{keyset:>12.2f}{offset:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Payment creation throughput: check-then-insert (3 round trips) vs single-statement insert.
+
+Usage (from backend/):
+    python -m benchmarks.bench_payment_create --payments 5000 --threads 8
+
+Builds a throwaway SQLite database (or uses an empty --database-url schema), creates one
+active reservation per payment, then pays half of them with each strategy. Per-call network
+latency is what the single statement saves, so the gap widens on a remote PostgreSQL.
+"""
+import argparse
+import os
+import tempfile
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from decimal import Decimal
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from src.shared.infra.db import Base
+from src.payments.application.create_payment import CreatePaymentUseCase
+from src.payments.domain.payment import Payment
+from src.payments.infra.payment_repository_psql import PaymentRepositoryPsql
+from src.reservations.infra.reservation_model_psql import ReservationModel
+from src.reservations.infra.reservation_repository_psql import ReservationRepositoryPsql
+
+
+def populate(engine, count: int) -> list[str]:
+    base = date(2030, 1, 1)
+    ids = [str(uuid.UUID(int=i * 7919 + 1)) for i in range(count)]
+    with engine.begin() as conn:
+        conn.execute(insert(ReservationModel), [
+            {
+                "id": rid,
+                "room_id": f"room-{i % 500}",
+                "guest_email": f"guest{i}@example.com",
+                "start_date": base + timedelta(days=3 * (i // 500)),
+                "end_date": base + timedelta(days=3 * (i // 500) + 1),
+                "status": "active",
+            }
+            for i, rid in enumerate(ids)
+        ])
+    return ids
+
+
+def check_then_insert(session, payment: Payment) -> Payment:
+    # The previous CreatePaymentUseCase flow: three statements, race-prone without the unique index
+    reservation = ReservationRepositoryPsql(session).get_by_id(payment.reservation_id)
+    if not reservation:
+        raise ValueError("Reservation does not exist")
+    if str(reservation.status).lower() != "active":
+        raise ValueError("Reservation is not active")
+    payments = PaymentRepositoryPsql(session)
+    if payments.get_by_reservation_id(payment.reservation_id):
+        raise ValueError("Payment already exists for this reservation")
+    return payments.create(payment)
+
+
+def single_statement(session, payment: Payment) -> Payment:
+    return CreatePaymentUseCase(PaymentRepositoryPsql(session), ReservationRepositoryPsql(session)).execute(payment)
+
+
+def run(Session, create, reservation_ids: list[str], threads: int) -> float:
+    def pay(rid: str) -> None:
+        with Session() as session:
+            create(session, Payment(id=str(uuid.uuid4()), reservation_id=rid, amount=Decimal("100.00")))
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(pay, reservation_ids))
+    return len(reservation_ids) / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--payments", type=int, default=5000, help="payments per strategy")
+    parser.add_argument("--threads", type=int, default=1)
+    parser.add_argument("--database-url", default=None, help="database with an empty schema")
+    args = parser.parse_args()
+
+    url = args.database_url or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+    engine = create_engine(
+        url,
+        future=True,
+        pool_size=max(5, args.threads),
+        connect_args={"check_same_thread": False} if url.startswith("sqlite") else {},
+    )
+    if args.database_url is None:
+        Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine, expire_on_commit=False, future=True)
+    ids = populate(engine, 2 * args.payments)
+
+    print(f"{'strategy':<20}{'payments/s':>12}")
+    for name, create, chunk in (
+        ("check-then-insert", check_then_insert, ids[: args.payments]),
+        ("single statement", single_statement, ids[args.payments:]),
+    ):
+        print(f"{name:<20}{run(Session, create, chunk, args.threads):>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
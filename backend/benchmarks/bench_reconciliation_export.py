@@ -0,0 +1,131 @@
+"""Reconciliation export: throughput and peak memory of the streamed reservation/payment join.
+
+Usage (from backend/):
+    python -m benchmarks.bench_reconciliation_export --reservations 1000000
+    DATABASE_URL=postgresql+psycopg2://... python -m benchmarks.bench_reconciliation_export
+
+Without DATABASE_URL, loads synthetic data into a throwaway SQLite database; with it, uses
+that (already populated) database. Exports every row, then the rows of one month, through:
+    cli csv       write_csv to a local file (what `manage.py export-reconciliation` does)
+    cli parquet   write_parquet to a local file (skipped without pyarrow)
+    http csv      GET /reports/reconciliation through the ASGI app, body counted as it is sent
+    client join   the previous workflow: GET /payments and GET /reservations as NDJSON, joined
+                  in memory on the client
+Peak memory comes from tracemalloc. It should stay flat as --reservations grows for every
+path except the client join.
+"""
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+from datetime import date
+
+WORKDIR = tempfile.mkdtemp()
+POPULATE = "DATABASE_URL" not in os.environ
+if POPULATE:
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(WORKDIR, 'bench.db')}"
+
+import httpx  # noqa: E402
+
+import main  # noqa: E402
+from src.shared.infra.db import Base, ReadSessionLocal, engine  # noqa: E402
+from src.shared.infra.synthetic_data import GenerationSpec, generate  # noqa: E402
+from src.reports.infra import reconciliation_export  # noqa: E402
+from src.reports.infra.reconciliation_repository_psql import ReconciliationRepositoryPsql  # noqa: E402
+
+MONTH = (date(2025, 6, 1), date(2025, 6, 30))
+
+
+def measure(fn) -> tuple:
+    tracemalloc.start()
+    started = time.perf_counter()
+    try:
+        rows = fn()
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return rows, elapsed, peak / 2**20
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reservations", type=int, default=1_000_000)
+    parser.add_argument("--skip-client-join", action="store_true", help="the client join holds everything in memory")
+    args = parser.parse_args()
+
+    if POPULATE:
+        Base.metadata.create_all(bind=engine)
+        started = time.perf_counter()
+        generate(engine, GenerationSpec(rooms=1000, reservations=args.reservations), progress=lambda _: None)
+        print(f"populated {args.reservations} reservations in {time.perf_counter() - started:.1f}s")
+
+    def cli_csv(window) -> int:
+        with ReadSessionLocal() as session, open(os.path.join(WORKDIR, "export.csv"), "wb") as out:
+            return reconciliation_export.write_csv(ReconciliationRepositoryPsql(session).iter_rows(*window), out)
+
+    def cli_parquet(window) -> int:
+        with ReadSessionLocal() as session:
+            rows = ReconciliationRepositoryPsql(session).iter_rows(*window, chunk_size=10_000)
+            return reconciliation_export.write_parquet(rows, os.path.join(WORKDIR, "export.parquet"), rows_per_group=10_000)
+
+    async def http_csv(window) -> int:
+        # Straight ASGI call: httpx's ASGITransport would buffer the whole body on the client side
+        query = f"from={window[0].isoformat()}&to={window[1].isoformat()}" if window[0] else ""
+        scope = {
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET", "scheme": "http",
+            "path": "/reports/reconciliation", "raw_path": b"/reports/reconciliation", "root_path": "",
+            "query_string": query.encode(), "headers": [(b"host", b"bench")], "client": None, "server": None,
+        }
+        lines = 0
+        done = asyncio.Event()
+
+        async def receive():
+            if not done.is_set():
+                done.set()
+                return {"type": "http.request", "body": b"", "more_body": False}
+            await asyncio.Event().wait()
+
+        async def send(message):
+            nonlocal lines
+            if message["type"] == "http.response.body":
+                lines += message.get("body", b"").count(b"\n")
+
+        await main.app(scope, receive, send)
+        return lines - 1
+
+    async def client_join(window) -> int:
+        ndjson = {"Accept": "application/x-ndjson"}
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=main.app), base_url="http://bench", timeout=None) as client:
+            payments = {}
+            for line in (await client.get("/payments", headers=ndjson)).text.splitlines():
+                payment = json.loads(line)
+                payments[payment["reservation_id"]] = payment
+            joined = []
+            for line in (await client.get("/reservations", headers=ndjson)).text.splitlines():
+                reservation = json.loads(line)
+                if window[0] and (reservation["end_date"] < window[0].isoformat() or reservation["start_date"] > window[1].isoformat()):
+                    continue
+                joined.append((reservation, payments.get(reservation["id"])))
+        return len(joined)
+
+    cases = [("cli csv", cli_csv), ("http csv", lambda w: asyncio.run(http_csv(w)))]
+    if reconciliation_export.pyarrow is not None:
+        cases.insert(1, ("cli parquet", cli_parquet))
+    if not args.skip_client_join:
+        cases.append(("client join (ndjson)", lambda w: asyncio.run(client_join(w))))
+
+    print(f"\n{'export':<24}{'window':<10}{'rows':>10}{'seconds':>9}{'rows/s':>12}{'peak MiB':>10}")
+    for window_name, window in (("all", (None, None)), ("2025-06", MONTH)):
+        for name, fn in cases:
+            rows, elapsed, peak = measure(lambda: fn(window))
+            print(f"{name:<24}{window_name:<10}{rows:>10}{elapsed:>9.1f}{rows / elapsed if elapsed else 0:>12,.0f}{peak:>10.1f}")
+    shutil.rmtree(WORKDIR, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,125 @@
+"""Response serialization cost: response_model path vs the FAST_SERIALIZATION_ENABLED fast path.
+
+Usage (from backend/):
+    python -m benchmarks.bench_serialization --rows 100000
+
+The response_model path builds the *Out models by hand, then validates and dumps them
+against the response_model again, as FastAPI does. The fast path turns the domain
+dataclasses into dicts and encodes them with orjson (or stdlib json). Both outputs are
+checked to be byte-identical.
+"""
+import argparse
+import statistics
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Callable, List
+
+from pydantic import TypeAdapter
+
+from api import serialization
+from api.schemas import PaymentOut, ReservationOut, ReservationRangeOut, RoomOut
+from src.payments.domain.payment import Payment
+from src.reservations.domain.reservation import Reservation
+from src.rooms.domain.room import ReservationRange, Room
+
+
+def make_rows(count: int):
+    base = date(2025, 1, 1)
+    rooms, reservations, payments = [], [], []
+    for i in range(count):
+        start = base + timedelta(days=i % 365)
+        rooms.append(Room(
+            id=f"room-{i:08d}",
+            name=f"room{i}",
+            price_per_night=Decimal("80.00") + i % 50,
+            reservation_ranges=[ReservationRange(start_date=start, end_date=start + timedelta(days=2))],
+        ))
+        reservations.append(Reservation(
+            id=f"rsv-{i:08d}",
+            room_id=f"room-{i % 1000:08d}",
+            guest_email=f"guest{i}@example.com",
+            start_date=start,
+            end_date=start + timedelta(days=2),
+        ))
+        payments.append(Payment(id=f"pay-{i:08d}", reservation_id=f"rsv-{i:08d}", amount=Decimal("120.50")))
+    return rooms, reservations, payments
+
+
+def response_model_rooms(rooms: List[Room]) -> bytes:
+    out = [
+        RoomOut(
+            id=room.id,
+            name=room.name,
+            price_per_night=float(room.price_per_night),
+            reservation_ranges=[
+                ReservationRangeOut(start_date=br.start_date, end_date=br.end_date)
+                for br in room.reservation_ranges
+            ],
+        )
+        for room in rooms
+    ]
+    adapter = TypeAdapter(List[RoomOut])
+    return adapter.dump_json(adapter.validate_python(out), by_alias=True)
+
+
+def response_model_reservations(reservations: List[Reservation]) -> bytes:
+    out = [
+        ReservationOut(
+            id=r.id,
+            room_id=r.room_id,
+            guest_email=r.guest_email,
+            start_date=r.start_date,
+            end_date=r.end_date,
+            status=r.status,
+        )
+        for r in reservations
+    ]
+    adapter = TypeAdapter(List[ReservationOut])
+    return adapter.dump_json(adapter.validate_python(out), by_alias=True)
+
+
+def response_model_payments(payments: List[Payment]) -> bytes:
+    out = [PaymentOut(id=p.id, reservation_id=p.reservation_id, amount=float(p.amount)) for p in payments]
+    adapter = TypeAdapter(List[PaymentOut])
+    return adapter.dump_json(adapter.validate_python(out), by_alias=True)
+
+
+def time_call(fn: Callable[[], bytes], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rooms, reservations, payments = make_rows(args.rows)
+    cases = [
+        ("rooms", lambda: response_model_rooms(rooms),
+         lambda: serialization.dumps([serialization.room_dict(r) for r in rooms])),
+        ("reservations", lambda: response_model_reservations(reservations),
+         lambda: serialization.dumps([serialization.reservation_dict(r) for r in reservations])),
+        ("payments", lambda: response_model_payments(payments),
+         lambda: serialization.dumps([serialization.payment_dict(p) for p in payments])),
+    ]
+
+    encoder = "orjson" if serialization.orjson is not None else "json"
+    print(f"{args.rows} rows, fast path encoder: {encoder}")
+    print(f"{'list':<14}{'response_model ms':>19}{'fast ms':>10}{'speedup':>9}")
+    for name, slow, fast in cases:
+        if slow() != fast():
+            raise SystemExit(f"{name}: outputs differ")
+        slow_ms = time_call(slow, args.repeat)
+        fast_ms = time_call(fast, args.repeat)
+        print(f"{name:<14}{slow_ms:>19.1f}{fast_ms:>10.1f}{slow_ms / fast_ms:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
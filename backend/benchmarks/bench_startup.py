@@ -0,0 +1,129 @@
+"""Startup cost: `import main` time and time-to-first-response of a fresh server process.
+
+Usage (from backend/):
+    python -m benchmarks.bench_startup --runs 5
+    python -m benchmarks.bench_startup --compare benchmarks/results/startup-<stamp>.json
+
+Every sample runs in a new interpreter, so nothing is cached in-process. Time-to-first-response
+is measured from spawning uvicorn (or gunicorn with gunicorn.conf.py) until GET /rooms answers
+200, with STARTUP_INIT_ENABLED on (schema and seed checks in the lifespan) and off (database
+initialized beforehand by `manage.py init-db`). The slowest imports come from -X importtime.
+Without DATABASE_URL a copy of hotel.db is used. Results are saved under benchmarks/results/.
+"""
+import argparse
+import http.client
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks import results
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _env(**overrides: str) -> dict:
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    env.update(overrides)
+    return env
+
+
+def import_time(env: dict) -> float:
+    code = "import time; t = time.perf_counter(); import main; print(time.perf_counter() - t)"
+    out = subprocess.run([sys.executable, "-c", code], cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True)
+    return float(out.stdout.strip().splitlines()[-1]) * 1000
+
+
+def slowest_imports(env: dict, top: int) -> list:
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us) / 1000, int(cumulative_us) / 1000))
+    return sorted(rows, key=lambda row: row[1], reverse=True)[:top]
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def first_response(server: str, env: dict, timeout: float = 60) -> float:
+    port = _free_port()
+    if server == "gunicorn":
+        command = [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "main:app"]
+        env = dict(env, GUNICORN_BIND=f"127.0.0.1:{port}")
+    else:
+        command = [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"]
+    started = time.perf_counter()
+    process = subprocess.Popen(command, cwd=BACKEND_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        while time.perf_counter() - started < timeout:
+            try:
+                connection = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+                connection.request("GET", "/rooms")
+                if connection.getresponse().status == 200:
+                    return (time.perf_counter() - started) * 1000
+            except OSError:
+                time.sleep(0.005)
+            finally:
+                connection.close()
+        raise SystemExit(f"{server} did not answer within {timeout}s")
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def measure(fn, runs: int) -> dict:
+    fn()  # warm the OS file cache; not recorded
+    return results.summarize([fn() for _ in range(runs)])
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="slowest imports to list")
+    parser.add_argument("--servers", nargs="+", default=["uvicorn", "gunicorn"], choices=["uvicorn", "gunicorn"])
+    parser.add_argument("--out-dir", default=results.RESULTS_DIR)
+    parser.add_argument("--compare", default=None, help="earlier startup result file (compares p50)")
+    args = parser.parse_args()
+
+    database_url = os.environ.get("DATABASE_URL")
+    if database_url is None:
+        path = os.path.join(tempfile.mkdtemp(), "startup.db")
+        shutil.copy(os.path.join(BACKEND_DIR, "hotel.db"), path)
+        database_url = f"sqlite:///{path}"
+    base_env = _env(DATABASE_URL=database_url, WEB_CONCURRENCY="1")
+    subprocess.run([sys.executable, "manage.py", "init-db"], cwd=BACKEND_DIR, env=base_env, check=True, capture_output=True)
+
+    measured = {"import main": measure(lambda: import_time(base_env), args.runs)}
+    for server in args.servers:
+        for init in ("1", "0"):
+            env = dict(base_env, STARTUP_INIT_ENABLED=init)
+            name = f"first response {server} (startup init {'on' if init == '1' else 'off'})"
+            measured[name] = measure(lambda: first_response(server, env), args.runs)
+
+    print(f"\n{'':<48}{'p50 ms':>10}{'min ms':>10}{'max ms':>10}")
+    for name, stats in measured.items():
+        print(f"{name:<48}{stats['p50']:>10.1f}{stats['min']:>10.1f}{stats['max']:>10.1f}")
+    print("\nslowest imports (self ms, cumulative ms):")
+    for name, self_ms, cumulative_ms in slowest_imports(base_env, args.top):
+        print(f"  {name:<46}{self_ms:>8.1f}{cumulative_ms:>10.1f}")
+
+    path = results.save("startup", measured, args.out_dir)
+    print(f"\nsaved {path}")
+    if args.compare:
+        results.compare(results.load(args.compare)["results"], measured, "p50")
+
+
+if __name__ == "__main__":
+    run()
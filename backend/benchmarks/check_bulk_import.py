@@ -0,0 +1,236 @@
+"""Check `manage.py import-csv`: rejects, crash/resume from the checkpoint, throughput vs row-at-a-time.
+
+Usage (from backend/):
+    python -m benchmarks.check_bulk_import --rows 200000
+    python -m benchmarks.check_bulk_import --rows 1000000 --chunk-size 10000
+
+Works on a throwaway SQLite database with synthetic rooms. Writes a reservations CSV with
+--rows valid stays plus one invalid row per 100 (overlaps, unknown rooms, duplicate ids,
+bad dates, short rows) and a payments CSV for them, then:
+    - imports both and checks every valid row is stored, every invalid one is in the
+      rejects file with its line, and room_day_occupancy still matches the reservations
+    - repeats the reservations import on new databases, crashing it half way through
+      before a chunk's commit and then after a commit but before its checkpoint, and checks
+      each resumed run ends with the same rows and the same rejects file
+    - times --sample rows through CreateReservationUseCase / CreatePaymentUseCase one at a
+      time (what POST /reservations and POST /payments do) for the rows/s comparison
+Exits non-zero on failure.
+"""
+import argparse
+import csv
+import filecmp
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+WORKDIR = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(WORKDIR, 'import.db')}"
+
+from sqlalchemy import create_engine, func, select  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from src.shared.infra.db import Base  # noqa: E402
+from src.shared.infra.csv_import import Checkpoint, import_csv  # noqa: E402
+from src.shared.infra.synthetic_data import GenerationSpec, generate  # noqa: E402
+from src.payments.application.create_payment import CreatePaymentUseCase  # noqa: E402
+from src.payments.domain.payment import Payment  # noqa: E402
+from src.payments.infra.payment_model_psql import PaymentModel  # noqa: E402
+from src.payments.infra.payment_repository_psql import PaymentRepositoryPsql  # noqa: E402
+from src.reports.infra.occupancy_rollup import check as check_occupancy  # noqa: E402
+from src.reservations.application.create_reservation import CreateReservationUseCase  # noqa: E402
+from src.reservations.application.reservation_events import ReservationEvents  # noqa: E402
+from src.reservations.domain.reservation import Reservation  # noqa: E402
+from src.reservations.infra.reservation_model_psql import ReservationModel  # noqa: E402
+from src.reservations.infra.reservation_repository_psql import ReservationRepositoryPsql  # noqa: E402
+from src.rooms.application.room_service import RoomService  # noqa: E402
+from src.rooms.infra.room_model_psql import RoomModel  # noqa: E402
+from src.rooms.infra.room_repository_psql import RoomRepositoryPsql  # noqa: E402
+import src.reports.infra.occupancy_model_psql  # noqa: E402,F401  (registers the room_day_occupancy table)
+
+ROOMS = 1000
+START = date(2030, 1, 1)
+
+
+class Crash(Exception):
+    pass
+
+
+def check(condition: bool, message: str, failures: list) -> None:
+    print(f"{'ok  ' if condition else 'FAIL'} {message}")
+    if not condition:
+        failures.append(message)
+
+
+def database(name: str):
+    engine = create_engine(f"sqlite:///{os.path.join(WORKDIR, name)}", future=True)
+    Base.metadata.create_all(bind=engine)
+    generate(engine, GenerationSpec(rooms=ROOMS, reservations=0), progress=lambda _: None)
+    factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False, future=True)
+    with factory() as session:
+        rooms = list(session.scalars(select(RoomModel.id).order_by(RoomModel.id)))
+    return engine, factory, rooms
+
+
+def write_csvs(rooms: list, rows: int) -> tuple:
+    """Write the reservations and payments files; return (paths, expected rejects per file)."""
+    reservations_path = os.path.join(WORKDIR, "reservations.csv")
+    payments_path = os.path.join(WORKDIR, "payments.csv")
+    rejects = [0, 0]
+    with open(reservations_path, "w", newline="") as r, open(payments_path, "w", newline="") as p:
+        reservations, payments = csv.writer(r), csv.writer(p)
+        reservations.writerow(["id", "room_id", "guest_email", "start_date", "end_date", "status"])
+        payments.writerow(["id", "reservation_id", "amount"])
+        for n in range(rows):
+            # Back to back 2-night stays per room, every 10th cancelled
+            room, slot = rooms[n % len(rooms)], n // len(rooms)
+            start = START + timedelta(days=3 * slot)
+            status = "cancelled" if n % 10 == 9 else "active"
+            reservation_id = f"imp-{n:09d}"
+            reservations.writerow([reservation_id, room, f"guest{n}@example.com", start, start + timedelta(days=2), status])
+            payments.writerow([f"pay-{n:09d}", reservation_id, "120.50"])
+            if status == "cancelled":
+                rejects[1] += 1  # "Reservation is not active"
+            if n % 100 == 50:
+                bad = n % 500
+                if bad == 50:
+                    reservations.writerow([f"bad-{n}", room, "x@example.com", start + timedelta(days=1), start + timedelta(days=1), "active"])
+                elif bad == 150:
+                    reservations.writerow([f"bad-{n}", "no-such-room", "x@example.com", start, start, "active"])
+                elif bad == 250:
+                    reservations.writerow([reservation_id, room, "x@example.com", START - timedelta(days=10), START - timedelta(days=10), "active"])
+                elif bad == 350:
+                    reservations.writerow([f"bad-{n}", room, "x@example.com", "2030-02-30", "2030-03-01", "active"])
+                else:
+                    reservations.writerow([f"bad-{n}", room])
+                payments.writerow([f"pay-{n:09d}", reservation_id, "10"])
+                rejects[0] += 1
+                rejects[1] += 1
+    return reservations_path, payments_path, rejects
+
+
+def count(factory, model) -> int:
+    with factory() as session:
+        return session.scalar(select(func.count()).select_from(model))
+
+
+def rejects_in(path: str) -> int:
+    with open(path, newline="") as f:
+        return sum(1 for _ in csv.reader(f)) - 1
+
+
+def one_at_a_time(factory, rooms: list, sample: int) -> tuple:
+    """rows/s creating `sample` reservations, then paying them, one use case call per row."""
+    started = time.perf_counter()
+    for n in range(sample):
+        with factory() as session:
+            CreateReservationUseCase(
+                ReservationRepositoryPsql(session), RoomService(RoomRepositoryPsql(session)), events=ReservationEvents(),
+            ).execute(Reservation(f"one-{n}", rooms[n % len(rooms)], "one@example.com",
+                                  date(2040, 1, 1) + timedelta(days=3 * (n // len(rooms))),
+                                  date(2040, 1, 2) + timedelta(days=3 * (n // len(rooms)))))
+    reservations = sample / (time.perf_counter() - started)
+    started = time.perf_counter()
+    for n in range(sample):
+        with factory() as session:
+            CreatePaymentUseCase(PaymentRepositoryPsql(session), ReservationRepositoryPsql(session)).execute(
+                Payment(f"one-pay-{n}", f"one-{n}", Decimal("10")))
+    return reservations, sample / (time.perf_counter() - started)
+
+
+def crash_resume(reservations_csv: str, chunk_size: int, rows: int, chunks: int, when: str, failures: list) -> None:
+    """Import, crash half way `when` ("before"/"after") a chunk's commit, resume; compare with the clean run."""
+    _, factory, _ = database(f"resume-{when}.db")
+    calls = 0
+
+    def crashing_factory():
+        # The chunk fails before anything is stored
+        nonlocal calls
+        calls += 1
+        if when == "before" and calls > chunks // 2:
+            raise Crash()
+        return factory()
+
+    save = Checkpoint.save
+
+    def crashing_save(checkpoint: Checkpoint, path: str) -> None:
+        # The chunk is committed, its checkpoint is never written
+        if when == "after" and not checkpoint.pending_line and calls > chunks // 2:
+            raise Crash()
+        save(checkpoint, path)
+
+    rejects = os.path.join(WORKDIR, f"resume-{when}.rejects.csv")
+    checkpoint = os.path.join(WORKDIR, f"resume-{when}.checkpoint.json")
+    Checkpoint.save = crashing_save
+    try:
+        import_csv("reservations", reservations_csv, rejects, checkpoint,
+                   chunk_size=chunk_size, session_factory=crashing_factory, progress=lambda _: None)
+        check(False, f"import crashed half way ({when} a commit)", failures)
+    except Crash:
+        print(f"     crashed {when} a commit with {count(factory, ReservationModel):,} rows stored")
+    finally:
+        Checkpoint.save = save
+    stats = import_csv("reservations", reservations_csv, rejects, checkpoint,
+                       chunk_size=chunk_size, session_factory=factory, progress=lambda _: None)
+    if stats.resumed_at_line is None:
+        check(False, f"crash {when} a commit left a checkpoint to resume from", failures)
+        return
+    stored = count(factory, ReservationModel)
+    check(stored == rows and stats.imported == rows,
+          f"resumed at line {stats.resumed_at_line:,}: {stored:,} stored, {stats.imported:,} counted, {rows:,} expected",
+          failures)
+    check(filecmp.cmp(rejects, os.path.join(WORKDIR, "reservations.rejects.csv"), shallow=False),
+          "resumed rejects file equals the uninterrupted one", failures)
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("--sample", type=int, default=2000, help="rows for the one-at-a-time comparison")
+    args = parser.parse_args()
+    if args.rows <= args.chunk_size:
+        parser.error("--rows must exceed --chunk-size, so the import can crash after a chunk and resume")
+    failures: list = []
+    quiet = lambda _: None  # noqa: E731
+
+    engine, factory, rooms = database("import.db")
+    reservations_csv, payments_csv, (reservation_rejects, payment_rejects) = write_csvs(rooms, args.rows)
+    print(f"{args.rows:,} rows, {reservation_rejects:,} invalid reservation rows, "
+          f"{os.path.getsize(reservations_csv) / 2**20:.1f} MiB\n")
+
+    rates = {}
+    for kind, path, expected_rejects in (
+        ("reservations", reservations_csv, reservation_rejects),
+        ("payments", payments_csv, payment_rejects),
+    ):
+        rejects = os.path.join(WORKDIR, f"{kind}.rejects.csv")
+        stats = import_csv(kind, path, rejects, os.path.join(WORKDIR, f"{kind}.checkpoint.json"),
+                           chunk_size=args.chunk_size, session_factory=factory, progress=quiet)
+        rates[kind] = stats.imported / stats.seconds if stats.seconds else 0.0
+        stored = count(factory, ReservationModel if kind == "reservations" else PaymentModel)
+        expected = args.rows if kind == "reservations" else args.rows - payment_rejects + reservation_rejects
+        check(stats.imported == expected == stored, f"{kind}: {stored:,} stored, {expected:,} expected", failures)
+        check(stats.rejected == expected_rejects == rejects_in(rejects),
+              f"{kind}: {stats.rejected:,} rejected with line and error", failures)
+    found, _ = check_occupancy(engine, limit=1)
+    check(found == 0, "room_day_occupancy matches the imported reservations", failures)
+
+    chunks = -(-args.rows // args.chunk_size)
+    for when in ("before", "after"):
+        crash_resume(reservations_csv, args.chunk_size, args.rows, chunks, when, failures)
+
+    single = one_at_a_time(factory, rooms, args.sample)
+    print(f"\n{'path':<36}{'reservations/s':>16}{'payments/s':>14}")
+    print(f"{'import-csv (chunk ' + str(args.chunk_size) + ')':<36}{rates['reservations']:>16,.0f}{rates['payments']:>14,.0f}")
+    print(f"{'one at a time (POST use cases)':<36}{single[0]:>16,.0f}{single[1]:>14,.0f}")
+    shutil.rmtree(WORKDIR, ignore_errors=True)
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,61 @@
+"""Query budget (N+1) guard: every endpoint must run a fixed number of SQL statements.
+
+Usage (from backend/):
+    python -m benchmarks.check_query_budget
+    ASYNC_DB_ENABLED=1 python -m benchmarks.check_query_budget
+
+Each request is run under query_budget() on a small database and again after bulk
+loading rooms, reservations and payments with the synthetic data generator. The
+budgets do not depend on the number of rows (or batch items), so a repository that
+starts querying per room or per reservation fails here. Exits non-zero on failure.
+"""
+import os
+import sys
+import tempfile
+
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'budget.db')}"
+os.environ.pop("DATABASE_READ_URL", None)
+os.environ.pop("ASYNC_DATABASE_URL", None)
+os.environ["ROOM_CACHE_ENABLED"] = "0"  # cached reads would run no queries at all
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+import main  # noqa: E402
+from benchmarks.query_budgets import BUDGETS, new_reservation  # noqa: E402
+from src.shared.infra.db import engine  # noqa: E402
+from src.shared.infra.query_profiler import QueryBudgetExceeded, query_budget  # noqa: E402
+from src.shared.infra.synthetic_data import GenerationSpec, generate  # noqa: E402
+
+
+def run_budgets(client: TestClient, label: str, failures: list) -> None:
+    room_ids = [room["id"] for room in client.get("/rooms").json()]
+    fixture = {"room_id": room_ids[0], "room_ids": room_ids}
+    fixture["reservation_id"] = client.post("/reservations", json=new_reservation(room_ids[0])).json()["id"]
+    print(f"\n{label}: {len(room_ids)} rooms")
+    for name, budget, request in BUDGETS:
+        try:
+            with query_budget(budget) as stats:
+                response = request(client, fixture)
+        except QueryBudgetExceeded as exc:
+            print(f"FAIL {name}: {exc}")
+            failures.append(f"{label} {name}")
+            continue
+        ok = response.status_code < 400
+        print(f"{'ok  ' if ok else 'FAIL'} {name:<46}{stats.count:>3} / {budget} queries  ({response.status_code})")
+        if not ok:
+            failures.append(f"{label} {name}: status {response.status_code}")
+
+
+def run() -> None:
+    failures: list = []
+    with TestClient(main.app) as client:
+        run_budgets(client, "seeded database", failures)
+        generate(engine, GenerationSpec(rooms=300, reservations=20_000, batch_size=20_000), progress=lambda _: None)
+        run_budgets(client, "after bulk load", failures)
+    if failures:
+        sys.exit(f"{len(failures)} check(s) failed")
+    print("\nall budgets met")
+
+
+if __name__ == "__main__":
+    run()
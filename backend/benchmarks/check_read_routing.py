@@ -0,0 +1,113 @@
+"""Check read/write routing with DATABASE_READ_URL on two local SQLite databases.
+
+Usage (from backend/):
+    python -m benchmarks.check_read_routing
+    ASYNC_DB_ENABLED=1 python -m benchmarks.check_read_routing
+
+The "replica" is a second SQLite file that only changes when this script copies the
+primary into it, so every response shows which database served it: pure reads
+(rooms, reservation and payment lists) must come from the replica, writes and the
+reads they depend on (overlap and payment checks) from the primary. Exits non-zero on failure.
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+import uuid
+
+_dir = tempfile.mkdtemp()
+PRIMARY_PATH = os.path.join(_dir, "primary.db")
+REPLICA_PATH = os.path.join(_dir, "replica.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{PRIMARY_PATH}"
+os.environ["DATABASE_READ_URL"] = f"sqlite:///{REPLICA_PATH}"
+os.environ.pop("ASYNC_DATABASE_URL", None)
+os.environ.pop("ASYNC_DATABASE_READ_URL", None)
+os.environ["ROOM_CACHE_ENABLED"] = "0"  # every read must reach a database
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+import main  # noqa: E402
+
+
+def check(condition: bool, message: str, failures: list) -> None:
+    print(f"{'ok  ' if condition else 'FAIL'} {message}")
+    if not condition:
+        failures.append(message)
+
+
+def replicate() -> None:
+    """Bring the replica up to date with the primary (stands in for streaming replication)."""
+    source, target = sqlite3.connect(PRIMARY_PATH), sqlite3.connect(REPLICA_PATH)
+    try:
+        source.backup(target)
+    finally:
+        source.close()
+        target.close()
+
+
+def reservation(room_id: str, start: str, end: str) -> dict:
+    return {
+        "id": str(uuid.uuid4()),
+        "room_id": room_id,
+        "guest_email": "replica@example.com",
+        "start_date": start,
+        "end_date": end,
+    }
+
+
+def check_routing(client: TestClient, failures: list) -> None:
+    check(client.get("/rooms").json() == [], "GET /rooms reads the (empty) replica", failures)
+    replicate()
+    rooms = client.get("/rooms").json()
+    check(len(rooms) > 0, "GET /rooms sees rooms once replicated", failures)
+    room_id = rooms[0]["id"]
+    check(client.get(f"/rooms/{room_id}").status_code == 200, "GET /rooms/{room_id} reads the replica", failures)
+
+    first = reservation(room_id, "2041-03-01", "2041-03-05")
+    check(client.post("/reservations", json=first).status_code == 201, "booking written to the primary", failures)
+    check(client.get(f"/reservations/{first['id']}").status_code == 200, "GET /reservations/{id} reads the primary", failures)
+    check(
+        all(r["id"] != first["id"] for r in client.get("/reservations").json()),
+        "GET /reservations does not see the unreplicated booking",
+        failures,
+    )
+    overlapping = reservation(room_id, "2041-03-03", "2041-03-07")
+    check(
+        client.post("/reservations", json=overlapping).status_code == 409,
+        "overlap check runs on the primary (replica is behind)",
+        failures,
+    )
+    payment = {"id": str(uuid.uuid4()), "reservation_id": first["id"], "amount": 400.0}
+    check(client.post("/payments", json=payment).status_code == 201, "payment checks run on the primary", failures)
+    check(client.post("/payments", json=dict(payment, id=str(uuid.uuid4()))).status_code == 409,
+          "duplicate payment rejected by the primary", failures)
+    check(all(p["id"] != payment["id"] for p in client.get("/payments").json()),
+          "GET /payments does not see the unreplicated payment", failures)
+    ndjson = client.get("/payments", headers={"Accept": "application/x-ndjson"}).text
+    check(payment["id"] not in ndjson, "NDJSON export reads the replica", failures)
+
+    replicate()
+    check(any(r["id"] == first["id"] for r in client.get("/reservations").json()),
+          "GET /reservations sees the booking once replicated", failures)
+    check(any(p["id"] == payment["id"] for p in client.get("/payments").json()),
+          "GET /payments sees the payment once replicated", failures)
+    ranges = next(r for r in client.get("/rooms").json() if r["id"] == room_id)["reservation_ranges"]
+    check({"from": "2041-03-01", "to": "2041-03-05"} in ranges, "GET /rooms shows the replicated booking", failures)
+
+    metrics = client.get("/metrics").text
+    engine = "async_replica" if main.async_db_enabled else "replica"
+    check(f'engine="{engine}"' in metrics, f"pool metrics reported for the {engine} engine", failures)
+
+
+def run() -> None:
+    failures: list = []
+    print(f"primary {PRIMARY_PATH}\nreplica {REPLICA_PATH}")
+    with TestClient(main.app) as client:
+        check_routing(client, failures)
+    if failures:
+        sys.exit(f"{len(failures)} check(s) failed")
+    print("all checks passed")
+
+
+if __name__ == "__main__":
+    run()
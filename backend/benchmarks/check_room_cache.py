@@ -0,0 +1,69 @@
+"""Check the room response cache bounds and time cached vs uncached GET /rooms.
+
+Usage (from backend/):
+    python -m benchmarks.check_room_cache --requests 2000
+
+Runs against a throwaway SQLite database through the real FastAPI app with
+ROOM_CACHE_ENABLED=1. ETag/304 handling and the visibility of bookings made by other
+workers are covered by tests/test_room_cache.py. Exits non-zero on failure.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'cache.db')}")
+os.environ["ROOM_CACHE_ENABLED"] = "1"
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+import main  # noqa: E402
+from api import room_cache as cache_module  # noqa: E402
+from api.room_cache import ResponseCache  # noqa: E402
+
+
+def check(condition: bool, message: str, failures: list) -> None:
+    print(f"{'ok  ' if condition else 'FAIL'} {message}")
+    if not condition:
+        failures.append(message)
+
+
+def bounded(failures: list) -> None:
+    cache = ResponseCache(max_entries=10, max_bytes=1000)
+    for i in range(100):
+        cache.put(f"k{i}", b"x" * 90, 1)
+    check(len(cache._entries) <= 10 and cache._bytes <= 1000, "LRU stays within entry and byte bounds", failures)
+    check(cache.get("k99", 1) is not None and cache.get("k0", 1) is None, "least recently used entries evicted", failures)
+    check(cache.get("k99", 2) is None, "body stored at an older version is not served", failures)
+
+
+def timing(client: TestClient, requests: int) -> None:
+    cache = cache_module.room_cache
+    started = time.perf_counter()
+    for _ in range(requests):
+        cache.clear()
+        client.get("/rooms")
+    uncached = requests / (time.perf_counter() - started)
+    started = time.perf_counter()
+    for _ in range(requests):
+        client.get("/rooms")
+    cached = requests / (time.perf_counter() - started)
+    print(f"GET /rooms  uncached {uncached:.0f} req/s  cached {cached:.0f} req/s")
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    failures: list = []
+    with TestClient(main.app) as client:
+        bounded(failures)
+        timing(client, args.requests)
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run()
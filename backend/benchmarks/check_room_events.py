@@ -0,0 +1,182 @@
+"""Check GET /rooms/events: deltas on booking/cancel, Last-Event-ID replay, reset, idle fan-out cost.
+
+Usage (from backend/):
+    python -m benchmarks.check_room_events --connections 2000
+    ASYNC_DB_ENABLED=1 python -m benchmarks.check_room_events
+
+Starts uvicorn on a copy of hotel.db (or DATABASE_URL), opens --connections idle SSE streams,
+books and cancels a room over HTTP and times how long it takes until every stream has
+received the delta. Server RSS is sampled before and after opening the streams to report
+the memory cost per idle connection. Exits non-zero on failure.
+"""
+import argparse
+import asyncio
+import json
+import os
+import resource
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def check(condition: bool, message: str, failures: list) -> None:
+    print(f"{'ok  ' if condition else 'FAIL'} {message}")
+    if not condition:
+        failures.append(message)
+
+
+def rss_kb(pid: int) -> int:
+    with open(f"/proc/{pid}/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+
+async def request(port: int, method: str, path: str, body: dict = None) -> tuple:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    payload = json.dumps(body).encode() if body is not None else b""
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n"
+        f"Content-Type: application/json\r\nContent-Length: {len(payload)}\r\n\r\n".encode() + payload
+    )
+    raw = await reader.read()
+    writer.close()
+    head, _, content = raw.partition(b"\r\n\r\n")
+    return int(head.split()[1]), content
+
+
+class EventStream:
+    """Minimal SSE client on a raw socket, parsing `id`/`event`/`data` frames."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader, self.writer = reader, writer
+
+    @classmethod
+    async def open(cls, port: int, last_event_id: str = None) -> "EventStream":
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        extra = f"Last-Event-ID: {last_event_id}\r\n" if last_event_id else ""
+        writer.write(f"GET /rooms/events HTTP/1.1\r\nHost: localhost\r\n{extra}\r\n".encode())
+        await reader.readuntil(b"\r\n\r\n")
+        return cls(reader, writer)
+
+    async def next_event(self) -> dict:
+        while True:
+            # Chunked transfer encoding: size line, chunk, CRLF
+            size = int((await self.reader.readline()).strip(), 16)
+            chunk = (await self.reader.readexactly(size + 2))[:-2].decode()
+            for frame in chunk.split("\n\n"):
+                fields = dict(line.split(": ", 1) for line in frame.splitlines() if ": " in line and not line.startswith(":"))
+                if "event" in fields:
+                    return fields
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+async def scenario(port: int, pid: int, connections: int, failures: list) -> None:
+    status, body = await request(port, "GET", "/rooms")
+    room_id = json.loads(body)[0]["id"]
+
+    first = await EventStream.open(port)
+    reservation_id = str(uuid.uuid4())
+    status, _ = await request(port, "POST", "/reservations", {
+        "id": reservation_id, "room_id": room_id, "guest_email": "events@example.com",
+        "start_date": "2041-03-01", "end_date": "2041-03-04",
+    })
+    check(status == 201, "booking created", failures)
+    created = await asyncio.wait_for(first.next_event(), 5)
+    data = json.loads(created["data"])
+    check(created["event"] == "created", "stream receives a `created` event", failures)
+    check(data == {"room_id": room_id, "reservation_id": reservation_id, "from": "2041-03-01", "to": "2041-03-04"},
+          "delta carries room and range", failures)
+    first.close()
+
+    # Missed while disconnected: the cancellation is replayed from the buffer
+    status, _ = await request(port, "POST", f"/reservations/{reservation_id}/cancel")
+    check(status == 200, "booking cancelled", failures)
+    resumed = await EventStream.open(port, last_event_id=created["id"])
+    replayed = await asyncio.wait_for(resumed.next_event(), 5)
+    check(replayed["event"] == "cancelled" and json.loads(replayed["data"])["reservation_id"] == reservation_id,
+          "Last-Event-ID replays the missed `cancelled` event", failures)
+    resumed.close()
+
+    foreign = await EventStream.open(port, last_event_id="0000.1")
+    reset = await asyncio.wait_for(foreign.next_event(), 5)
+    check(reset["event"] == "reset", "unknown Last-Event-ID gets a `reset` event", failures)
+    foreign.close()
+
+    before = rss_kb(pid)
+    started = time.perf_counter()
+    streams = await asyncio.gather(*(EventStream.open(port) for _ in range(connections)))
+    opened = time.perf_counter() - started
+    await asyncio.sleep(0.5)
+    after = rss_kb(pid)
+    print(f"     opened {connections} streams in {opened:.2f}s, server RSS +{(after - before) / 1024:.1f} MiB "
+          f"({(after - before) / max(connections, 1):.1f} KiB per idle stream)")
+
+    for label, event, path, body in (
+        ("booking", "created", "/reservations", {
+            "id": reservation_id + "-2", "room_id": room_id, "guest_email": "events@example.com",
+            "start_date": "2041-04-01", "end_date": "2041-04-02",
+        }),
+        ("cancellation", "cancelled", f"/reservations/{reservation_id}-2/cancel", None),
+    ):
+        started = time.perf_counter()
+        await request(port, "POST", path, body)
+        received = await asyncio.wait_for(asyncio.gather(*(s.next_event() for s in streams)), 30)
+        elapsed = (time.perf_counter() - started) * 1000
+        check(all(e["event"] == event for e in received), f"all {connections} streams received the {label}", failures)
+        print(f"     {label} fan-out to {connections} streams: {elapsed:.1f} ms")
+    for stream in streams:
+        stream.close()
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--connections", type=int, default=1000)
+    args = parser.parse_args()
+
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (min(hard, max(soft, args.connections * 2 + 256)), hard))
+
+    env = dict(os.environ)
+    if "DATABASE_URL" not in env:
+        path = os.path.join(tempfile.mkdtemp(), "events.db")
+        shutil.copy(os.path.join(BACKEND_DIR, "hotel.db"), path)
+        env["DATABASE_URL"] = f"sqlite:///{path}"
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning",
+         "--backlog", str(args.connections + 128)],
+        cwd=BACKEND_DIR, env=env,
+    )
+    failures: list = []
+    try:
+        deadline = time.time() + 30
+        while True:
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=1).close()
+                break
+            except OSError:
+                if time.time() > deadline:
+                    raise SystemExit("server did not start")
+                time.sleep(0.05)
+        asyncio.run(scenario(port, server.pid, args.connections, failures))
+    finally:
+        server.terminate()
+        server.wait()
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,175 @@
+"""In-process ASGI load driver: mixed read/write scenarios against main:app through httpx.
+
+Usage (from backend/):
+    python -m benchmarks.load --concurrency 1 10 50 --requests 2000
+    python -m benchmarks.load --mix browse=90,book=5,pay=3,cancel=2 --compare benchmarks/results/load-<stamp>.json
+    ASYNC_DB_ENABLED=1 ROOM_CACHE_ENABLED=1 python -m benchmarks.load
+
+Each virtual user repeatedly picks a scenario by weight:
+    browse  GET /rooms, GET /rooms/{room_id}, GET /rooms/available
+    book    POST /reservations (random dates, so some answer 409)
+    pay     POST /payments for a reservation this run booked
+    cancel  POST /reservations/{reservation_id}/cancel for a reservation this run booked
+Latency is reported per endpoint (route template) with p50/p95/p99 and throughput, and
+saved to benchmarks/results/ as JSON. No network or server process is involved, so the
+numbers isolate application and database cost. Without DATABASE_URL a copy of hotel.db is used.
+"""
+import argparse
+import asyncio
+import os
+import random
+import shutil
+import tempfile
+import time
+import uuid
+from collections import defaultdict
+from datetime import date, timedelta
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if "DATABASE_URL" not in os.environ:
+    _db_path = os.path.join(tempfile.mkdtemp(), "load.db")
+    shutil.copy(os.path.join(BACKEND_DIR, "hotel.db"), _db_path)
+    os.environ["DATABASE_URL"] = f"sqlite:///{_db_path}"
+
+import httpx  # noqa: E402
+
+import main  # noqa: E402
+from benchmarks import results  # noqa: E402
+from src.shared.infra import bootstrap  # noqa: E402
+
+DEFAULT_MIX = "browse=70,book=15,pay=10,cancel=5"
+
+
+class Run:
+    def __init__(self, client: httpx.AsyncClient, rng: random.Random, room_ids: list[str], run_id: str):
+        self.client = client
+        self.rng = rng
+        self.room_ids = room_ids
+        self.run_id = run_id
+        self.samples: dict[str, list[float]] = defaultdict(list)
+        self.statuses: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self.booked: list[str] = []  # active reservations without payment, available to pay/cancel
+
+    async def call(self, endpoint: str, method: str, url: str, **kwargs) -> httpx.Response:
+        started = time.perf_counter()
+        response = await self.client.request(method, url, **kwargs)
+        self.samples[endpoint].append((time.perf_counter() - started) * 1000)
+        self.statuses[endpoint][str(response.status_code)] += 1
+        return response
+
+    async def browse(self) -> None:
+        await self.call("GET /rooms", "GET", "/rooms")
+        await self.call("GET /rooms/{room_id}", "GET", f"/rooms/{self.rng.choice(self.room_ids)}")
+        start = date(2030, 1, 1) + timedelta(days=self.rng.randrange(365))
+        await self.call(
+            "GET /rooms/available", "GET", "/rooms/available",
+            params={"from": start.isoformat(), "to": (start + timedelta(days=3)).isoformat()},
+        )
+
+    async def book(self) -> None:
+        start = date(2030, 1, 1) + timedelta(days=self.rng.randrange(365))
+        reservation_id = str(uuid.uuid4())
+        response = await self.call("POST /reservations", "POST", "/reservations", json={
+            "id": reservation_id,
+            "room_id": self.rng.choice(self.room_ids),
+            "guest_email": f"load@{self.run_id}.test",
+            "start_date": start.isoformat(),
+            "end_date": (start + timedelta(days=self.rng.randrange(1, 4))).isoformat(),
+        })
+        if response.status_code == 201:
+            self.booked.append(reservation_id)
+
+    async def pay(self) -> None:
+        if not self.booked:
+            return await self.book()
+        reservation_id = self.booked.pop(self.rng.randrange(len(self.booked)))
+        await self.call("POST /payments", "POST", "/payments", json={
+            "id": str(uuid.uuid4()), "reservation_id": reservation_id, "amount": 100.0,
+        })
+
+    async def cancel(self) -> None:
+        if not self.booked:
+            return await self.book()
+        reservation_id = self.booked.pop(self.rng.randrange(len(self.booked)))
+        await self.call("POST /reservations/{reservation_id}/cancel", "POST", f"/reservations/{reservation_id}/cancel")
+
+
+def parse_mix(mix: str) -> dict[str, int]:
+    weights = {}
+    for part in mix.split(","):
+        name, _, weight = part.partition("=")
+        if name.strip() not in ("browse", "book", "pay", "cancel"):
+            raise SystemExit(f"unknown scenario {name!r}")
+        weights[name.strip()] = int(weight)
+    return weights
+
+
+async def drive(concurrency: int, iterations: int, weights: dict[str, int], seed: int) -> dict:
+    transport = httpx.ASGITransport(app=main.app)
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(transport=transport, base_url="http://load", limits=limits, timeout=60) as client:
+        room_ids = [room["id"] for room in (await client.get("/rooms")).json()]
+        run = Run(client, random.Random(seed), room_ids, uuid.uuid4().hex[:8])
+        names, scenario_weights = list(weights), list(weights.values())
+        remaining = iter(range(iterations))
+
+        async def user() -> None:
+            for _ in remaining:
+                await getattr(run, run.rng.choices(names, scenario_weights)[0])()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(user() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    endpoints = {}
+    for endpoint, samples in sorted(run.samples.items()):
+        stats = results.summarize(samples)
+        stats["rps"] = len(samples) / elapsed
+        stats["statuses"] = dict(run.statuses[endpoint])
+        endpoints[endpoint] = stats
+    total = sum(len(samples) for samples in run.samples.values())
+    return {"elapsed_s": elapsed, "requests": total, "rps": total / elapsed, "endpoints": endpoints}
+
+
+def print_level(concurrency: int, level: dict) -> None:
+    print(f"\nconcurrency {concurrency}: {level['requests']} requests, {level['rps']:.0f} req/s")
+    print(f"{'endpoint':<44}{'count':>7}{'req/s':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}  statuses")
+    for endpoint, stats in level["endpoints"].items():
+        statuses = " ".join(f"{code}:{n}" for code, n in sorted(stats["statuses"].items()))
+        print(
+            f"{endpoint:<44}{stats['count']:>7}{stats['rps']:>8.0f}"
+            f"{stats['p50']:>9.2f}{stats['p95']:>9.2f}{stats['p99']:>9.2f}  {statuses}"
+        )
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--requests", type=int, default=2000, help="scenario iterations per concurrency level")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"scenario weights (default {DEFAULT_MIX})")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--out-dir", default=results.RESULTS_DIR)
+    parser.add_argument("--compare", default=None, help="earlier load result file (compares p95 per endpoint)")
+    args = parser.parse_args()
+
+    weights = parse_mix(args.mix)
+    bootstrap.init_database()  # ASGITransport does not send lifespan events
+    levels = {}
+    for concurrency in args.concurrency:
+        level = asyncio.run(drive(concurrency, args.requests, weights, args.seed))
+        levels[str(concurrency)] = level
+        print_level(concurrency, level)
+
+    path = results.save("load", {"mix": weights, "iterations": args.requests, "levels": levels}, args.out_dir)
+    print(f"\nsaved {path}")
+    if args.compare:
+        previous = results.load(args.compare)["results"]["levels"]
+        for concurrency, level in levels.items():
+            if concurrency in previous:
+                print(f"\nconcurrency {concurrency} (p95 ms)")
+                results.compare(previous[concurrency]["endpoints"], level["endpoints"], "p95")
+
+
+if __name__ == "__main__":
+    run()
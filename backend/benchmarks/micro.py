@@ -0,0 +1,344 @@
+"""Micro-benchmarks of every use case and repository method against SQLite.
+
+Usage (from backend/):
+    python -m benchmarks.micro
+    python -m benchmarks.micro --filter repo. --rounds 500 --reservations 200000
+    python -m benchmarks.micro --compare benchmarks/results/micro-<stamp>.json
+
+Each benchmark times one call on a fresh session, as a request would make it, over a
+seeded throwaway database. Stats follow pytest-benchmark (min/max/mean/stddev/median, ops/s)
+and are saved to benchmarks/results/ as JSON.
+"""
+import argparse
+import fnmatch
+import itertools
+import os
+import random
+import tempfile
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Any, Callable, Dict, List
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks import results
+from src.shared.infra.db import Base
+from src.payments.application.create_payment import CreatePaymentUseCase
+from src.payments.application.list_payment import ListPaymentsUseCase
+from src.payments.domain.payment import Payment
+from src.payments.infra.payment_model_psql import PaymentModel
+from src.payments.infra.payment_repository_psql import PaymentRepositoryPsql
+from src.reservations.application.cancel_reservation import CancelReservationUseCase, CancelRoomReservationsUseCase
+from src.reservations.application.create_reservation import CreateReservationUseCase
+from src.reservations.application.create_reservation_batch import CreateReservationBatchUseCase
+from src.reservations.application.get_reservation import GetReservationUseCase
+from src.reservations.application.reservation_events import ReservationEvents
+from src.reservations.domain.reservation import Reservation
+from src.reservations.infra.reservation_model_psql import ReservationModel
+from src.reservations.infra.reservation_repository_psql import ReservationRepositoryPsql
+from src.rooms.application.list_room import ListRoomsUseCase
+from src.rooms.application.room_service import RoomService
+from src.rooms.application.search_available_rooms import SearchAvailableRoomsUseCase
+from src.rooms.infra.room_model_psql import RoomModel
+from src.rooms.infra.room_repository_psql import RoomRepositoryPsql
+
+BASE_DATE = date(2026, 1, 1)
+# Writes made by the benchmarks land after the seeded data so they never conflict with it
+WRITE_DATE = date(2040, 1, 1)
+
+
+@dataclass
+class Context:
+    Session: sessionmaker
+    rounds: int
+    room_ids: List[str]
+    reservation_ids: List[str]
+    counter: itertools.count = field(default_factory=itertools.count)
+    rng: random.Random = field(default_factory=lambda: random.Random(42))
+
+    def insert_reservations(self, count: int, per_room: int = 1) -> List[Reservation]:
+        """Seed `count` active reservations in the write window for benchmarks that consume them."""
+        rows = []
+        for _ in range(count):
+            n = next(self.counter)
+            start = WRITE_DATE + timedelta(days=3 * n)
+            rows.append(Reservation(
+                id=str(uuid.uuid4()),
+                room_id=self.room_ids[n % len(self.room_ids)] if per_room == 1 else self.room_ids[0],
+                guest_email=f"bench{n}@example.com",
+                start_date=start,
+                end_date=start + timedelta(days=1),
+            ))
+        with self.Session() as session:
+            session.execute(insert(ReservationModel), [asdict(r) for r in rows])
+            session.commit()
+        return rows
+
+    def next_reservation(self) -> Reservation:
+        n = next(self.counter)
+        start = WRITE_DATE + timedelta(days=3 * n)
+        return Reservation(
+            id=str(uuid.uuid4()),
+            room_id=self.room_ids[n % len(self.room_ids)],
+            guest_email=f"bench{n}@example.com",
+            start_date=start,
+            end_date=start + timedelta(days=1),
+        )
+
+
+BENCHMARKS: Dict[str, Callable[[Context], Callable[[], Any]]] = {}
+
+
+def bench(name: str):
+    """Register a setup function returning the zero-argument callable to time."""
+    def register(setup: Callable[[Context], Callable[[], Any]]):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+def with_session(ctx: Context, fn: Callable[[Any], Any]) -> Callable[[], Any]:
+    def call() -> Any:
+        with ctx.Session() as session:
+            return fn(session)
+    return call
+
+
+# Repositories
+
+@bench("repo.rooms.get_all")
+def _(ctx):
+    return with_session(ctx, lambda s: RoomRepositoryPsql(s).get_all())
+
+
+@bench("repo.rooms.get_by_id")
+def _(ctx):
+    return with_session(ctx, lambda s: RoomRepositoryPsql(s).get_by_id(ctx.rng.choice(ctx.room_ids)))
+
+
+@bench("repo.rooms.get_available")
+def _(ctx):
+    def call(s):
+        start = BASE_DATE + timedelta(days=ctx.rng.randrange(365))
+        return RoomRepositoryPsql(s).get_available(start, start + timedelta(days=3))
+    return with_session(ctx, call)
+
+
+@bench("repo.reservations.get_by_id")
+def _(ctx):
+    return with_session(ctx, lambda s: ReservationRepositoryPsql(s).get_by_id(ctx.rng.choice(ctx.reservation_ids)))
+
+
+@bench("repo.reservations.get_page")
+def _(ctx):
+    return with_session(ctx, lambda s: ReservationRepositoryPsql(s).get_page(100, after_id=ctx.rng.choice(ctx.reservation_ids)))
+
+
+@bench("repo.reservations.get_by_room")
+def _(ctx):
+    return with_session(ctx, lambda s: ReservationRepositoryPsql(s).get_by_room(ctx.rng.choice(ctx.room_ids), limit=100))
+
+
+@bench("repo.reservations.has_overlap")
+def _(ctx):
+    def call(s):
+        start = BASE_DATE + timedelta(days=ctx.rng.randrange(365))
+        return ReservationRepositoryPsql(s).has_overlap(ctx.rng.choice(ctx.room_ids), start, start + timedelta(days=2))
+    return with_session(ctx, call)
+
+
+@bench("repo.reservations.iter_all[1000]")
+def _(ctx):
+    return with_session(ctx, lambda s: list(itertools.islice(ReservationRepositoryPsql(s).iter_all(), 1000)))
+
+
+@bench("repo.reservations.create")
+def _(ctx):
+    return with_session(ctx, lambda s: ReservationRepositoryPsql(s).create(ctx.next_reservation()))
+
+
+@bench("repo.payments.get_page")
+def _(ctx):
+    return with_session(ctx, lambda s: PaymentRepositoryPsql(s).get_page(100))
+
+
+@bench("repo.payments.get_by_reservation_id")
+def _(ctx):
+    return with_session(ctx, lambda s: PaymentRepositoryPsql(s).get_by_reservation_id(ctx.rng.choice(ctx.reservation_ids)))
+
+
+# Use cases (events go to a private publisher so no process-wide subscriber runs)
+
+@bench("usecase.ListRooms")
+def _(ctx):
+    return with_session(ctx, lambda s: ListRoomsUseCase(RoomRepositoryPsql(s)).execute())
+
+
+@bench("usecase.SearchAvailableRooms")
+def _(ctx):
+    def call(s):
+        start = BASE_DATE + timedelta(days=ctx.rng.randrange(365))
+        return SearchAvailableRoomsUseCase(RoomRepositoryPsql(s)).execute(start, start + timedelta(days=3))
+    return with_session(ctx, call)
+
+
+@bench("usecase.GetReservation")
+def _(ctx):
+    return with_session(ctx, lambda s: GetReservationUseCase(ReservationRepositoryPsql(s)).execute(ctx.rng.choice(ctx.reservation_ids)))
+
+
+@bench("usecase.CreateReservation")
+def _(ctx):
+    def call(s):
+        use_case = CreateReservationUseCase(
+            ReservationRepositoryPsql(s), RoomService(RoomRepositoryPsql(s)), events=ReservationEvents()
+        )
+        return use_case.execute(ctx.next_reservation())
+    return with_session(ctx, call)
+
+
+@bench("usecase.CreateReservationBatch[100]")
+def _(ctx):
+    def call(s):
+        use_case = CreateReservationBatchUseCase(
+            ReservationRepositoryPsql(s), RoomService(RoomRepositoryPsql(s)), events=ReservationEvents()
+        )
+        return use_case.execute([ctx.next_reservation() for _ in range(100)])
+    return with_session(ctx, call)
+
+
+@bench("usecase.CancelReservation")
+def _(ctx):
+    targets = iter(ctx.insert_reservations(ctx.rounds + 1))
+    return with_session(
+        ctx, lambda s: CancelReservationUseCase(ReservationRepositoryPsql(s), events=ReservationEvents()).execute(next(targets).id)
+    )
+
+
+@bench("usecase.CancelRoomReservations[10]")
+def _(ctx):
+    # Ten consecutive reservations of one room per window
+    windows = iter([
+        (chunk[0].room_id, chunk[0].start_date, chunk[-1].end_date)
+        for chunk in (lambda rows: [rows[i:i + 10] for i in range(0, len(rows), 10)])(
+            ctx.insert_reservations(10 * (ctx.rounds + 1), per_room=0)
+        )
+    ])
+
+    def call(s):
+        use_case = CancelRoomReservationsUseCase(
+            ReservationRepositoryPsql(s), RoomService(RoomRepositoryPsql(s)), events=ReservationEvents()
+        )
+        return use_case.execute(*next(windows))
+    return with_session(ctx, call)
+
+
+@bench("usecase.CreatePayment")
+def _(ctx):
+    targets = iter(ctx.insert_reservations(ctx.rounds + 1))
+
+    def call(s):
+        payment = Payment(id=str(uuid.uuid4()), reservation_id=next(targets).id, amount=Decimal("100.00"))
+        return CreatePaymentUseCase(PaymentRepositoryPsql(s), ReservationRepositoryPsql(s)).execute(payment)
+    return with_session(ctx, call)
+
+
+@bench("usecase.ListPayments")
+def _(ctx):
+    return with_session(ctx, lambda s: ListPaymentsUseCase(PaymentRepositoryPsql(s)).execute(limit=100))
+
+
+def populate(engine, rooms: int, reservations: int) -> tuple[List[str], List[str]]:
+    room_ids = [str(uuid.UUID(int=i + 1)) for i in range(rooms)]
+    reservation_ids: List[str] = []
+    rng = random.Random(7)
+    with engine.begin() as conn:
+        conn.execute(insert(RoomModel), [
+            {"id": rid, "name": f"room{i}", "price_per_night": 60 + i % 100} for i, rid in enumerate(room_ids)
+        ])
+        batch = []
+        for i in range(reservations):
+            rid = str(uuid.UUID(int=10**9 + i))
+            start = BASE_DATE + timedelta(days=rng.randrange(365))
+            batch.append({
+                "id": rid,
+                "room_id": room_ids[i % rooms],
+                "guest_email": f"guest{i}@example.com",
+                "start_date": start,
+                "end_date": start + timedelta(days=rng.randrange(1, 4)),
+                "status": "active" if i % 10 else "cancelled",
+            })
+            reservation_ids.append(rid)
+            if len(batch) == 50_000:
+                conn.execute(insert(ReservationModel), batch)
+                batch.clear()
+        if batch:
+            conn.execute(insert(ReservationModel), batch)
+        conn.execute(insert(PaymentModel), [
+            {"id": str(uuid.UUID(int=2 * 10**9 + i)), "reservation_id": rid, "amount": 100}
+            for i, rid in enumerate(reservation_ids[::2])
+        ])
+    return room_ids, reservation_ids
+
+
+def measure(call: Callable[[], Any], rounds: int, max_time: float) -> List[float]:
+    call()  # warm-up: statement compilation cache, connection pool
+    samples: List[float] = []
+    deadline = time.perf_counter() + max_time
+    while len(samples) < rounds and (len(samples) < 5 or time.perf_counter() < deadline):
+        started = time.perf_counter()
+        call()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--filter", default="*", help="glob on benchmark names, e.g. 'usecase.*'")
+    parser.add_argument("--rounds", type=int, default=200, help="max timed calls per benchmark")
+    parser.add_argument("--max-time", type=float, default=2.0, help="seconds per benchmark")
+    parser.add_argument("--rooms", type=int, default=200)
+    parser.add_argument("--reservations", type=int, default=50_000)
+    parser.add_argument("--out-dir", default=results.RESULTS_DIR)
+    parser.add_argument("--compare", default=None, help="earlier micro result file")
+    args = parser.parse_args()
+
+    url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'micro.db')}"
+    engine = create_engine(url, future=True, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    room_ids, reservation_ids = populate(engine, args.rooms, args.reservations)
+    ctx = Context(
+        Session=sessionmaker(bind=engine, autoflush=False, expire_on_commit=False, future=True),
+        rounds=args.rounds,
+        room_ids=room_ids,
+        reservation_ids=reservation_ids,
+    )
+    pattern = args.filter if any(c in args.filter for c in "*?[") else f"*{args.filter}*"
+
+    print(f"{args.rooms} rooms, {args.reservations} reservations\n")
+    print(f"{'benchmark':<40}{'min ms':>9}{'median':>9}{'mean':>9}{'stddev':>9}{'max':>9}{'ops/s':>10}{'rounds':>8}")
+    collected = {}
+    for name, setup in BENCHMARKS.items():
+        if not fnmatch.fnmatch(name, pattern):
+            continue
+        stats = results.summarize(measure(setup(ctx), args.rounds, args.max_time))
+        stats["median"] = stats["p50"]
+        stats["ops"] = 1000 / stats["mean"] if stats["mean"] else 0.0
+        collected[name] = stats
+        print(
+            f"{name:<40}{stats['min']:>9.3f}{stats['median']:>9.3f}{stats['mean']:>9.3f}"
+            f"{stats['stddev']:>9.3f}{stats['max']:>9.3f}{stats['ops']:>10.0f}{stats['count']:>8}"
+        )
+
+    path = results.save("micro", {"rooms": args.rooms, "reservations": args.reservations, "benchmarks": collected}, args.out_dir)
+    print(f"\nsaved {path}")
+    if args.compare:
+        results.compare(results.load(args.compare)["results"]["benchmarks"], collected, "median")
+
+
+if __name__ == "__main__":
+    main()
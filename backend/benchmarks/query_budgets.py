@@ -0,0 +1,50 @@
+"""Per-endpoint SQL statement budgets, shared by check_query_budget and tests/test_query_budget.py.
+
+Budgets do not depend on the number of rows (or batch items): an endpoint that starts
+querying per room or per reservation goes over.
+"""
+import itertools
+import uuid
+from datetime import date, timedelta
+
+# (name, max statements, request factory) — factories get the client and a fixture dict
+BUDGETS = [
+    ("GET /rooms", 1, lambda c, f: c.get("/rooms")),
+    ("GET /rooms/{room_id}", 1, lambda c, f: c.get(f"/rooms/{f['room_id']}")),
+    ("GET /rooms/available", 1, lambda c, f: c.get("/rooms/available", params={"from": "2030-01-01", "to": "2030-01-05"})),
+    ("GET /rooms/{room_id}/reservations", 1, lambda c, f: c.get(f"/rooms/{f['room_id']}/reservations")),
+    ("GET /reservations", 1, lambda c, f: c.get("/reservations", params={"limit": 100})),
+    ("GET /reservations/{reservation_id}", 1, lambda c, f: c.get(f"/reservations/{f['reservation_id']}")),
+    ("GET /guests/{guest_email}/reservations", 1, lambda c, f: c.get("/guests/budget@example.com/reservations")),
+    ("GET /payments", 1, lambda c, f: c.get("/payments", params={"limit": 100})),
+    ("GET /reports/occupancy", 2, lambda c, f: c.get("/reports/occupancy", params={"from": "2025-01-01", "to": "2025-12-31"})),
+    ("GET /reports/reconciliation (one month)", 1, lambda c, f: c.get(
+        "/reports/reconciliation", params={"from": "2025-06-01", "to": "2025-06-30"},
+    )),
+    ("POST /reservations", 6, lambda c, f: c.post("/reservations", json=new_reservation(f["room_id"]))),
+    ("POST /reservations/batch (50 items)", 7, lambda c, f: c.post("/reservations/batch", json={
+        "reservations": [new_reservation(f["room_ids"][i % len(f["room_ids"])]) for i in range(50)],
+    })),
+    ("POST /payments", 1, lambda c, f: c.post("/payments", json={
+        "id": str(uuid.uuid4()), "reservation_id": f["reservation_id"], "amount": 10.0,
+    })),
+    ("POST /reservations/{reservation_id}/cancel", 4, lambda c, f: c.post(f"/reservations/{f['reservation_id']}/cancel")),
+    ("POST /rooms/{room_id}/reservations/cancel", 5, lambda c, f: c.post(
+        f"/rooms/{f['room_id']}/reservations/cancel", params={"from": "2000-01-01", "to": "2200-01-01"},
+    )),
+]
+
+
+_stays = itertools.count()
+
+
+def new_reservation(room_id: str) -> dict:
+    # Far-future, non-overlapping stays so every booking succeeds
+    start = date(2100, 1, 1) + timedelta(days=3 * next(_stays))
+    return {
+        "id": str(uuid.uuid4()),
+        "room_id": room_id,
+        "guest_email": "budget@example.com",
+        "start_date": start.isoformat(),
+        "end_date": (start + timedelta(days=1)).isoformat(),
+    }
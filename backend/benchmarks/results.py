@@ -0,0 +1,102 @@
+"""Shared helpers for the benchmark suite: latency summaries and JSON result files.
+
+Result files are written to benchmarks/results/<kind>-<UTC timestamp>.json and carry
+enough metadata (git commit, versions, feature toggles) to compare runs over time:
+
+    python -m benchmarks.micro --compare benchmarks/results/micro-20251025T101500Z.json
+"""
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+from datetime import datetime, timezone
+from typing import Dict, Optional, Sequence
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+# Environment toggles that change what is being measured
+TOGGLES = (
+    "DATABASE_URL",
+    "DATABASE_READ_URL",
+    "ASYNC_DB_ENABLED",
+    "AVAILABILITY_INDEX_ENABLED",
+    "ROOM_CACHE_ENABLED",
+    "FAST_SERIALIZATION_ENABLED",
+    "DB_POOL_SIZE",
+    "DB_MAX_OVERFLOW",
+    "STARTUP_INIT_ENABLED",
+)
+
+
+def percentile(sorted_samples: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile of already sorted samples (q in [0, 100])."""
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, int(round(q / 100 * len(sorted_samples))))
+    return sorted_samples[min(rank, len(sorted_samples)) - 1]
+
+
+def summarize(samples_ms: Sequence[float]) -> Dict[str, float]:
+    ordered = sorted(samples_ms)
+    if not ordered:
+        return {"count": 0}
+    return {
+        "count": len(ordered),
+        "min": ordered[0],
+        "max": ordered[-1],
+        "mean": statistics.fmean(ordered),
+        "stddev": statistics.pstdev(ordered),
+        "p50": percentile(ordered, 50),
+        "p95": percentile(ordered, 95),
+        "p99": percentile(ordered, 99),
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(RESULTS_DIR),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def metadata() -> dict:
+    import sqlalchemy
+
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "sqlalchemy": sqlalchemy.__version__,
+        "platform": platform.platform(),
+        "env": {name: os.environ[name] for name in TOGGLES if name in os.environ},
+    }
+
+
+def save(kind: str, results: dict, out_dir: str = RESULTS_DIR) -> str:
+    os.makedirs(out_dir, exist_ok=True)
+    stamp = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
+    path = os.path.join(out_dir, f"{kind}-{stamp}.json")
+    with open(path, "w") as f:
+        json.dump({"kind": kind, "metadata": metadata(), "results": results}, f, indent=2, sort_keys=True)
+    return path
+
+
+def load(path: str) -> dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare(previous: dict, current: dict, metric: str) -> None:
+    """Print `metric` of every entry present in both result sets, with the relative change."""
+    print(f"\n{'name':<48}{'before':>12}{'after':>12}{'change':>10}")
+    for name, stats in current.items():
+        before = previous.get(name, {}).get(metric)
+        after = stats.get(metric)
+        if not before or after is None:
+            continue
+        print(f"{name:<48}{before:>12.3f}{after:>12.3f}{(after - before) / before:>+10.1%}")
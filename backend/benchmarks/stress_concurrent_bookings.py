@@ -0,0 +1,84 @@
+"""Fire many overlapping bookings concurrently and verify no room gets double-booked.
+
+Usage (from backend/):
+    python -m benchmarks.stress_concurrent_bookings --requests 500 --threads 32
+    DATABASE_URL=postgresql+psycopg2://... python -m benchmarks.stress_concurrent_bookings
+
+Without DATABASE_URL a throwaway SQLite database is used. Requests go through the
+real FastAPI app, so conflicts are checked to surface as 409.
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+if "DATABASE_URL" not in os.environ:
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'stress.db')}"
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+import main  # noqa: E402
+from src.shared.infra.db import SessionLocal  # noqa: E402
+from src.shared.infra.seed import SEED_ROOMS  # noqa: E402
+from src.reservations.infra.reservation_model_psql import ReservationModel  # noqa: E402
+
+
+def count_double_bookings(run_id: str) -> int:
+    with SessionLocal() as session:
+        rows = (
+            session.query(ReservationModel)
+            .filter(ReservationModel.status == "active", ReservationModel.guest_email.like(f"%@{run_id}.test"))
+            .order_by(ReservationModel.room_id, ReservationModel.start_date)
+            .all()
+        )
+    clashes = 0
+    for previous, current in zip(rows, rows[1:]):
+        if previous.room_id == current.room_id and current.start_date <= previous.end_date:
+            clashes += 1
+    return clashes
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--days", type=int, default=30, help="window the bookings are squeezed into")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    run_id = uuid.uuid4().hex[:8]
+    base = date(2030, 1, 1) + timedelta(days=rng.randrange(3000))
+    payloads = []
+    for i in range(args.requests):
+        start = base + timedelta(days=rng.randrange(args.days))
+        payloads.append({
+            "id": str(uuid.uuid4()),
+            "room_id": rng.choice(SEED_ROOMS)["id"],
+            "guest_email": f"guest{i}@{run_id}.test",
+            "start_date": start.isoformat(),
+            "end_date": (start + timedelta(days=rng.randrange(3))).isoformat(),
+        })
+
+    with TestClient(main.app) as client:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.threads) as pool:
+            statuses = Counter(pool.map(lambda p: client.post("/reservations", json=p).status_code, payloads))
+        elapsed = time.perf_counter() - started
+
+    clashes = count_double_bookings(run_id)
+    print(f"requests={args.requests} threads={args.threads} elapsed={elapsed:.2f}s "
+          f"throughput={args.requests / elapsed:.0f} req/s")
+    print(f"status codes: {dict(sorted(statuses.items()))}")
+    print(f"double bookings: {clashes}")
+    if clashes or set(statuses) - {201, 409}:
+        raise SystemExit("FAILED")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,35 @@
+"""Gunicorn settings: `gunicorn -c gunicorn.conf.py main:app` (from backend/).
+
+With preload_app the master imports main:app once and runs the database init once;
+workers are forked with every module already imported, so a new worker serves its first
+request without paying for imports or startup queries.
+"""
+import os
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", "2"))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = os.getenv("GUNICORN_PRELOAD", "1").lower() in ("1", "true", "yes")
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "30"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+
+
+def on_starting(server):
+    if not preload_app:
+        return
+    from src.shared.infra import bootstrap
+    from src.shared.infra.db import dispose_engines
+
+    if bootstrap.startup_init_enabled and not bootstrap.initialized:
+        bootstrap.init_database()
+    # Workers must not share the master's connections
+    dispose_engines()
+
+
+def post_fork(server, worker):
+    if not preload_app:
+        return
+    from src.shared.infra.db import dispose_engines
+
+    # Anything pooled in the master after on_starting belongs to the master: drop it unclosed
+    dispose_engines(close=False)
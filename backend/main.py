@@ -1,30 +1,67 @@
-from typing import  Literal
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from pydantic import BaseModel, Field
-from src.shared.infra.db import SessionLocal, engine, Base, is_sqlite
-from src.shared.infra.seed import seed_initial_rooms
-from api.routes.rooms import router as rooms_router
-from api.routes.reservations import router as reservations_router
-from api.routes.payments import router as payments_router
+from src.shared.infra import bootstrap
+from src.shared.infra.db import async_db_enabled, dispose_async_engines, dispose_engines
+from src.shared.infra.metrics import instrument_use_case
+from src.rooms.application import list_room, search_available_rooms
+from src.reservations.application import cancel_reservation, create_reservation, create_reservation_batch, get_reservation
+from src.payments.application import create_payment, list_payment
+from src.reports.application import occupancy_report
+from src.reservations.infra.room_change_relay import room_change_relay
+from src.shared.infra.query_profiler import db_profiling_enabled
+from api.metrics import MetricsMiddleware
+from api.query_profiling import QueryProfilingMiddleware
+from api.routes.metrics import router as metrics_router
 
-app = FastAPI()
+if async_db_enabled:
+    # Async handlers on AsyncSession: requests do not hold a threadpool slot while waiting on the DB
+    from api.routes.rooms_async import router as rooms_router
+    from api.routes.reservations_async import router as reservations_router
+    from api.routes.payments_async import router as payments_router
+    from api.routes.reports_async import router as reports_router
+else:
+    from api.routes.rooms import router as rooms_router
+    from api.routes.reservations import router as reservations_router
+    from api.routes.payments import router as payments_router
+    from api.routes.reports import router as reports_router
 
 
-class FilterParams(BaseModel):
-    limit: int = Field(100, gt=0, le=100)
-    offset: int = Field(0, ge=0)
-    order_by: Literal["created_at", "updated_at"] = "created_at"
-    tags: list[str] = []
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Schema and seed checks run once per deployment (manage.py init-db or the preloading
+    # gunicorn master); STARTUP_INIT_ENABLED keeps `uvicorn main:app` self-contained for local dev
+    if bootstrap.startup_init_enabled and not bootstrap.initialized:
+        bootstrap.init_database()
+    # Per worker: feeds other workers' bookings to this process's room event stream
+    room_change_relay.start()
+    yield
+    room_change_relay.stop()
+    await dispose_async_engines()
+    dispose_engines()
 
-@app.on_event("startup")
-def on_startup():
-    # For local dev with SQLite, ensure tables exist
-    if is_sqlite:
-        Base.metadata.create_all(bind=engine)
-    # Seed rooms on first start
-    with SessionLocal() as session:
-        seed_initial_rooms(session)
+app = FastAPI(lifespan=lifespan)
+app.add_middleware(MetricsMiddleware)
+if db_profiling_enabled:
+    # Debug only: per-request X-DB-Query-Count / X-DB-Time response headers
+    app.add_middleware(QueryProfilingMiddleware)
+
+# Per-use-case call counters and timings, exposed on /metrics
+for use_case in (
+    list_room.ListRoomsUseCase, list_room.ListRoomsUseCaseAsync,
+    search_available_rooms.SearchAvailableRoomsUseCase, search_available_rooms.SearchAvailableRoomsUseCaseAsync,
+    create_reservation.CreateReservationUseCase, create_reservation.CreateReservationUseCaseAsync,
+    create_reservation_batch.CreateReservationBatchUseCase, create_reservation_batch.CreateReservationBatchUseCaseAsync,
+    cancel_reservation.CancelReservationUseCase, cancel_reservation.CancelReservationUseCaseAsync,
+    cancel_reservation.CancelRoomReservationsUseCase, cancel_reservation.CancelRoomReservationsUseCaseAsync,
+    get_reservation.GetReservationUseCase, get_reservation.GetReservationUseCaseAsync,
+    create_payment.CreatePaymentUseCase, create_payment.CreatePaymentUseCaseAsync,
+    list_payment.ListPaymentsUseCase, list_payment.ListPaymentsUseCaseAsync,
+    occupancy_report.OccupancyReportUseCase, occupancy_report.OccupancyReportUseCaseAsync,
+):
+    instrument_use_case(use_case)
 
 app.include_router(rooms_router)
 app.include_router(reservations_router)
-app.include_router(payments_router)
\ No newline at end of file
+app.include_router(payments_router)
+app.include_router(reports_router)
+app.include_router(metrics_router)
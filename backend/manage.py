@@ -0,0 +1,196 @@
+"""Operational commands for the backend.
+
+Usage (from backend/):
+    python manage.py init-db
+    python manage.py generate-data --rooms 1000 --reservations 10000000 --seed 42
+    python manage.py backfill-occupancy
+    python manage.py check-occupancy
+    python manage.py export-reconciliation --out reconciliation.csv --from 2025-01-01 --to 2025-12-31
+    python manage.py import-csv reservations reservations.csv --rejects rejects.csv
+
+Commands use DATABASE_URL like the API does.
+"""
+import argparse
+import sys
+import time
+from datetime import date
+
+from src.shared.infra.db import Base, engine, is_sqlite
+import src.rooms.infra.room_model_psql  # noqa: F401  (registers the rooms table)
+import src.reservations.infra.reservation_model_psql  # noqa: F401  (registers the reservations table)
+import src.payments.infra.payment_model_psql  # noqa: F401  (registers the payments table)
+import src.reports.infra.occupancy_model_psql  # noqa: F401  (registers the room_day_occupancy table)
+
+
+def init_db(args: argparse.Namespace) -> None:
+    from src.shared.infra.bootstrap import init_database
+
+    started = time.perf_counter()
+    init_database()
+    print(f"database initialized in {time.perf_counter() - started:.2f}s")
+
+
+def generate_data(args: argparse.Namespace) -> None:
+    from src.shared.infra.synthetic_data import GenerationSpec, generate
+
+    if is_sqlite:
+        # Same as API startup: local SQLite databases are not managed by Alembic
+        Base.metadata.create_all(bind=engine)
+    spec = GenerationSpec(
+        rooms=args.rooms,
+        reservations=args.reservations,
+        cancel_ratio=args.cancel_ratio,
+        payment_ratio=args.payment_ratio,
+        seed=args.seed,
+        start_date=args.start_date,
+        mean_gap_days=args.mean_gap_days,
+        batch_size=args.batch_size,
+    )
+    counts = generate(engine, spec)
+    print(
+        f"inserted {counts['rooms']:,} rooms, {counts['reservations']:,} reservations, "
+        f"{counts['payments']:,} payments in {counts['seconds']}s"
+    )
+    if not args.skip_occupancy:
+        # Bulk rows bypass the repositories, so the occupancy rollup is rebuilt afterwards
+        backfill_occupancy(args)
+
+
+def backfill_occupancy(args: argparse.Namespace) -> None:
+    from src.reports.infra.occupancy_rollup import backfill
+
+    if is_sqlite:
+        Base.metadata.create_all(bind=engine)
+    started = time.perf_counter()
+    rows = backfill(engine)
+    print(f"rebuilt room_day_occupancy: {rows:,} rows in {time.perf_counter() - started:.1f}s")
+
+
+def check_occupancy(args: argparse.Namespace) -> None:
+    from src.reports.infra.occupancy_rollup import check
+
+    found, samples = check(engine, limit=args.show)
+    for m in samples:
+        print(f"{m.day} room {m.room_id}: expected {m.expected}, stored {m.actual}")
+    if found:
+        sys.exit(f"room_day_occupancy: {found:,} mismatching room-days; run backfill-occupancy to rebuild")
+    print("room_day_occupancy matches the reservations")
+
+
+def export_reconciliation(args: argparse.Namespace) -> None:
+    from src.reports.infra.reconciliation_export import write_csv, write_parquet
+    from src.reports.infra.reconciliation_repository_psql import ReconciliationRepositoryPsql
+    from src.shared.infra.db import ReadSessionLocal
+
+    if args.date_from and args.date_to and args.date_from > args.date_to:
+        sys.exit("--from must be less than or equal to --to")
+    fmt = args.format or ("parquet" if args.out.endswith(".parquet") else "csv")
+    if fmt == "parquet" and args.out == "-":
+        sys.exit("parquet cannot be written to stdout; pass a file path")
+    started = time.perf_counter()
+    # Straight from the database (the read replica when configured) to the file, chunk by chunk
+    with ReadSessionLocal() as session:
+        rows = ReconciliationRepositoryPsql(session).iter_rows(
+            args.date_from, args.date_to, args.status, chunk_size=args.chunk_size,
+        )
+        try:
+            if fmt == "parquet":
+                written = write_parquet(rows, args.out, rows_per_group=args.chunk_size)
+            elif args.out == "-":
+                written = write_csv(rows, sys.stdout.buffer)
+            else:
+                with open(args.out, "wb") as out:
+                    written = write_csv(rows, out)
+        except RuntimeError as e:
+            sys.exit(str(e))
+    print(f"exported {written:,} rows to {args.out} ({fmt}) in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+
+
+def import_csv(args: argparse.Namespace) -> None:
+    from src.shared.infra.csv_import import import_csv as run_import
+
+    if is_sqlite:
+        Base.metadata.create_all(bind=engine)
+    rejects = args.rejects or f"{args.file}.rejects.csv"
+    checkpoint = args.checkpoint or f"{args.file}.checkpoint.json"
+    try:
+        stats = run_import(
+            args.kind, args.file, rejects, checkpoint, chunk_size=args.chunk_size, restart=args.restart,
+        )
+    except (OSError, ValueError) as e:
+        sys.exit(str(e))
+    if stats.resumed_at_line is not None:
+        print(f"resumed after line {stats.resumed_at_line:,} from {checkpoint}")
+    print(
+        f"{stats.imported:,} {args.kind} imported, {stats.rejected:,} rejected (see {rejects}) "
+        f"from {stats.lines:,} lines in {stats.seconds}s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser(
+        "init-db",
+        help="create local SQLite tables and seed rooms; run once per deployment (after alembic upgrade head)",
+    ).set_defaults(handler=init_db)
+
+    gen = commands.add_parser(
+        "generate-data",
+        help="insert synthetic rooms, non-overlapping reservations and payments (deterministic per seed)",
+    )
+    gen.add_argument("--rooms", type=int, default=1000)
+    gen.add_argument("--reservations", type=int, default=100_000)
+    gen.add_argument("--cancel-ratio", type=float, default=0.1, help="share of reservations cancelled")
+    gen.add_argument("--payment-ratio", type=float, default=0.8, help="share of active reservations paid")
+    gen.add_argument("--seed", type=int, default=42, help="same seed, same rows; use a new seed to add more data")
+    gen.add_argument("--start-date", type=date.fromisoformat, default=date(2025, 1, 1))
+    gen.add_argument("--mean-gap-days", type=float, default=2.0, help="mean free days between stays of a room")
+    gen.add_argument("--batch-size", type=int, default=100_000, help="reservations per transaction")
+    gen.add_argument("--skip-occupancy", action="store_true", help="do not rebuild room_day_occupancy afterwards")
+    gen.set_defaults(handler=generate_data)
+
+    commands.add_parser(
+        "backfill-occupancy",
+        help="rebuild the room_day_occupancy rollup from active reservations (blocks bookings while it runs)",
+    ).set_defaults(handler=backfill_occupancy)
+
+    chk = commands.add_parser(
+        "check-occupancy",
+        help="compare room_day_occupancy with the reservations; exits non-zero on any mismatch",
+    )
+    chk.add_argument("--show", type=int, default=20, help="mismatches to print")
+    chk.set_defaults(handler=check_occupancy)
+
+    exp = commands.add_parser(
+        "export-reconciliation",
+        help="write reservations joined with their payment to a CSV or Parquet file, streamed in chunks",
+    )
+    exp.add_argument("--out", required=True, help="output path; '-' writes CSV to stdout")
+    exp.add_argument("--format", choices=["csv", "parquet"], default=None, help="default: from the --out extension, else csv")
+    exp.add_argument("--from", dest="date_from", type=date.fromisoformat, default=None, help="reservations ending on or after")
+    exp.add_argument("--to", dest="date_to", type=date.fromisoformat, default=None, help="reservations starting on or before")
+    exp.add_argument("--status", default=None, help="only reservations with this status (active, cancelled)")
+    exp.add_argument("--chunk-size", type=int, default=10_000, help="rows fetched per round trip (and per Parquet row group)")
+    exp.set_defaults(handler=export_reconciliation)
+
+    imp = commands.add_parser(
+        "import-csv",
+        help="import reservations or payments from a CSV through the API rules, in chunks; resumable",
+    )
+    imp.add_argument("kind", choices=["reservations", "payments"])
+    imp.add_argument("file", help="CSV with a header row: id,room_id,guest_email,start_date,end_date[,status] "
+                                  "or id,reservation_id,amount")
+    imp.add_argument("--rejects", default=None, help="rejected rows with line and error (default: FILE.rejects.csv)")
+    imp.add_argument("--checkpoint", default=None, help="progress file to resume from (default: FILE.checkpoint.json)")
+    imp.add_argument("--chunk-size", type=int, default=5000, help="rows validated and inserted per transaction")
+    imp.add_argument("--restart", action="store_true", help="ignore the checkpoint and import from the first row")
+    imp.set_defaults(handler=import_csv)
+
+    args = parser.parse_args()
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,22 @@
 from decimal import Decimal
-from typing import Optional
+from typing import NoReturn, Optional
 
 from ..domain.payment import Payment
-from ..domain.payment_repository import PaymentRepository
-from src.reservations.domain.reservation_repository import ReservationRepository
+from ..domain.payment_repository import AsyncPaymentRepository, PaymentRepository
+from src.reservations.domain.reservation import Reservation
+from src.reservations.domain.reservation_repository import AsyncReservationRepository, ReservationRepository
+
+
+def _raise_rejection(reservation: Optional[Reservation], existing: Optional[Payment]) -> NoReturn:
+    # Same checks, in the same order, as the original check-then-insert flow
+    if not reservation:
+        raise ValueError("Reservation does not exist")
+    if str(reservation.status).lower() != "active":
+        raise ValueError("Reservation is not active")
+    if existing:
+        raise ValueError("Payment already exists for this reservation")
+    # Reservation active and unpaid: the insert conflicted on the payment id itself
+    raise ValueError("Payment with this id already exists")
 
 
 class CreatePaymentUseCase:
@@ -12,19 +25,31 @@ class CreatePaymentUseCase:
         self.reservation_repo = reservation_repo
 
     def execute(self, payment: Payment) -> Payment:
-        # Validate reservation exists
-        reservation = self.reservation_repo.get_by_id(payment.reservation_id)
-        if not reservation:
-            raise ValueError("Reservation does not exist")
-        # Validate reservation is active
-        if str(reservation.status).lower() != "active":
-            raise ValueError("Reservation is not active")
-        # Validate payment not already done for this reservation
-        existing: Optional[Payment] = self.payment_repo.get_by_reservation_id(payment.reservation_id)
-        if existing:
-            raise ValueError("Payment already exists for this reservation")
-        # Create payment record
-        created = self.payment_repo.create(
+        # Single round trip: the repository inserts only for an active, unpaid reservation
+        created = self.payment_repo.create_for_active_reservation(
             Payment(id=payment.id, reservation_id=payment.reservation_id, amount=Decimal(str(payment.amount)))
         )
-        return created
\ No newline at end of file
+        if created:
+            return created
+        # Nothing inserted: work out why, off the hot path
+        _raise_rejection(
+            self.reservation_repo.get_by_id(payment.reservation_id),
+            self.payment_repo.get_by_reservation_id(payment.reservation_id),
+        )
+
+
+class CreatePaymentUseCaseAsync:
+    def __init__(self, payment_repo: AsyncPaymentRepository, reservation_repo: AsyncReservationRepository):
+        self.payment_repo = payment_repo
+        self.reservation_repo = reservation_repo
+
+    async def execute(self, payment: Payment) -> Payment:
+        created = await self.payment_repo.create_for_active_reservation(
+            Payment(id=payment.id, reservation_id=payment.reservation_id, amount=Decimal(str(payment.amount)))
+        )
+        if created:
+            return created
+        _raise_rejection(
+            await self.reservation_repo.get_by_id(payment.reservation_id),
+            await self.payment_repo.get_by_reservation_id(payment.reservation_id),
+        )
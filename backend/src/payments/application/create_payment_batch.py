@@ -0,0 +1,70 @@
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Set
+
+from ..domain.payment import Payment
+from ..domain.payment_repository import PaymentRepository
+from src.reservations.domain.reservation_repository import ReservationRepository
+
+
+@dataclass
+class PaymentBatchItemResult:
+    id: str
+    payment: Optional[Payment] = None
+    error: Optional[str] = None
+
+
+def _rejection(status: Optional[str], paid: bool, id_taken: bool) -> Optional[str]:
+    # Same checks, in the same order, as CreatePaymentUseCase (_raise_rejection)
+    if status is None:
+        return "Reservation does not exist"
+    if status.lower() != "active":
+        return "Reservation is not active"
+    if paid:
+        return "Payment already exists for this reservation"
+    if id_taken:
+        return "Payment with this id already exists"
+    return None
+
+
+class CreatePaymentBatchUseCase:
+    """Create many payments with a constant number of queries, reporting a result per item.
+
+    Applies the CreatePaymentUseCase rules to every item, against the stored rows and the
+    items accepted before it in the batch; the accepted payments are inserted together.
+    """
+
+    def __init__(self, payment_repo: PaymentRepository, reservation_repo: ReservationRepository):
+        self.payment_repo = payment_repo
+        self.reservation_repo = reservation_repo
+
+    def execute(self, payments: Sequence[Payment]) -> List[PaymentBatchItemResult]:
+        results = [PaymentBatchItemResult(id=p.id) for p in payments]
+        if not payments:
+            return results
+        reservation_ids = {p.reservation_id for p in payments}
+        statuses = self.reservation_repo.get_statuses(reservation_ids)
+        paid: Set[str] = self.payment_repo.get_paid_reservation_ids(reservation_ids)
+        taken_ids: Set[str] = self.payment_repo.get_existing_ids(p.id for p in payments)
+
+        accepted: List[int] = []
+        for i, payment in enumerate(payments):
+            error = _rejection(
+                statuses.get(payment.reservation_id), payment.reservation_id in paid, payment.id in taken_ids,
+            )
+            if error:
+                results[i].error = error
+                continue
+            paid.add(payment.reservation_id)
+            taken_ids.add(payment.id)
+            accepted.append(i)
+
+        try:
+            created = self.payment_repo.create_many([payments[i] for i in accepted])
+        except ValueError as e:
+            # Lost a race with a concurrent writer: nothing from this batch was stored
+            for i in accepted:
+                results[i].error = str(e)
+            return results
+        for i, payment in zip(accepted, created):
+            results[i].payment = payment
+        return results
@@ -1,10 +1,20 @@
-from typing import List
+from typing import List, Optional
 from ..domain.payment import Payment
-from ..domain.payment_repository import PaymentRepository
+from ..domain.payment_repository import AsyncPaymentRepository, PaymentRepository
 
 class ListPaymentsUseCase:
     def __init__(self, payment_repo: PaymentRepository):
         self.payment_repo = payment_repo
 
-    def execute(self) -> List[Payment]:
-        return list(self.payment_repo.get_all())
\ No newline at end of file
+    def execute(self, limit: Optional[int] = None, after_id: Optional[str] = None) -> List[Payment]:
+        if limit is None:
+            return list(self.payment_repo.get_all())
+        return list(self.payment_repo.get_page(limit, after_id=after_id))
+
+
+class ListPaymentsUseCaseAsync:
+    def __init__(self, payment_repo: AsyncPaymentRepository):
+        self.payment_repo = payment_repo
+
+    async def execute(self, limit: int, after_id: Optional[str] = None) -> List[Payment]:
+        return list(await self.payment_repo.get_page(limit, after_id=after_id))
\ No newline at end of file
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from decimal import Decimal
 
-@dataclass
+@dataclass(slots=True)
 class Payment:
     id: str
     reservation_id: str
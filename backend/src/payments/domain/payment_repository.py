@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Sequence, Optional
+from typing import AsyncIterator, Iterable, Iterator, Sequence, Optional, Set
 from .payment import Payment
 
 class PaymentRepository(ABC):
@@ -7,6 +7,16 @@ class PaymentRepository(ABC):
     def get_all(self) -> Sequence[Payment]:
         raise NotImplementedError
 
+    @abstractmethod
+    def iter_all(self, chunk_size: int = 1000) -> Iterator[Payment]:
+        """Yield every payment ordered by id, reading rows from the database in chunks."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_page(self, limit: int, after_id: Optional[str] = None) -> Sequence[Payment]:
+        """Return up to `limit` payments ordered by id, starting after `after_id` (keyset pagination)."""
+        raise NotImplementedError
+
     @abstractmethod
     def get_by_id(self, payment_id: str) -> Optional[Payment]:
         raise NotImplementedError
@@ -18,4 +28,55 @@ class PaymentRepository(ABC):
     @abstractmethod
     def get_by_reservation_id(self, reservation_id: str) -> Optional[Payment]:
         """Return existing payment for a reservation if any, else None."""
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    @abstractmethod
+    def create_for_active_reservation(self, payment: Payment) -> Optional[Payment]:
+        """Insert the payment only if its reservation is ACTIVE and has no payment yet, atomically.
+
+        Returns None when nothing was inserted.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_existing_ids(self, payment_ids: Iterable[str]) -> Set[str]:
+        """Return which of the given payment ids are already stored, in a single query."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_paid_reservation_ids(self, reservation_ids: Iterable[str]) -> Set[str]:
+        """Return which of the given reservations already have a payment, in a single query."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def create_many(self, payments: Sequence[Payment]) -> Sequence[Payment]:
+        """Insert all payments in one transaction, or none: raises ValueError on a conflict."""
+        raise NotImplementedError
+
+
+class AsyncPaymentRepository(ABC):
+    """asyncio counterpart of PaymentRepository, used by the async request path."""
+
+    @abstractmethod
+    def iter_all(self, chunk_size: int = 1000) -> AsyncIterator[Payment]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_page(self, limit: int, after_id: Optional[str] = None) -> Sequence[Payment]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_by_id(self, payment_id: str) -> Optional[Payment]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def create(self, payment: Payment) -> Payment:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_by_reservation_id(self, reservation_id: str) -> Optional[Payment]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def create_for_active_reservation(self, payment: Payment) -> Optional[Payment]:
+        raise NotImplementedError
@@ -6,5 +6,6 @@ class PaymentModel(Base):
     __tablename__ = "payments"
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, index=True)
-    reservation_id: Mapped[str] = mapped_column(String(36), index=True, nullable=False)
+    # At most one payment per reservation
+    reservation_id: Mapped[str] = mapped_column(String(36), index=True, unique=True, nullable=False)
     amount: Mapped[float] = mapped_column(Numeric(10, 2), nullable=False)
\ No newline at end of file
@@ -1,45 +1,112 @@
-from typing import Sequence, Optional
-from decimal import Decimal
+from itertools import starmap
+from typing import Iterable, Iterator, List, Sequence, Optional, Set
+from sqlalchemy import Numeric, String, cast, exists, insert, literal, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from ..domain.payment import Payment
 from ..domain.payment_repository import PaymentRepository
 from .payment_model_psql import PaymentModel
+from src.reservations.infra.reservation_model_psql import ReservationModel
+
+
+def _to_domain(row: PaymentModel) -> Payment:
+    # Numeric(10, 2) already comes back as a Decimal with two places, on every driver
+    return Payment(id=row.id, reservation_id=row.reservation_id, amount=row.amount)
+
+
+# Read statements select these columns rather than PaymentModel: rows come back as plain
+# tuples, in Payment field order, with no ORM instance or identity map entry per row
+PAYMENT_COLUMNS = (PaymentModel.id, PaymentModel.reservation_id, PaymentModel.amount)
+
+
+def rows_to_domain(rows) -> List[Payment]:
+    return list(starmap(Payment, rows))
+
+
+# Statement builders shared with PaymentRepositoryPsqlAsync
+
+def stream_stmt(chunk_size: int):
+    # yield_per streams through a server-side cursor where the driver supports it,
+    # so only one chunk of rows is held in memory at a time
+    return select(*PAYMENT_COLUMNS).order_by(PaymentModel.id).execution_options(yield_per=chunk_size)
+
+
+def page_stmt(limit: int, after_id: Optional[str] = None):
+    # Keyset pagination on the primary key: seeks straight to the cursor, unlike OFFSET
+    stmt = select(*PAYMENT_COLUMNS)
+    if after_id is not None:
+        stmt = stmt.where(PaymentModel.id > after_id)
+    return stmt.order_by(PaymentModel.id).limit(limit)
+
+
+def by_reservation_stmt(reservation_id: str):
+    return select(*PAYMENT_COLUMNS).where(PaymentModel.reservation_id == reservation_id).limit(1)
+
+
+def existing_ids_stmt(payment_ids: Iterable[str]):
+    return select(PaymentModel.id).where(PaymentModel.id.in_(set(payment_ids)))
+
+
+def paid_reservation_ids_stmt(reservation_ids: Iterable[str]):
+    return select(PaymentModel.reservation_id).where(PaymentModel.reservation_id.in_(set(reservation_ids)))
+
+
+def insert_many_stmt():
+    # Executed with a list of row dicts (executemany): compiled once and cached
+    return insert(PaymentModel.__table__)
+
+
+def create_for_active_reservation_stmt(dialect_name: str, payment: Payment):
+    # INSERT INTO payments SELECT ... FROM reservations WHERE id = :rid AND status = 'active'
+    # AND NOT EXISTS (payment): check and insert in one statement. Under concurrency the unique
+    # index on reservation_id decides, and ON CONFLICT DO NOTHING turns the loser into 0 rows.
+    source = (
+        select(
+            literal(payment.id, String(36)),
+            ReservationModel.id,
+            cast(literal(payment.amount), Numeric(10, 2)),
+        )
+        .where(
+            ReservationModel.id == payment.reservation_id,
+            ReservationModel.status == "active",
+            ~exists().where(PaymentModel.reservation_id == payment.reservation_id),
+        )
+    )
+    insert = postgresql.insert if dialect_name == "postgresql" else sqlite.insert
+    return (
+        insert(PaymentModel)
+        .from_select([PaymentModel.id, PaymentModel.reservation_id, PaymentModel.amount], source)
+        .on_conflict_do_nothing()
+        .returning(*PAYMENT_COLUMNS)
+    )
+
 
 class PaymentRepositoryPsql(PaymentRepository):
     def __init__(self, session: Session):
         self.session = session
 
     def get_all(self) -> Sequence[Payment]:
-        rows = self.session.query(PaymentModel).all()
-        return [
-            Payment(
-                id=row.id,
-                reservation_id=row.reservation_id,
-                amount=Decimal(str(row.amount)),
-            )
-            for row in rows
-        ]
+        return rows_to_domain(self.session.execute(select(*PAYMENT_COLUMNS)))
+
+    def iter_all(self, chunk_size: int = 1000) -> Iterator[Payment]:
+        yield from starmap(Payment, self.session.execute(stream_stmt(chunk_size)))
+
+    def get_page(self, limit: int, after_id: Optional[str] = None) -> Sequence[Payment]:
+        return rows_to_domain(self.session.execute(page_stmt(limit, after_id)))
 
     def get_by_id(self, payment_id: str) -> Optional[Payment]:
         row = self.session.get(PaymentModel, payment_id)
         if not row:
             return None
-        return Payment(
-            id=row.id,
-            reservation_id=row.reservation_id,
-            amount=Decimal(str(row.amount)),
-        )
+        return _to_domain(row)
 
     def get_by_reservation_id(self, reservation_id: str) -> Optional[Payment]:
-        row = self.session.query(PaymentModel).filter(PaymentModel.reservation_id == reservation_id).first()
+        row = self.session.execute(by_reservation_stmt(reservation_id)).first()
         if not row:
             return None
-        return Payment(
-            id=row.id,
-            reservation_id=row.reservation_id,
-            amount=Decimal(str(row.amount)),
-        )
+        return Payment(*row)
 
     def create(self, payment: Payment) -> Payment:
         row = PaymentModel(
@@ -50,8 +117,30 @@ class PaymentRepositoryPsql(PaymentRepository):
         self.session.add(row)
         self.session.flush()
         self.session.commit()
-        return Payment(
-            id=row.id,
-            reservation_id=row.reservation_id,
-            amount=Decimal(str(row.amount)),
-        )
\ No newline at end of file
+        return _to_domain(row)
+
+    def create_for_active_reservation(self, payment: Payment) -> Optional[Payment]:
+        stmt = create_for_active_reservation_stmt(self.session.get_bind().dialect.name, payment)
+        row = self.session.execute(stmt).first()
+        self.session.commit()
+        return Payment(*row) if row else None
+
+    def get_existing_ids(self, payment_ids: Iterable[str]) -> Set[str]:
+        return set(self.session.execute(existing_ids_stmt(payment_ids)).scalars())
+
+    def get_paid_reservation_ids(self, reservation_ids: Iterable[str]) -> Set[str]:
+        return set(self.session.execute(paid_reservation_ids_stmt(reservation_ids)).scalars())
+
+    def create_many(self, payments: Sequence[Payment]) -> Sequence[Payment]:
+        if not payments:
+            return []
+        try:
+            self.session.execute(
+                insert_many_stmt(), [{"id": p.id, "reservation_id": p.reservation_id, "amount": p.amount} for p in payments],
+            )
+            self.session.commit()
+        except IntegrityError:
+            # Lost a race on the payment id or on the one-payment-per-reservation index
+            self.session.rollback()
+            raise ValueError("Payment conflicts with a concurrent write")
+        return list(payments)
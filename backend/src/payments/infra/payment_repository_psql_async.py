@@ -0,0 +1,55 @@
+from typing import AsyncIterator, Sequence, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..domain.payment import Payment
+from ..domain.payment_repository import AsyncPaymentRepository
+from .payment_model_psql import PaymentModel
+from .payment_repository_psql import (
+    _to_domain,
+    by_reservation_stmt,
+    create_for_active_reservation_stmt,
+    page_stmt,
+    rows_to_domain,
+    stream_stmt,
+)
+
+class PaymentRepositoryPsqlAsync(AsyncPaymentRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def iter_all(self, chunk_size: int = 1000) -> AsyncIterator[Payment]:
+        result = await self.session.stream(stream_stmt(chunk_size))
+        async for row in result:
+            yield Payment(*row)
+
+    async def get_page(self, limit: int, after_id: Optional[str] = None) -> Sequence[Payment]:
+        return rows_to_domain(await self.session.execute(page_stmt(limit, after_id)))
+
+    async def get_by_id(self, payment_id: str) -> Optional[Payment]:
+        row = await self.session.get(PaymentModel, payment_id)
+        if not row:
+            return None
+        return _to_domain(row)
+
+    async def get_by_reservation_id(self, reservation_id: str) -> Optional[Payment]:
+        row = (await self.session.execute(by_reservation_stmt(reservation_id))).first()
+        if not row:
+            return None
+        return Payment(*row)
+
+    async def create(self, payment: Payment) -> Payment:
+        row = PaymentModel(
+            id=payment.id,
+            reservation_id=payment.reservation_id,
+            amount=payment.amount,
+        )
+        self.session.add(row)
+        await self.session.flush()
+        await self.session.commit()
+        return _to_domain(row)
+
+    async def create_for_active_reservation(self, payment: Payment) -> Optional[Payment]:
+        stmt = create_for_active_reservation_stmt(self.session.get_bind().dialect.name, payment)
+        row = (await self.session.execute(stmt)).first()
+        await self.session.commit()
+        return Payment(*row) if row else None
@@ -0,0 +1,42 @@
+from datetime import date, timedelta
+from typing import Dict, List
+
+from ..domain.occupancy import DayOccupancy
+from ..domain.occupancy_repository import AsyncOccupancyRepository, OccupancyRepository
+
+MAX_REPORT_DAYS = 366
+
+
+def _validate_window(date_from: date, date_to: date) -> None:
+    if date_from > date_to:
+        raise ValueError("from must be less than or equal to to")
+    if (date_to - date_from).days + 1 > MAX_REPORT_DAYS:
+        raise ValueError(f"report window must not exceed {MAX_REPORT_DAYS} days")
+
+
+def _days(date_from: date, date_to: date, occupied: Dict[date, int], total_rooms: int) -> List[DayOccupancy]:
+    # The rollup has no rows for empty days: fill them in so every day of the window is reported
+    return [
+        DayOccupancy(day=day, occupied_rooms=occupied.get(day, 0), total_rooms=total_rooms)
+        for day in (date_from + timedelta(days=n) for n in range((date_to - date_from).days + 1))
+    ]
+
+
+class OccupancyReportUseCase:
+    def __init__(self, occupancy_repo: OccupancyRepository):
+        self.occupancy_repo = occupancy_repo
+
+    def execute(self, date_from: date, date_to: date) -> List[DayOccupancy]:
+        _validate_window(date_from, date_to)
+        occupied = self.occupancy_repo.get_occupied_rooms(date_from, date_to)
+        return _days(date_from, date_to, occupied, self.occupancy_repo.count_rooms())
+
+
+class OccupancyReportUseCaseAsync:
+    def __init__(self, occupancy_repo: AsyncOccupancyRepository):
+        self.occupancy_repo = occupancy_repo
+
+    async def execute(self, date_from: date, date_to: date) -> List[DayOccupancy]:
+        _validate_window(date_from, date_to)
+        occupied = await self.occupancy_repo.get_occupied_rooms(date_from, date_to)
+        return _days(date_from, date_to, occupied, await self.occupancy_repo.count_rooms())
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from datetime import date
+
+@dataclass
+class DayOccupancy:
+    day: date
+    occupied_rooms: int
+    total_rooms: int
+
+    @property
+    def occupancy_rate(self) -> float:
+        return self.occupied_rooms / self.total_rooms if self.total_rooms else 0.0
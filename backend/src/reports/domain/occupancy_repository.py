@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Dict
+
+
+class OccupancyRepository(ABC):
+    @abstractmethod
+    def get_occupied_rooms(self, date_from: date, date_to: date) -> Dict[date, int]:
+        """Return the number of rooms with an ACTIVE reservation per day of [date_from, date_to].
+
+        Days without any occupied room are omitted.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def count_rooms(self) -> int:
+        raise NotImplementedError
+
+
+class AsyncOccupancyRepository(ABC):
+    """asyncio counterpart of OccupancyRepository, used by the async request path."""
+
+    @abstractmethod
+    async def get_occupied_rooms(self, date_from: date, date_to: date) -> Dict[date, int]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def count_rooms(self) -> int:
+        raise NotImplementedError
@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from typing import Optional
+
+@dataclass(slots=True)
+class ReconciliationRow:
+    """A reservation with its payment; payment_id and amount are None when it is unpaid."""
+    reservation_id: str
+    room_id: str
+    guest_email: str
+    start_date: date
+    end_date: date
+    status: str
+    payment_id: Optional[str]
+    amount: Optional[Decimal]
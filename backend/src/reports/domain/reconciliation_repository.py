@@ -0,0 +1,36 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import AsyncIterator, Iterator, Optional
+
+from .reconciliation import ReconciliationRow
+
+
+class ReconciliationRepository(ABC):
+    @abstractmethod
+    def iter_rows(
+        self,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        status: Optional[str] = None,
+        chunk_size: int = 1000,
+    ) -> Iterator[ReconciliationRow]:
+        """Stream every reservation joined with its payment (if any), ordered by reservation id.
+
+        Optional filters: reservations overlapping [date_from, date_to] (inclusive bounds)
+        and a reservation status. Rows are read `chunk_size` at a time.
+        """
+        raise NotImplementedError
+
+
+class AsyncReconciliationRepository(ABC):
+    """asyncio counterpart of ReconciliationRepository, used by the async request path."""
+
+    @abstractmethod
+    def iter_rows(
+        self,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        status: Optional[str] = None,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[ReconciliationRow]:
+        raise NotImplementedError
@@ -0,0 +1,15 @@
+from datetime import date
+from sqlalchemy import Date, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+from src.shared.infra.db import Base
+
+class RoomDayOccupancyModel(Base):
+    """Rollup of active reservations per room and night, kept in step by the reservation repositories.
+
+    The primary key leads with `day` so date-range reports read a contiguous index range.
+    """
+    __tablename__ = "room_day_occupancy"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    room_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    reservations: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
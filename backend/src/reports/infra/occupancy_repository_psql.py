@@ -0,0 +1,62 @@
+from datetime import date, timedelta
+from typing import Dict, Iterable, List
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from ..domain.occupancy_repository import OccupancyRepository
+from .occupancy_model_psql import RoomDayOccupancyModel
+from src.reservations.domain.reservation import Reservation
+from src.rooms.infra.room_model_psql import RoomModel
+
+occupancy_table = RoomDayOccupancyModel.__table__
+
+
+def occupancy_deltas(reservations: Iterable[Reservation], delta: int) -> List[dict]:
+    """Rollup rows adding `delta` to every night of each stay (start_date..end_date, inclusive)."""
+    return [
+        {"day": r.start_date + timedelta(days=n), "room_id": r.room_id, "reservations": delta}
+        for r in reservations
+        for n in range((r.end_date - r.start_date).days + 1)
+    ]
+
+
+# Statement builders shared with OccupancyRepositoryPsqlAsync and the reservation repositories
+
+def upsert_deltas_stmt(dialect_name: str):
+    # Executed with a list of occupancy_deltas rows (executemany): one round trip per write,
+    # whatever the length of the stays. Rows left at 0 by cancellations are ignored by reports.
+    insert = postgresql.insert if dialect_name == "postgresql" else sqlite.insert
+    stmt = insert(occupancy_table)
+    return stmt.on_conflict_do_update(
+        index_elements=[occupancy_table.c.day, occupancy_table.c.room_id],
+        set_={"reservations": occupancy_table.c.reservations + stmt.excluded.reservations},
+    )
+
+
+def occupied_rooms_stmt(date_from: date, date_to: date):
+    # Touches days x rooms rollup rows, never the reservation history
+    return (
+        select(RoomDayOccupancyModel.day, func.count())
+        .where(
+            RoomDayOccupancyModel.day >= date_from,
+            RoomDayOccupancyModel.day <= date_to,
+            RoomDayOccupancyModel.reservations > 0,
+        )
+        .group_by(RoomDayOccupancyModel.day)
+    )
+
+
+def count_rooms_stmt():
+    return select(func.count()).select_from(RoomModel)
+
+
+class OccupancyRepositoryPsql(OccupancyRepository):
+    def __init__(self, session: Session):
+        self.session = session
+
+    def get_occupied_rooms(self, date_from: date, date_to: date) -> Dict[date, int]:
+        return {day: count for day, count in self.session.execute(occupied_rooms_stmt(date_from, date_to))}
+
+    def count_rooms(self) -> int:
+        return self.session.execute(count_rooms_stmt()).scalar_one()
@@ -0,0 +1,17 @@
+from datetime import date
+from typing import Dict
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..domain.occupancy_repository import AsyncOccupancyRepository
+from .occupancy_repository_psql import count_rooms_stmt, occupied_rooms_stmt
+
+class OccupancyRepositoryPsqlAsync(AsyncOccupancyRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_occupied_rooms(self, date_from: date, date_to: date) -> Dict[date, int]:
+        result = await self.session.execute(occupied_rooms_stmt(date_from, date_to))
+        return {day: count for day, count in result}
+
+    async def count_rooms(self) -> int:
+        return (await self.session.execute(count_rooms_stmt())).scalar_one()
@@ -0,0 +1,121 @@
+"""Rebuild and verify the room_day_occupancy rollup from the reservations table.
+
+The reservation repositories keep the rollup up to date incrementally; these are the
+maintenance operations behind `manage.py backfill-occupancy` and `manage.py check-occupancy`.
+Both read active reservations in one pass ordered by start_date and expand stays in memory
+one day at a time, so memory stays bounded by the stays in progress, not the history size.
+"""
+import itertools
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import delete, insert, select, text
+from sqlalchemy.engine import Connection, Engine
+
+from src.reservations.infra.reservation_model_psql import ReservationModel
+from .occupancy_model_psql import RoomDayOccupancyModel
+from .occupancy_repository_psql import occupancy_table
+
+DayRooms = Dict[str, int]  # room_id -> active reservations that night
+
+BACKFILL_POSTGRES = text(
+    """
+    INSERT INTO room_day_occupancy (day, room_id, reservations)
+    SELECT night::date, room_id, count(*)
+    FROM reservations, generate_series(start_date, end_date, interval '1 day') AS night
+    WHERE status = 'active'
+    GROUP BY 1, 2
+    """
+)
+
+
+@dataclass
+class Mismatch:
+    day: date
+    room_id: str
+    expected: int
+    actual: int
+
+
+def _expected_days(conn: Connection, chunk_size: int = 10_000) -> Iterator[Tuple[date, DayRooms]]:
+    """Yield (day, {room_id: count}) computed from active reservations, in day order."""
+    rows = conn.execution_options(yield_per=chunk_size).execute(
+        select(ReservationModel.room_id, ReservationModel.start_date, ReservationModel.end_date)
+        .where(ReservationModel.status == "active")
+        .order_by(ReservationModel.start_date)
+    )
+    pending: Dict[date, DayRooms] = defaultdict(lambda: defaultdict(int))
+    for room_id, start_date, end_date in rows:
+        # Later rows start on or after start_date, so earlier days can no longer change
+        for day in sorted(day for day in pending if day < start_date):
+            yield day, pending.pop(day)
+        for n in range((end_date - start_date).days + 1):
+            pending[start_date + timedelta(days=n)][room_id] += 1
+    for day in sorted(pending):
+        yield day, pending.pop(day)
+
+
+def _stored_days(conn: Connection, chunk_size: int = 10_000) -> Iterator[Tuple[date, DayRooms]]:
+    rows = conn.execution_options(yield_per=chunk_size).execute(
+        select(RoomDayOccupancyModel.day, RoomDayOccupancyModel.room_id, RoomDayOccupancyModel.reservations)
+        .where(RoomDayOccupancyModel.reservations != 0)
+        .order_by(RoomDayOccupancyModel.day)
+    )
+    for day, day_rows in itertools.groupby(rows, key=lambda row: row[0]):
+        yield day, {room_id: count for _, room_id, count in day_rows}
+
+
+def backfill(engine: Engine, batch_size: int = 10_000) -> int:
+    """Rebuild the rollup from scratch in one transaction; return the number of rows written.
+
+    Bookings are blocked while it runs (SHARE lock on PostgreSQL, the write lock on SQLite),
+    so the rebuilt table matches the reservations it was computed from.
+    """
+    with engine.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            conn.execute(text("LOCK TABLE reservations IN SHARE MODE"))
+            conn.execute(delete(occupancy_table))
+            return conn.execute(BACKFILL_POSTGRES).rowcount
+        conn.execute(delete(occupancy_table))
+        written = 0
+        batch: List[dict] = []
+        for day, rooms in _expected_days(conn):
+            batch.extend({"day": day, "room_id": room_id, "reservations": n} for room_id, n in rooms.items())
+            if len(batch) >= batch_size:
+                conn.execute(insert(occupancy_table), batch)
+                written += len(batch)
+                batch = []
+        if batch:
+            conn.execute(insert(occupancy_table), batch)
+            written += len(batch)
+        return written
+
+
+def check(engine: Engine, limit: Optional[int] = 100) -> Tuple[int, List[Mismatch]]:
+    """Compare the rollup with the reservations; return (mismatch count, first `limit` mismatches)."""
+    found = 0
+    samples: List[Mismatch] = []
+    with engine.connect() as conn:
+        if conn.dialect.name == "postgresql":
+            # One snapshot for both reads, so concurrent bookings cannot show up as mismatches
+            conn = conn.execution_options(isolation_level="REPEATABLE READ")
+        expected, stored = _expected_days(conn), _stored_days(conn)
+        e, s = next(expected, None), next(stored, None)
+        while e is not None or s is not None:
+            if s is None or (e is not None and e[0] < s[0]):
+                day, want, have = e[0], e[1], {}
+                e = next(expected, None)
+            elif e is None or s[0] < e[0]:
+                day, want, have = s[0], {}, s[1]
+                s = next(stored, None)
+            else:
+                day, want, have = e[0], e[1], s[1]
+                e, s = next(expected, None), next(stored, None)
+            for room_id in want.keys() | have.keys():
+                if want.get(room_id, 0) != have.get(room_id, 0):
+                    found += 1
+                    if limit is None or len(samples) < limit:
+                        samples.append(Mismatch(day, room_id, want.get(room_id, 0), have.get(room_id, 0)))
+    return found, samples
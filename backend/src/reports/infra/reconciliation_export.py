@@ -0,0 +1,128 @@
+"""File formats of the reservation/payment reconciliation export.
+
+CSV is produced as a stream of byte chunks, so the same encoder feeds the HTTP response
+(GET /reports/reconciliation) and a local file (`manage.py export-reconciliation`). Parquet
+is written to local files only, one row group per chunk, and needs the optional pyarrow
+package. Amounts keep their exact two-decimal value in both formats.
+"""
+import csv
+import io
+from dataclasses import fields
+from operator import attrgetter
+from typing import AsyncIterable, AsyncIterator, BinaryIO, Iterable, Iterator, List
+
+from ..domain.reconciliation import ReconciliationRow
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # optional dependency: only the parquet format needs it
+    pyarrow = None
+
+COLUMNS = [f.name for f in fields(ReconciliationRow)]
+_values = attrgetter(*COLUMNS)
+
+
+class _CsvChunkEncoder:
+    """csv.writer into a reusable buffer, drained into one bytes chunk per batch of rows."""
+
+    def __init__(self):
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer, lineterminator="\n")
+
+    def header(self) -> bytes:
+        self._writer.writerow(COLUMNS)
+        return self._drain()
+
+    def encode(self, rows: List[ReconciliationRow]) -> bytes:
+        # str() of a date is ISO 8601, of a Decimal its exact value; None becomes an empty field
+        self._writer.writerows(map(_values, rows))
+        return self._drain()
+
+    def _drain(self) -> bytes:
+        chunk = self._buffer.getvalue().encode()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return chunk
+
+
+def csv_chunks(rows: Iterable[ReconciliationRow], rows_per_chunk: int = 1000) -> Iterator[bytes]:
+    encoder = _CsvChunkEncoder()
+    yield encoder.header()
+    batch: List[ReconciliationRow] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= rows_per_chunk:
+            yield encoder.encode(batch)
+            batch.clear()
+    if batch:
+        yield encoder.encode(batch)
+
+
+async def csv_chunks_async(rows: AsyncIterable[ReconciliationRow], rows_per_chunk: int = 1000) -> AsyncIterator[bytes]:
+    encoder = _CsvChunkEncoder()
+    yield encoder.header()
+    batch: List[ReconciliationRow] = []
+    async for row in rows:
+        batch.append(row)
+        if len(batch) >= rows_per_chunk:
+            yield encoder.encode(batch)
+            batch.clear()
+    if batch:
+        yield encoder.encode(batch)
+
+
+def write_csv(rows: Iterable[ReconciliationRow], out: BinaryIO) -> int:
+    """Write the CSV export to a binary file object; return the number of rows written."""
+    written = 0
+
+    def counted() -> Iterator[ReconciliationRow]:
+        nonlocal written
+        for row in rows:
+            written += 1
+            yield row
+
+    for chunk in csv_chunks(counted(), rows_per_chunk=10_000):
+        out.write(chunk)
+    return written
+
+
+def _parquet_schema():
+    return pyarrow.schema([
+        ("reservation_id", pyarrow.string()),
+        ("room_id", pyarrow.string()),
+        ("guest_email", pyarrow.string()),
+        ("start_date", pyarrow.date32()),
+        ("end_date", pyarrow.date32()),
+        ("status", pyarrow.string()),
+        ("payment_id", pyarrow.string()),
+        ("amount", pyarrow.decimal128(10, 2)),
+    ])
+
+
+def write_parquet(rows: Iterable[ReconciliationRow], path: str, rows_per_group: int = 100_000) -> int:
+    """Write the export as a Parquet file, one row group per `rows_per_group` rows; return the row count."""
+    if pyarrow is None:
+        raise RuntimeError("the parquet format requires pyarrow (pip install pyarrow)")
+    schema = _parquet_schema()
+    written = 0
+
+    def table(batch: List[ReconciliationRow]):
+        columns = zip(*map(_values, batch)) if batch else [[] for _ in COLUMNS]
+        return pyarrow.Table.from_arrays(
+            [pyarrow.array(values, type=field.type) for values, field in zip(columns, schema)],
+            schema=schema,
+        )
+
+    with pyarrow.parquet.ParquetWriter(path, schema) as writer:
+        batch: List[ReconciliationRow] = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= rows_per_group:
+                writer.write_table(table(batch))
+                written += len(batch)
+                batch.clear()
+        if batch or not written:
+            writer.write_table(table(batch))
+            written += len(batch)
+    return written
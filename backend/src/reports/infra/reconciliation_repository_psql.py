@@ -0,0 +1,58 @@
+from datetime import date
+from itertools import starmap
+from typing import Iterator, Optional
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ..domain.reconciliation import ReconciliationRow
+from ..domain.reconciliation_repository import ReconciliationRepository
+from src.payments.infra.payment_model_psql import PaymentModel
+from src.reservations.infra.reservation_model_psql import ReservationModel
+
+
+# Statement builder shared with ReconciliationRepositoryPsqlAsync
+
+def reconciliation_stmt(
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    status: Optional[str] = None,
+    chunk_size: int = 1000,
+):
+    # One pass over reservations LEFT JOIN payments: a row per payment, and one with empty
+    # payment columns for unpaid reservations. yield_per streams through a server-side cursor
+    # where the driver supports it, so memory stays flat however many rows are exported.
+    stmt = (
+        select(
+            ReservationModel.id,
+            ReservationModel.room_id,
+            ReservationModel.guest_email,
+            ReservationModel.start_date,
+            ReservationModel.end_date,
+            ReservationModel.status,
+            PaymentModel.id,
+            PaymentModel.amount,
+        )
+        .outerjoin(PaymentModel, PaymentModel.reservation_id == ReservationModel.id)
+    )
+    if status is not None:
+        stmt = stmt.where(ReservationModel.status == status)
+    if date_to is not None:
+        stmt = stmt.where(ReservationModel.start_date <= date_to)
+    if date_from is not None:
+        stmt = stmt.where(ReservationModel.end_date >= date_from)
+    return stmt.order_by(ReservationModel.id).execution_options(yield_per=chunk_size)
+
+
+class ReconciliationRepositoryPsql(ReconciliationRepository):
+    def __init__(self, session: Session):
+        self.session = session
+
+    def iter_rows(
+        self,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        status: Optional[str] = None,
+        chunk_size: int = 1000,
+    ) -> Iterator[ReconciliationRow]:
+        stmt = reconciliation_stmt(date_from, date_to, status, chunk_size)
+        yield from starmap(ReconciliationRow, self.session.execute(stmt))
@@ -0,0 +1,22 @@
+from datetime import date
+from typing import AsyncIterator, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..domain.reconciliation import ReconciliationRow
+from ..domain.reconciliation_repository import AsyncReconciliationRepository
+from .reconciliation_repository_psql import reconciliation_stmt
+
+class ReconciliationRepositoryPsqlAsync(AsyncReconciliationRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def iter_rows(
+        self,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        status: Optional[str] = None,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[ReconciliationRow]:
+        result = await self.session.stream(reconciliation_stmt(date_from, date_to, status, chunk_size))
+        async for row in result:
+            yield ReconciliationRow(*row)
@@ -0,0 +1,161 @@
+import os
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from datetime import date
+from typing import Dict, Iterable, List, Optional
+
+from ..domain.reservation import Reservation
+from .reservation_events import (
+    RESERVATION_CANCELLED,
+    RESERVATION_CREATED,
+    ReservationChange,
+    reservation_changes,
+    reservation_events,
+)
+
+
+class _RoomIntervals:
+    """Active reservations of one room, sorted by start_date.
+
+    `max_end[i]` is the latest end_date among the first i+1 intervals, so an overlap
+    query is a single bisect even if legacy data holds overlapping active ranges.
+    """
+
+    def __init__(self, reservations: Iterable[Reservation]):
+        ordered = sorted(reservations, key=lambda r: (r.start_date, r.id))
+        self.starts: List[date] = [r.start_date for r in ordered]
+        self.ends: List[date] = [r.end_date for r in ordered]
+        self.ids: List[str] = [r.id for r in ordered]
+        self.max_end: List[date] = []
+        self.loaded_at = time.monotonic()
+        self._rebuild_max_end()
+
+    def _rebuild_max_end(self, start: int = 0) -> None:
+        del self.max_end[start:]
+        current = self.max_end[-1] if self.max_end else None
+        for end in self.ends[start:]:
+            current = end if current is None or end > current else current
+            self.max_end.append(current)
+
+    def overlaps(self, start_date: date, end_date: date) -> bool:
+        # Candidates are intervals starting on or before end_date; one of them overlaps
+        # iff the latest end among them reaches start_date.
+        i = bisect_right(self.starts, end_date) - 1
+        return i >= 0 and self.max_end[i] >= start_date
+
+    def add(self, reservation_id: str, start_date: date, end_date: date) -> None:
+        if reservation_id in self.ids:
+            return
+        i = bisect_right(self.starts, start_date)
+        self.starts.insert(i, start_date)
+        self.ends.insert(i, end_date)
+        self.ids.insert(i, reservation_id)
+        self._rebuild_max_end(i)
+
+    def remove(self, reservation_id: str, start_date: date) -> None:
+        i = bisect_left(self.starts, start_date)
+        while i < len(self.starts) and self.starts[i] == start_date:
+            if self.ids[i] == reservation_id:
+                del self.starts[i], self.ends[i], self.ids[i]
+                self._rebuild_max_end(i)
+                return
+            i += 1
+
+
+class AvailabilityIndex:
+    """Per-room sorted intervals of active reservations answering overlap checks in O(log n).
+
+    Rooms are loaded from the database on first use and kept current from reservation
+    events published by this process and, through the change relay, from other workers'
+    changes, which arrive once committed (a poll interval later on SQLite). Rooms are
+    also reloaded after `ttl_seconds`, and all of them are dropped when the relay reports
+    missed changes.
+
+    Every event and invalidation bumps the room's generation. A load passes the generation
+    read before querying the database and is dropped if it changed meanwhile, so a snapshot
+    older than a change it missed is never stored.
+    """
+
+    def __init__(self, ttl_seconds: float = 60.0):
+        self.ttl_seconds = ttl_seconds
+        self._rooms: Dict[str, _RoomIntervals] = {}
+        self._generations: Dict[str, int] = {}
+        # Added to every room's generation, so clear() also voids loads of rooms never seen
+        self._clears = 0
+        self._lock = threading.Lock()
+
+    def is_loaded(self, room_id: str) -> bool:
+        with self._lock:
+            intervals = self._rooms.get(room_id)
+            return intervals is not None and time.monotonic() - intervals.loaded_at < self.ttl_seconds
+
+    def generation(self, room_id: str) -> int:
+        """Read before querying the reservations passed to load()."""
+        with self._lock:
+            return self._clears + self._generations.get(room_id, 0)
+
+    def load(self, room_id: str, reservations: Iterable[Reservation], generation: int) -> bool:
+        """Store the room's active reservations unless the room changed since `generation`; return whether stored."""
+        intervals = _RoomIntervals(r for r in reservations if r.status == "active")
+        with self._lock:
+            if self._clears + self._generations.get(room_id, 0) != generation:
+                return False
+            self._rooms[room_id] = intervals
+            return True
+
+    def invalidate(self, room_id: str) -> None:
+        with self._lock:
+            self._bump(room_id)
+            self._rooms.pop(room_id, None)
+
+    def has_overlap(self, room_id: str, start_date: date, end_date: date) -> Optional[bool]:
+        """Return whether the range overlaps an indexed reservation, or None if the room is not loaded."""
+        with self._lock:
+            intervals = self._rooms.get(room_id)
+            if intervals is None:
+                return None
+            return intervals.overlaps(start_date, end_date)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clears += 1
+            self._rooms.clear()
+
+    def handle_event(self, event: str, reservation: Reservation) -> None:
+        if event != RESERVATION_CREATED or reservation.status == "active":
+            self._apply(event, reservation.room_id, reservation.id, reservation.start_date, reservation.end_date)
+
+    def handle_change(self, change: Optional[ReservationChange]) -> None:
+        if change is None:
+            self.clear()
+        elif not change.local:
+            # This process's own changes were applied from its reservation events already
+            self._apply(change.event, change.room_id, change.reservation_id, change.start_date, change.end_date)
+
+    def _apply(self, event: str, room_id: str, reservation_id: str, start_date: date, end_date: date) -> None:
+        with self._lock:
+            self._bump(room_id)
+            intervals = self._rooms.get(room_id)
+            if intervals is None:
+                return
+            if event == RESERVATION_CREATED:
+                intervals.add(reservation_id, start_date, end_date)
+            elif event == RESERVATION_CANCELLED:
+                intervals.remove(reservation_id, start_date)
+
+    def _bump(self, room_id: str) -> None:
+        self._generations[room_id] = self._generations.get(room_id, 0) + 1
+
+
+def _build_default_index() -> Optional[AvailabilityIndex]:
+    if os.getenv("AVAILABILITY_INDEX_ENABLED", "0").lower() not in ("1", "true", "yes"):
+        return None
+    index = AvailabilityIndex(ttl_seconds=float(os.getenv("AVAILABILITY_INDEX_TTL", "60")))
+    reservation_events.subscribe(index.handle_event)
+    reservation_changes.subscribe(index.handle_change)
+    return index
+
+
+# Process-wide index, enabled with AVAILABILITY_INDEX_ENABLED=1
+availability_index = _build_default_index()
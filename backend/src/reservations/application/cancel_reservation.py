@@ -1,12 +1,84 @@
+from datetime import date
+from typing import Sequence
+
 from ..domain.reservation import Reservation
-from ..domain.reservation_repository import ReservationRepository
+from ..domain.reservation_repository import AsyncReservationRepository, ReservationRepository
+from .reservation_events import RESERVATION_CANCELLED, ReservationEvents, reservation_events
+from src.rooms.application.room_service import RoomService, RoomServiceAsync
+
+
+def _validate_window(room_id: str, date_from: date, date_to: date) -> None:
+    if not room_id:
+        raise ValueError("room_id is required")
+    if date_from > date_to:
+        raise ValueError("from must be less than or equal to to")
+
 
 class CancelReservationUseCase:
-    def __init__(self, reservation_repo: ReservationRepository):
+    def __init__(self, reservation_repo: ReservationRepository, events: ReservationEvents = reservation_events):
         self.reservation_repo = reservation_repo
+        self.events = events
 
     def execute(self, reservation_id: str) -> Reservation:
         if not reservation_id:
             raise ValueError("reservation_id is required")
         updated = self.reservation_repo.cancel(reservation_id)
-        return updated
\ No newline at end of file
+        self.events.publish(RESERVATION_CANCELLED, updated)
+        return updated
+
+
+class CancelReservationUseCaseAsync:
+    def __init__(self, reservation_repo: AsyncReservationRepository, events: ReservationEvents = reservation_events):
+        self.reservation_repo = reservation_repo
+        self.events = events
+
+    async def execute(self, reservation_id: str) -> Reservation:
+        if not reservation_id:
+            raise ValueError("reservation_id is required")
+        updated = await self.reservation_repo.cancel(reservation_id)
+        self.events.publish(RESERVATION_CANCELLED, updated)
+        return updated
+
+
+class CancelRoomReservationsUseCase:
+    """Cancel all active reservations of a room overlapping a date window (e.g. a maintenance closure)."""
+
+    def __init__(
+        self,
+        reservation_repo: ReservationRepository,
+        room_service: RoomService,
+        events: ReservationEvents = reservation_events,
+    ):
+        self.reservation_repo = reservation_repo
+        self.room_service = room_service
+        self.events = events
+
+    def execute(self, room_id: str, date_from: date, date_to: date) -> Sequence[Reservation]:
+        _validate_window(room_id, date_from, date_to)
+        if not self.room_service.exists(room_id):
+            raise ValueError("room does not exist")
+        cancelled = self.reservation_repo.cancel_in_window(room_id, date_from, date_to)
+        for reservation in cancelled:
+            self.events.publish(RESERVATION_CANCELLED, reservation)
+        return cancelled
+
+
+class CancelRoomReservationsUseCaseAsync:
+    def __init__(
+        self,
+        reservation_repo: AsyncReservationRepository,
+        room_service: RoomServiceAsync,
+        events: ReservationEvents = reservation_events,
+    ):
+        self.reservation_repo = reservation_repo
+        self.room_service = room_service
+        self.events = events
+
+    async def execute(self, room_id: str, date_from: date, date_to: date) -> Sequence[Reservation]:
+        _validate_window(room_id, date_from, date_to)
+        if not await self.room_service.exists(room_id):
+            raise ValueError("room does not exist")
+        cancelled = await self.reservation_repo.cancel_in_window(room_id, date_from, date_to)
+        for reservation in cancelled:
+            self.events.publish(RESERVATION_CANCELLED, reservation)
+        return cancelled
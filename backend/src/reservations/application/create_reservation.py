@@ -1,29 +1,132 @@
+from typing import Optional
+
 from ..domain.reservation import Reservation
-from ..domain.reservation_repository import ReservationRepository
-from src.rooms.application.room_service import RoomService
+from ..domain.reservation_repository import AsyncReservationRepository, ReservationRepository
+from .availability_index import AvailabilityIndex
+from .reservation_events import RESERVATION_CREATED, ReservationEvents, reservation_events
+from src.rooms.application.room_service import RoomService, RoomServiceAsync
+
+OVERLAP_ERROR = "Reservation dates overlap with an existing active reservation"
+
+
+def validate_reservation(reservation: Reservation) -> None:
+    # Basic validations
+    if not reservation.room_id:
+        raise ValueError("room_id is required")
+    if not reservation.guest_email:
+        raise ValueError("guest_email is required")
+    if reservation.start_date > reservation.end_date:
+        raise ValueError("start_date must be less than or equal to end_date")
 
 
 class CreateReservationUseCase:
-    def __init__(self, reservation_repo: ReservationRepository, room_service: RoomService):
+    def __init__(
+        self,
+        reservation_repo: ReservationRepository,
+        room_service: RoomService,
+        availability_index: Optional[AvailabilityIndex] = None,
+        events: ReservationEvents = reservation_events,
+    ):
         self.reservation_repo = reservation_repo
         self.room_service = room_service
+        self.availability_index = availability_index
+        self.events = events
 
     def execute(self, reservation: Reservation) -> Reservation:
-        # Basic validations
-        if not reservation.room_id:
-            raise ValueError("room_id is required")
-        if not reservation.guest_email:
-            raise ValueError("guest_email is required")
-        if reservation.start_date > reservation.end_date:
-            raise ValueError("start_date must be less than or equal to end_date")
+        validate_reservation(reservation)
 
         # Verify room exists
         if not self.room_service.exists(reservation.room_id):
             raise ValueError("room does not exist")
 
-        # Check overlapping reservations (active status)
-        if self.reservation_repo.has_overlap(reservation.room_id, reservation.start_date, reservation.end_date):
-            raise ValueError("Reservation dates overlap with an existing active reservation")
+        with self.reservation_repo.lock_rooms([reservation.room_id]):
+            # The in-memory index (when enabled) rejects overlaps on its own. A room it reports
+            # free goes on to the database: create() itself rejects overlaps where the
+            # repository enforces non-overlap (the PostgreSQL exclusion constraint), so the
+            # overlap query only runs where it does not (SQLite)
+            if self._index_overlap(reservation):
+                raise ValueError(OVERLAP_ERROR)
+            if not self.reservation_repo.enforces_non_overlap() and self.reservation_repo.has_overlap(
+                reservation.room_id, reservation.start_date, reservation.end_date
+            ):
+                self._invalidate(reservation)
+                raise ValueError(OVERLAP_ERROR)
+
+            try:
+                created = self.reservation_repo.create(reservation)
+            except ValueError as e:
+                if str(e) == OVERLAP_ERROR:
+                    # A booking the index had not seen yet
+                    self._invalidate(reservation)
+                raise
+        self.events.publish(RESERVATION_CREATED, created)
+        return created
+
+    def _index_overlap(self, reservation: Reservation) -> Optional[bool]:
+        """Index answer for the reservation's range, or None when there is no (loaded) index."""
+        index = self.availability_index
+        if index is None:
+            return None
+        if not index.is_loaded(reservation.room_id):
+            generation = index.generation(reservation.room_id)
+            index.load(
+                reservation.room_id, self.reservation_repo.get_by_room(reservation.room_id, status="active"), generation
+            )
+        return index.has_overlap(reservation.room_id, reservation.start_date, reservation.end_date)
+
+    def _invalidate(self, reservation: Reservation) -> None:
+        if self.availability_index is not None:
+            self.availability_index.invalidate(reservation.room_id)
+
+
+class CreateReservationUseCaseAsync:
+    def __init__(
+        self,
+        reservation_repo: AsyncReservationRepository,
+        room_service: RoomServiceAsync,
+        availability_index: Optional[AvailabilityIndex] = None,
+        events: ReservationEvents = reservation_events,
+    ):
+        self.reservation_repo = reservation_repo
+        self.room_service = room_service
+        self.availability_index = availability_index
+        self.events = events
+
+    async def execute(self, reservation: Reservation) -> Reservation:
+        validate_reservation(reservation)
+
+        if not await self.room_service.exists(reservation.room_id):
+            raise ValueError("room does not exist")
+
+        async with self.reservation_repo.lock_rooms([reservation.room_id]):
+            if await self._index_overlap(reservation):
+                raise ValueError(OVERLAP_ERROR)
+            if not self.reservation_repo.enforces_non_overlap() and await self.reservation_repo.has_overlap(
+                reservation.room_id, reservation.start_date, reservation.end_date
+            ):
+                self._invalidate(reservation)
+                raise ValueError(OVERLAP_ERROR)
+
+            try:
+                created = await self.reservation_repo.create(reservation)
+            except ValueError as e:
+                if str(e) == OVERLAP_ERROR:
+                    self._invalidate(reservation)
+                raise
+        self.events.publish(RESERVATION_CREATED, created)
+        return created
+
+    async def _index_overlap(self, reservation: Reservation) -> Optional[bool]:
+        index = self.availability_index
+        if index is None:
+            return None
+        if not index.is_loaded(reservation.room_id):
+            generation = index.generation(reservation.room_id)
+            index.load(
+                reservation.room_id, await self.reservation_repo.get_by_room(reservation.room_id, status="active"), generation
+            )
+        return index.has_overlap(reservation.room_id, reservation.start_date, reservation.end_date)
 
-        created = self.reservation_repo.create(reservation)
-        return created
\ No newline at end of file
+    def _invalidate(self, reservation: Reservation) -> None:
+        if self.availability_index is not None:
+            self.availability_index.invalidate(reservation.room_id)
@@ -0,0 +1,172 @@
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from ..domain.reservation import Reservation
+from ..domain.reservation_repository import AsyncReservationRepository, ReservationRepository
+from .create_reservation import OVERLAP_ERROR, validate_reservation
+from .reservation_events import RESERVATION_CREATED, ReservationEvents, reservation_events
+from src.rooms.application.room_service import RoomService, RoomServiceAsync
+
+DUPLICATE_ID_ERROR = "Reservation with this id already exists"
+
+
+@dataclass
+class BatchItemResult:
+    id: str
+    reservation: Optional[Reservation] = None
+    error: Optional[str] = None
+
+
+def _validate_items(reservations: Sequence[Reservation]) -> Tuple[List[BatchItemResult], List[int]]:
+    """Apply the single-create validation rules to every item; return results and the indexes still pending."""
+    results = [BatchItemResult(id=r.id) for r in reservations]
+    pending: List[int] = []
+    seen: Set[str] = set()
+    for i, reservation in enumerate(reservations):
+        try:
+            validate_reservation(reservation)
+        except ValueError as e:
+            results[i].error = str(e)
+            continue
+        if reservation.id in seen:
+            results[i].error = DUPLICATE_ID_ERROR
+            continue
+        seen.add(reservation.id)
+        pending.append(i)
+    return results, pending
+
+
+def _reject(results: List[BatchItemResult], pending: List[int], reservations: Sequence[Reservation], predicate, error: str) -> List[int]:
+    kept = []
+    for i in pending:
+        if predicate(reservations[i]):
+            results[i].error = error
+        else:
+            kept.append(i)
+    return kept
+
+
+def _active(reservations: Sequence[Reservation], pending: List[int]) -> List[Reservation]:
+    return [reservations[i] for i in pending if reservations[i].status == "active"]
+
+
+def _resolve_overlaps(
+    results: List[BatchItemResult],
+    pending: List[int],
+    reservations: Sequence[Reservation],
+    active: Sequence[Reservation],
+) -> List[int]:
+    # In batch order: each item is checked against the stored active reservations and the
+    # items accepted before it, so two conflicting items in one batch keep only the first
+    taken: Dict[str, List[Tuple]] = defaultdict(list)
+    for r in active:
+        taken[r.room_id].append((r.start_date, r.end_date))
+    accepted = []
+    for i in pending:
+        r = reservations[i]
+        if r.status != "active":
+            # Imported history: a cancelled stay neither conflicts nor blocks its dates
+            accepted.append(i)
+            continue
+        ranges = taken[r.room_id]
+        if any(start <= r.end_date and end >= r.start_date for start, end in ranges):
+            results[i].error = OVERLAP_ERROR
+            continue
+        ranges.append((r.start_date, r.end_date))
+        accepted.append(i)
+    return accepted
+
+
+class CreateReservationBatchUseCase:
+    """Create many reservations with a constant number of queries, reporting a result per item.
+
+    Items failing validation, referencing a missing room, reusing an id or overlapping an
+    active reservation (stored or earlier in the batch) are rejected individually; the rest
+    are inserted together.
+    """
+
+    def __init__(
+        self,
+        reservation_repo: ReservationRepository,
+        room_service: RoomService,
+        events: ReservationEvents = reservation_events,
+    ):
+        self.reservation_repo = reservation_repo
+        self.room_service = room_service
+        self.events = events
+
+    def execute(self, reservations: Sequence[Reservation]) -> List[BatchItemResult]:
+        results, pending = _validate_items(reservations)
+        if not pending:
+            return results
+
+        rooms = self.room_service.existing({reservations[i].room_id for i in pending})
+        pending = _reject(results, pending, reservations, lambda r: r.room_id not in rooms, "room does not exist")
+        if not pending:
+            return results
+
+        with self.reservation_repo.lock_rooms({reservations[i].room_id for i in pending}):
+            taken_ids = self.reservation_repo.get_existing_ids(reservations[i].id for i in pending)
+            pending = _reject(results, pending, reservations, lambda r: r.id in taken_ids, DUPLICATE_ID_ERROR)
+            if not pending:
+                return results
+
+            active = self.reservation_repo.get_overlapping_active(_active(reservations, pending))
+            accepted = _resolve_overlaps(results, pending, reservations, active)
+            try:
+                created = self.reservation_repo.create_many([reservations[i] for i in accepted])
+            except ValueError as e:
+                # Lost a race with a concurrent writer: nothing from this batch was stored
+                for i in accepted:
+                    results[i].error = str(e)
+                return results
+
+        for i, reservation in zip(accepted, created):
+            results[i].reservation = reservation
+            if reservation.status == "active":
+                self.events.publish(RESERVATION_CREATED, reservation)
+        return results
+
+
+class CreateReservationBatchUseCaseAsync:
+    def __init__(
+        self,
+        reservation_repo: AsyncReservationRepository,
+        room_service: RoomServiceAsync,
+        events: ReservationEvents = reservation_events,
+    ):
+        self.reservation_repo = reservation_repo
+        self.room_service = room_service
+        self.events = events
+
+    async def execute(self, reservations: Sequence[Reservation]) -> List[BatchItemResult]:
+        results, pending = _validate_items(reservations)
+        if not pending:
+            return results
+
+        rooms = await self.room_service.existing({reservations[i].room_id for i in pending})
+        pending = _reject(results, pending, reservations, lambda r: r.room_id not in rooms, "room does not exist")
+        if not pending:
+            return results
+
+        async with self.reservation_repo.lock_rooms({reservations[i].room_id for i in pending}):
+            taken_ids = await self.reservation_repo.get_existing_ids(reservations[i].id for i in pending)
+            pending = _reject(results, pending, reservations, lambda r: r.id in taken_ids, DUPLICATE_ID_ERROR)
+            if not pending:
+                return results
+
+            active = await self.reservation_repo.get_overlapping_active(_active(reservations, pending))
+            accepted = _resolve_overlaps(results, pending, reservations, active)
+            try:
+                created = await self.reservation_repo.create_many([reservations[i] for i in accepted])
+            except ValueError as e:
+                for i in accepted:
+                    results[i].error = str(e)
+                return results
+
+        for i, reservation in zip(accepted, created):
+            results[i].reservation = reservation
+            if reservation.status == "active":
+                self.events.publish(RESERVATION_CREATED, reservation)
+        return results
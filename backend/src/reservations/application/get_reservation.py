@@ -1,5 +1,5 @@
 from ..domain.reservation import Reservation
-from ..domain.reservation_repository import ReservationRepository
+from ..domain.reservation_repository import AsyncReservationRepository, ReservationRepository
 
 
 class GetReservationUseCase:
@@ -8,6 +8,17 @@ class GetReservationUseCase:
 
     def execute(self, reservation_id: str) -> Reservation:
         reservation = self.reservation_repo.get_by_id(reservation_id)
+        if not reservation:
+            raise ValueError("reservation not found")
+        return reservation
+
+
+class GetReservationUseCaseAsync:
+    def __init__(self, reservation_repo: AsyncReservationRepository):
+        self.reservation_repo = reservation_repo
+
+    async def execute(self, reservation_id: str) -> Reservation:
+        reservation = await self.reservation_repo.get_by_id(reservation_id)
         if not reservation:
             raise ValueError("reservation not found")
         return reservation
\ No newline at end of file
@@ -0,0 +1,74 @@
+import logging
+from dataclasses import dataclass
+from datetime import date
+from typing import Callable, List, Optional
+
+from ..domain.reservation import Reservation
+
+logger = logging.getLogger(__name__)
+
+RESERVATION_CREATED = "created"
+RESERVATION_CANCELLED = "cancelled"
+
+Subscriber = Callable[[str, Reservation], None]
+
+
+class ReservationEvents:
+    """In-process publisher notified after a reservation changes a room's active ranges."""
+
+    def __init__(self):
+        self._subscribers: List[Subscriber] = []
+
+    def subscribe(self, subscriber: Subscriber) -> None:
+        self._subscribers.append(subscriber)
+
+    def publish(self, event: str, reservation: Reservation) -> None:
+        # The change is already committed: a failing subscriber must not fail the request
+        for subscriber in self._subscribers:
+            try:
+                subscriber(event, reservation)
+            except Exception:
+                logger.exception("reservation event subscriber failed for %s", event)
+
+
+reservation_events = ReservationEvents()
+
+
+@dataclass(frozen=True, slots=True)
+class ReservationChange:
+    """A committed change read back from the shared change log, made by any worker."""
+    id: int
+    event: str
+    room_id: str
+    reservation_id: str
+    start_date: date
+    end_date: date
+    # Made by this process, whose ReservationEvents subscribers have already seen it
+    local: bool
+
+
+ChangeSubscriber = Callable[[Optional[ReservationChange]], None]
+
+
+class ReservationChanges:
+    """Every worker's committed changes, delivered in commit order by the change relay.
+
+    Subscribers receive None when changes may have been missed (the relay lost its
+    connection) and must drop whatever they derived from earlier changes.
+    """
+
+    def __init__(self):
+        self._subscribers: List[ChangeSubscriber] = []
+
+    def subscribe(self, subscriber: ChangeSubscriber) -> None:
+        self._subscribers.append(subscriber)
+
+    def publish(self, change: Optional[ReservationChange]) -> None:
+        for subscriber in self._subscribers:
+            try:
+                subscriber(change)
+            except Exception:
+                logger.exception("reservation change subscriber failed for %s", change)
+
+
+reservation_changes = ReservationChanges()
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from datetime import date
 
-@dataclass
+@dataclass(slots=True)
 class Reservation:
     id: str
     room_id: str
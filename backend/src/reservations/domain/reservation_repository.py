@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Sequence, Optional
+from contextlib import nullcontext
+from typing import AsyncContextManager, AsyncIterator, ContextManager, Dict, Iterable, Iterator, Sequence, Optional, Set, Tuple
 from datetime import date
 from .reservation import Reservation
 
@@ -8,6 +9,16 @@ class ReservationRepository(ABC):
     def get_all(self) -> Sequence[Reservation]:
         raise NotImplementedError
 
+    @abstractmethod
+    def iter_all(self, chunk_size: int = 1000) -> Iterator[Reservation]:
+        """Yield every reservation ordered by id, reading rows from the database in chunks."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_page(self, limit: int, after_id: Optional[str] = None) -> Sequence[Reservation]:
+        """Return up to `limit` reservations ordered by id, starting after `after_id` (keyset pagination)."""
+        raise NotImplementedError
+
     @abstractmethod
     def get_by_id(self, reservation_id: str) -> Optional[Reservation]:
         raise NotImplementedError
@@ -16,6 +27,57 @@ class ReservationRepository(ABC):
     def create(self, reservation: Reservation) -> Reservation:
         raise NotImplementedError
 
+    @abstractmethod
+    def create_many(self, reservations: Sequence[Reservation]) -> Sequence[Reservation]:
+        """Insert all reservations with one multi-row INSERT and one commit (all or nothing)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_existing_ids(self, reservation_ids: Iterable[str]) -> Set[str]:
+        """Return the subset of reservation_ids already stored, in a single query."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_overlapping_active(self, candidates: Sequence[Reservation]) -> Sequence[Reservation]:
+        """Return stored ACTIVE reservations overlapping any candidate of the same room, in a
+        single set-based query whatever the rooms and dates spanned."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_statuses(self, reservation_ids: Iterable[str]) -> Dict[str, str]:
+        """Return {reservation_id: status} for the stored reservations among reservation_ids, in a single query."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_by_room(
+        self,
+        room_id: str,
+        status: Optional[str] = "active",
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[date, str]] = None,
+    ) -> Sequence[Reservation]:
+        """Return a room's reservations ordered by (start_date, id), up to `limit` and starting
+        after the `after` key (keyset pagination), optionally filtered by status and restricted
+        to those overlapping the [date_from, date_to] window."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_by_guest(
+        self,
+        guest_email: str,
+        status: Optional[str] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        limit: int = 100,
+        after: Optional[Tuple[date, str]] = None,
+    ) -> Sequence[Reservation]:
+        """Return up to `limit` reservations of a guest ordered by (start_date, id), starting after
+        the `after` key (keyset pagination), optionally filtered by status and by overlap with
+        the [date_from, date_to] window."""
+        raise NotImplementedError
+
     @abstractmethod
     def has_overlap(self, room_id: str, start_date: date, end_date: date) -> bool:
         """Return True if there is any ACTIVE reservation overlapping the given range for the room."""
@@ -24,4 +86,94 @@ class ReservationRepository(ABC):
     @abstractmethod
     def cancel(self, reservation_id: str) -> Reservation:
         """Cancel a reservation (only if status is 'active'), returning the updated domain object."""
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    @abstractmethod
+    def cancel_in_window(self, room_id: str, date_from: date, date_to: date) -> Sequence[Reservation]:
+        """Cancel every ACTIVE reservation of the room overlapping [date_from, date_to]; return those cancelled."""
+        raise NotImplementedError
+
+    def lock_rooms(self, room_ids: Iterable[str]) -> ContextManager:
+        """Serialize overlap-check-then-create for the given rooms.
+
+        No-op by default: backends enforcing non-overlap themselves need no lock.
+        """
+        return nullcontext()
+
+    def enforces_non_overlap(self) -> bool:
+        """True when create() itself rejects a reservation overlapping an active one (ValueError)."""
+        return False
+
+
+class AsyncReservationRepository(ABC):
+    """asyncio counterpart of ReservationRepository, used by the async request path."""
+
+    @abstractmethod
+    def iter_all(self, chunk_size: int = 1000) -> AsyncIterator[Reservation]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_page(self, limit: int, after_id: Optional[str] = None) -> Sequence[Reservation]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_by_id(self, reservation_id: str) -> Optional[Reservation]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def create(self, reservation: Reservation) -> Reservation:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def create_many(self, reservations: Sequence[Reservation]) -> Sequence[Reservation]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_existing_ids(self, reservation_ids: Iterable[str]) -> Set[str]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_overlapping_active(self, candidates: Sequence[Reservation]) -> Sequence[Reservation]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_by_room(
+        self,
+        room_id: str,
+        status: Optional[str] = "active",
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[date, str]] = None,
+    ) -> Sequence[Reservation]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_by_guest(
+        self,
+        guest_email: str,
+        status: Optional[str] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        limit: int = 100,
+        after: Optional[Tuple[date, str]] = None,
+    ) -> Sequence[Reservation]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def has_overlap(self, room_id: str, start_date: date, end_date: date) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def cancel(self, reservation_id: str) -> Reservation:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def cancel_in_window(self, room_id: str, date_from: date, date_to: date) -> Sequence[Reservation]:
+        raise NotImplementedError
+
+    def lock_rooms(self, room_ids: Iterable[str]) -> AsyncContextManager:
+        return nullcontext()
+
+    def enforces_non_overlap(self) -> bool:
+        return False
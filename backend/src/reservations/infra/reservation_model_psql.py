@@ -1,14 +1,26 @@
 from datetime import date
-from sqlalchemy import String, Date
+from sqlalchemy import String, Date, Index
 from sqlalchemy.orm import Mapped, mapped_column
 from src.shared.infra.db import Base
 
 class ReservationModel(Base):
     __tablename__ = "reservations"
+    __table_args__ = (
+        Index("ix_reservations_room_id_status_start_date", "room_id", "status", "start_date"),
+        # Guest lookups: equality on guest_email, keyset on (start_date, id); the INCLUDE
+        # columns make it covering on PostgreSQL (index-only scans, no heap fetches)
+        Index(
+            "ix_reservations_guest_email_start_date",
+            "guest_email",
+            "start_date",
+            "id",
+            postgresql_include=["room_id", "end_date", "status"],
+        ),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, index=True)
     room_id: Mapped[str] = mapped_column(String(36), index=True, nullable=False)
-    guest_email: Mapped[str] = mapped_column(String(100), index=True, nullable=False)
+    guest_email: Mapped[str] = mapped_column(String(100), nullable=False)
     start_date: Mapped[date] = mapped_column(Date, nullable=False)
     end_date: Mapped[date] = mapped_column(Date, nullable=False)
-    status: Mapped[str] = mapped_column(String(20), nullable=False, default="active")
\ No newline at end of file
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="active")
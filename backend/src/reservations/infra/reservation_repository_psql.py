@@ -1,57 +1,273 @@
-from typing import Sequence, Optional
+from contextlib import nullcontext
+from itertools import starmap
+from typing import ContextManager, Dict, Iterable, Iterator, List, Sequence, Optional, Set, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import and_, or_
+from sqlalchemy import JSON, Date, String, and_, bindparam, column, func, insert, or_, select, update
+from sqlalchemy.dialects import postgresql
 from datetime import date
 
+from ..application.reservation_events import RESERVATION_CANCELLED, RESERVATION_CREATED
 from ..domain.reservation import Reservation
 from ..domain.reservation_repository import ReservationRepository
 from .reservation_model_psql import ReservationModel
+from .room_change_log import bump_versions_stmt, change_rows, record_changes_stmt, version_bumps
+from src.reports.infra.occupancy_repository_psql import occupancy_deltas, upsert_deltas_stmt
+from src.shared.infra.locks import room_locks
+
+OVERLAP_ERROR = "Reservation dates overlap with an existing active reservation"
+# SQLSTATE raised by Postgres when the ex_reservations_room_active_dates constraint fires
+EXCLUSION_VIOLATION = "23P01"
+
+
+def _to_domain(row: ReservationModel) -> Reservation:
+    return Reservation(
+        id=row.id,
+        room_id=row.room_id,
+        guest_email=row.guest_email,
+        start_date=row.start_date,
+        end_date=row.end_date,
+        status=row.status,
+    )
+
+
+# Read statements select these columns rather than ReservationModel: rows come back as plain
+# tuples, in Reservation field order, with no ORM instance or identity map entry per row
+RESERVATION_COLUMNS = (
+    ReservationModel.id,
+    ReservationModel.room_id,
+    ReservationModel.guest_email,
+    ReservationModel.start_date,
+    ReservationModel.end_date,
+    ReservationModel.status,
+)
+
+
+def rows_to_domain(rows) -> List[Reservation]:
+    return list(starmap(Reservation, rows))
+
+
+def active_overlap(start_date: date, end_date: date):
+    """Filter matching ACTIVE reservations that overlap [start_date, end_date] (inclusive bounds)."""
+    # Overlap condition: existing.start_date <= new.end_date AND existing.end_date >= new.start_date
+    return and_(
+        ReservationModel.status == "active",
+        ReservationModel.start_date <= end_date,
+        ReservationModel.end_date >= start_date,
+    )
+
+
+# Statement builders shared with ReservationRepositoryPsqlAsync
+
+def stream_stmt(chunk_size: int):
+    # yield_per streams through a server-side cursor where the driver supports it,
+    # so only one chunk of rows is held in memory at a time
+    return select(*RESERVATION_COLUMNS).order_by(ReservationModel.id).execution_options(yield_per=chunk_size)
+
+
+def page_stmt(limit: int, after_id: Optional[str] = None):
+    # Keyset pagination on the primary key: seeks straight to the cursor, unlike OFFSET
+    stmt = select(*RESERVATION_COLUMNS)
+    if after_id is not None:
+        stmt = stmt.where(ReservationModel.id > after_id)
+    return stmt.order_by(ReservationModel.id).limit(limit)
+
+
+def after_start_date(after: Tuple[date, str]):
+    """Keyset predicate: rows ordered by (start_date, id) after the `after` key."""
+    after_start, after_id = after
+    return or_(
+        ReservationModel.start_date > after_start,
+        and_(ReservationModel.start_date == after_start, ReservationModel.id > after_id),
+    )
+
+
+def by_room_stmt(
+    room_id: str,
+    status: Optional[str] = "active",
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    limit: Optional[int] = None,
+    after: Optional[Tuple[date, str]] = None,
+):
+    # Served by ix_reservations_room_id_status_start_date (room_id, status, start_date),
+    # seeking to the keyset cursor instead of skipping rows with OFFSET
+    stmt = select(*RESERVATION_COLUMNS).where(ReservationModel.room_id == room_id)
+    if status is not None:
+        stmt = stmt.where(ReservationModel.status == status)
+    if date_to is not None:
+        stmt = stmt.where(ReservationModel.start_date <= date_to)
+    if date_from is not None:
+        stmt = stmt.where(ReservationModel.end_date >= date_from)
+    if after is not None:
+        stmt = stmt.where(after_start_date(after))
+    stmt = stmt.order_by(ReservationModel.start_date, ReservationModel.id)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return stmt
+
+
+def by_guest_stmt(
+    guest_email: str,
+    status: Optional[str] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    limit: int = 100,
+    after: Optional[Tuple[date, str]] = None,
+):
+    # Served by ix_reservations_guest_email_start_date (guest_email, start_date, id): an index
+    # range scan that seeks to the keyset cursor and stops after `limit` rows
+    stmt = select(*RESERVATION_COLUMNS).where(ReservationModel.guest_email == guest_email)
+    if status is not None:
+        stmt = stmt.where(ReservationModel.status == status)
+    if date_to is not None:
+        stmt = stmt.where(ReservationModel.start_date <= date_to)
+    if date_from is not None:
+        stmt = stmt.where(ReservationModel.end_date >= date_from)
+    if after is not None:
+        stmt = stmt.where(after_start_date(after))
+    return stmt.order_by(ReservationModel.start_date, ReservationModel.id).limit(limit)
+
+
+def overlap_stmt(room_id: str, start_date: date, end_date: date):
+    return (
+        select(ReservationModel.id)
+        .where(ReservationModel.room_id == room_id, active_overlap(start_date, end_date))
+        .limit(1)
+    )
+
+
+def existing_ids_stmt(reservation_ids: Iterable[str]):
+    return select(ReservationModel.id).where(ReservationModel.id.in_(set(reservation_ids)))
+
+
+def overlapping_active_stmt(dialect_name: str):
+    # Executed with {"candidates": candidate_ranges(...)}: the ranges travel as one JSON
+    # parameter unpacked by the database, so the statement is compiled once and cached
+    # whatever the number of candidates. Each candidate then joins the active reservations
+    # of its room through ix_reservations_room_id_status_start_date.
+    if dialect_name == "postgresql":
+        ranges = (
+            func.jsonb_to_recordset(bindparam("candidates", type_=postgresql.JSONB))
+            .table_valued(column("room_id", String(36)), column("start_date", Date), column("end_date", Date))
+            .render_derived(name="candidates", with_types=True)
+        )
+    else:
+        rows = func.json_each(bindparam("candidates", type_=JSON)).table_valued("value")
+        ranges = select(*(
+            func.json_extract(rows.c.value, f"$.{name}").label(name) for name in ("room_id", "start_date", "end_date")
+        )).subquery("candidates")
+    return (
+        select(*RESERVATION_COLUMNS)
+        .distinct()
+        .select_from(ReservationModel)
+        .join(ranges, and_(
+            ReservationModel.room_id == ranges.c.room_id,
+            ReservationModel.start_date <= ranges.c.end_date,
+            ReservationModel.end_date >= ranges.c.start_date,
+        ))
+        .where(ReservationModel.status == "active")
+        .order_by(ReservationModel.room_id, ReservationModel.start_date)
+    )
+
+
+def candidate_ranges(candidates: Sequence[Reservation]) -> List[dict]:
+    return [
+        {"room_id": room_id, "start_date": start.isoformat(), "end_date": end.isoformat()}
+        for room_id, start, end in {(r.room_id, r.start_date, r.end_date) for r in candidates}
+    ]
+
+
+def statuses_stmt(reservation_ids: Iterable[str]):
+    return select(ReservationModel.id, ReservationModel.status).where(ReservationModel.id.in_(set(reservation_ids)))
+
+
+def insert_many_stmt():
+    # Executed with insert_many_rows (executemany): compiled once and cached, however many
+    # rows; SQLAlchemy batches them into multi-row INSERTs on PostgreSQL (insertmanyvalues)
+    return insert(ReservationModel.__table__)
+
+
+def insert_many_rows(reservations: Sequence[Reservation]) -> List[dict]:
+    return [
+        {
+            "id": r.id,
+            "room_id": r.room_id,
+            "guest_email": r.guest_email,
+            "start_date": r.start_date,
+            "end_date": r.end_date,
+            "status": r.status,
+        }
+        for r in reservations
+    ]
+
+
+def cancel_stmt(*criteria):
+    # Conditional UPDATE ... RETURNING: the status check and the write are one atomic statement
+    return (
+        update(ReservationModel)
+        .where(ReservationModel.status == "active", *criteria)
+        .values(status="cancelled")
+        .returning(*RESERVATION_COLUMNS)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def cancel_error(existing: Optional[Reservation]) -> str:
+    return "reservation not found" if existing is None else "reservation is not active"
+
+
+def integrity_error_message(e: IntegrityError) -> str:
+    if getattr(e.orig, "pgcode", None) == EXCLUSION_VIOLATION:
+        return OVERLAP_ERROR
+    return "Reservation with this id already exists"
+
 
 class ReservationRepositoryPsql(ReservationRepository):
     def __init__(self, session: Session):
         self.session = session
 
     def get_all(self) -> Sequence[Reservation]:
-        rows = self.session.query(ReservationModel).all()
-        return [
-            Reservation(
-                id=row.id,
-                room_id=row.room_id,
-                guest_email=row.guest_email,
-                start_date=row.start_date,
-                end_date=row.end_date,
-                status=row.status,
-            )
-            for row in rows
-        ]
+        return rows_to_domain(self.session.execute(select(*RESERVATION_COLUMNS)))
+
+    def iter_all(self, chunk_size: int = 1000) -> Iterator[Reservation]:
+        yield from starmap(Reservation, self.session.execute(stream_stmt(chunk_size)))
+
+    def get_page(self, limit: int, after_id: Optional[str] = None) -> Sequence[Reservation]:
+        return rows_to_domain(self.session.execute(page_stmt(limit, after_id)))
 
     def get_by_id(self, reservation_id: str) -> Optional[Reservation]:
         row = self.session.get(ReservationModel, reservation_id)
         if not row:
             return None
-        return Reservation(
-            id=row.id,
-            room_id=row.room_id,
-            guest_email=row.guest_email,
-            start_date=row.start_date,
-            end_date=row.end_date,
-            status=row.status,
-        )
+        return _to_domain(row)
+
+    def get_by_room(
+        self,
+        room_id: str,
+        status: Optional[str] = "active",
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[date, str]] = None,
+    ) -> Sequence[Reservation]:
+        stmt = by_room_stmt(room_id, status, date_from, date_to, limit, after)
+        return rows_to_domain(self.session.execute(stmt))
+
+    def get_by_guest(
+        self,
+        guest_email: str,
+        status: Optional[str] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        limit: int = 100,
+        after: Optional[Tuple[date, str]] = None,
+    ) -> Sequence[Reservation]:
+        stmt = by_guest_stmt(guest_email, status, date_from, date_to, limit, after)
+        return rows_to_domain(self.session.execute(stmt))
 
     def has_overlap(self, room_id: str, start_date: date, end_date: date) -> bool:
-        # Overlap condition: existing.start_date <= new.end_date AND existing.end_date >= new.start_date
-        exists = (
-            self.session.query(ReservationModel)
-            .filter(
-                ReservationModel.room_id == room_id,
-                ReservationModel.status == "active",
-                ReservationModel.start_date <= end_date,
-                ReservationModel.end_date >= start_date,
-            )
-            .first()
-        )
-        return exists is not None
+        return self.session.execute(overlap_stmt(room_id, start_date, end_date)).first() is not None
 
     def create(self, reservation: Reservation) -> Reservation:
         row = ReservationModel(
@@ -65,33 +281,84 @@ class ReservationRepositoryPsql(ReservationRepository):
         self.session.add(row)
         try:
             self.session.flush()
+            self._record_occupancy([reservation], 1)
+            self._record_changes(RESERVATION_CREATED, [reservation])
             self.session.commit()
-        except IntegrityError:
+        except IntegrityError as e:
             self.session.rollback()
-            raise ValueError("Reservation with this id already exists")
-        return Reservation(
-            id=row.id,
-            room_id=row.room_id,
-            guest_email=row.guest_email,
-            start_date=row.start_date,
-            end_date=row.end_date,
-            status=row.status,
-        )
+            raise ValueError(integrity_error_message(e))
+        return _to_domain(row)
+
+    def create_many(self, reservations: Sequence[Reservation]) -> Sequence[Reservation]:
+        if not reservations:
+            return []
+        try:
+            self.session.execute(insert_many_stmt(), insert_many_rows(reservations))
+            # Imported history may include cancelled stays, which occupy nothing
+            active = [r for r in reservations if r.status == "active"]
+            self._record_occupancy(active, 1)
+            self._record_changes(RESERVATION_CREATED, active)
+            self.session.commit()
+        except IntegrityError as e:
+            self.session.rollback()
+            raise ValueError(integrity_error_message(e))
+        return list(reservations)
+
+    def get_existing_ids(self, reservation_ids: Iterable[str]) -> Set[str]:
+        return set(self.session.execute(existing_ids_stmt(reservation_ids)).scalars())
+
+    def get_overlapping_active(self, candidates: Sequence[Reservation]) -> Sequence[Reservation]:
+        if not candidates:
+            return []
+        stmt = overlapping_active_stmt(self.session.get_bind().dialect.name)
+        return rows_to_domain(self.session.execute(stmt, {"candidates": candidate_ranges(candidates)}))
+
+    def get_statuses(self, reservation_ids: Iterable[str]) -> Dict[str, str]:
+        return dict(self.session.execute(statuses_stmt(reservation_ids)).all())
+
+    def lock_rooms(self, room_ids: Iterable[str]) -> ContextManager:
+        # Postgres enforces non-overlap with an exclusion constraint: no lock needed.
+        # SQLite cannot, so check-then-insert is serialized per room within the process.
+        if self.session.get_bind().dialect.name == "sqlite":
+            return room_locks.hold(room_ids)
+        return nullcontext()
+
+    def enforces_non_overlap(self) -> bool:
+        # The exclusion constraint (see lock_rooms) makes create() raise OVERLAP_ERROR
+        return self.session.get_bind().dialect.name == "postgresql"
 
     def cancel(self, reservation_id: str) -> Reservation:
-        row = self.session.get(ReservationModel, reservation_id)
+        row = self.session.execute(cancel_stmt(ReservationModel.id == reservation_id)).first()
         if not row:
-            raise ValueError("reservation not found")
-        if row.status != "active":
-            raise ValueError("reservation is not active")
-        row.status = "cancelled"
-        self.session.flush()
+            self.session.commit()
+            # Nothing updated: a second read only to tell "missing" from "not active"
+            raise ValueError(cancel_error(self.get_by_id(reservation_id)))
+        cancelled = Reservation(*row)
+        self._record_occupancy([cancelled], -1)
+        self._record_changes(RESERVATION_CANCELLED, [cancelled])
         self.session.commit()
-        return Reservation(
-            id=row.id,
-            room_id=row.room_id,
-            guest_email=row.guest_email,
-            start_date=row.start_date,
-            end_date=row.end_date,
-            status=row.status,
-        )
\ No newline at end of file
+        return cancelled
+
+    def cancel_in_window(self, room_id: str, date_from: date, date_to: date) -> Sequence[Reservation]:
+        rows = self.session.execute(
+            cancel_stmt(ReservationModel.room_id == room_id, active_overlap(date_from, date_to))
+        ).all()
+        cancelled = rows_to_domain(rows)
+        self._record_occupancy(cancelled, -1)
+        self._record_changes(RESERVATION_CANCELLED, cancelled)
+        self.session.commit()
+        return cancelled
+
+    def _record_occupancy(self, reservations: Sequence[Reservation], delta: int) -> None:
+        # room_day_occupancy is updated in the same transaction as the reservations it counts
+        if reservations:
+            dialect_name = self.session.get_bind().dialect.name
+            self.session.execute(upsert_deltas_stmt(dialect_name), occupancy_deltas(reservations, delta))
+
+    def _record_changes(self, event: str, reservations: Sequence[Reservation]) -> None:
+        # Logged, and the rooms' versions bumped, in the changing transaction: other workers'
+        # change relays and room caches see it once committed
+        if reservations:
+            self.session.execute(record_changes_stmt(), change_rows(event, reservations))
+            dialect_name = self.session.get_bind().dialect.name
+            self.session.execute(bump_versions_stmt(dialect_name), version_bumps(reservations))
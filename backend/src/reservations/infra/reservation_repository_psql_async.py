@@ -0,0 +1,162 @@
+from contextlib import nullcontext
+from typing import AsyncContextManager, AsyncIterator, Iterable, Sequence, Optional, Set, Tuple
+from datetime import date
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..application.reservation_events import RESERVATION_CANCELLED, RESERVATION_CREATED
+from ..domain.reservation import Reservation
+from ..domain.reservation_repository import AsyncReservationRepository
+from .reservation_model_psql import ReservationModel
+from .reservation_repository_psql import (
+    _to_domain,
+    rows_to_domain,
+    active_overlap,
+    by_guest_stmt,
+    by_room_stmt,
+    cancel_error,
+    cancel_stmt,
+    candidate_ranges,
+    existing_ids_stmt,
+    insert_many_rows,
+    insert_many_stmt,
+    integrity_error_message,
+    overlap_stmt,
+    overlapping_active_stmt,
+    page_stmt,
+    stream_stmt,
+)
+from .room_change_log import bump_versions_stmt, change_rows, record_changes_stmt, version_bumps
+from src.reports.infra.occupancy_repository_psql import occupancy_deltas, upsert_deltas_stmt
+from src.shared.infra.locks import async_room_locks
+
+class ReservationRepositoryPsqlAsync(AsyncReservationRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def iter_all(self, chunk_size: int = 1000) -> AsyncIterator[Reservation]:
+        result = await self.session.stream(stream_stmt(chunk_size))
+        async for row in result:
+            yield Reservation(*row)
+
+    async def get_page(self, limit: int, after_id: Optional[str] = None) -> Sequence[Reservation]:
+        return rows_to_domain(await self.session.execute(page_stmt(limit, after_id)))
+
+    async def get_by_id(self, reservation_id: str) -> Optional[Reservation]:
+        row = await self.session.get(ReservationModel, reservation_id)
+        if not row:
+            return None
+        return _to_domain(row)
+
+    async def get_by_room(
+        self,
+        room_id: str,
+        status: Optional[str] = "active",
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[date, str]] = None,
+    ) -> Sequence[Reservation]:
+        stmt = by_room_stmt(room_id, status, date_from, date_to, limit, after)
+        return rows_to_domain(await self.session.execute(stmt))
+
+    async def get_by_guest(
+        self,
+        guest_email: str,
+        status: Optional[str] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        limit: int = 100,
+        after: Optional[Tuple[date, str]] = None,
+    ) -> Sequence[Reservation]:
+        stmt = by_guest_stmt(guest_email, status, date_from, date_to, limit, after)
+        return rows_to_domain(await self.session.execute(stmt))
+
+    async def has_overlap(self, room_id: str, start_date: date, end_date: date) -> bool:
+        result = await self.session.execute(overlap_stmt(room_id, start_date, end_date))
+        return result.first() is not None
+
+    async def create(self, reservation: Reservation) -> Reservation:
+        row = ReservationModel(
+            id=reservation.id,
+            room_id=reservation.room_id,
+            guest_email=reservation.guest_email,
+            start_date=reservation.start_date,
+            end_date=reservation.end_date,
+            status=reservation.status,
+        )
+        self.session.add(row)
+        try:
+            await self.session.flush()
+            await self._record_occupancy([reservation], 1)
+            await self._record_changes(RESERVATION_CREATED, [reservation])
+            await self.session.commit()
+        except IntegrityError as e:
+            await self.session.rollback()
+            raise ValueError(integrity_error_message(e))
+        return _to_domain(row)
+
+    async def create_many(self, reservations: Sequence[Reservation]) -> Sequence[Reservation]:
+        if not reservations:
+            return []
+        try:
+            await self.session.execute(insert_many_stmt(), insert_many_rows(reservations))
+            active = [r for r in reservations if r.status == "active"]
+            await self._record_occupancy(active, 1)
+            await self._record_changes(RESERVATION_CREATED, active)
+            await self.session.commit()
+        except IntegrityError as e:
+            await self.session.rollback()
+            raise ValueError(integrity_error_message(e))
+        return list(reservations)
+
+    async def get_existing_ids(self, reservation_ids: Iterable[str]) -> Set[str]:
+        return set((await self.session.execute(existing_ids_stmt(reservation_ids))).scalars())
+
+    async def get_overlapping_active(self, candidates: Sequence[Reservation]) -> Sequence[Reservation]:
+        if not candidates:
+            return []
+        stmt = overlapping_active_stmt(self.session.get_bind().dialect.name)
+        return rows_to_domain(await self.session.execute(stmt, {"candidates": candidate_ranges(candidates)}))
+
+    def lock_rooms(self, room_ids: Iterable[str]) -> AsyncContextManager:
+        # Same policy as ReservationRepositoryPsql.lock_rooms, without blocking the event loop
+        if self.session.get_bind().dialect.name == "sqlite":
+            return async_room_locks.hold(room_ids)
+        return nullcontext()
+
+    def enforces_non_overlap(self) -> bool:
+        # The exclusion constraint (see lock_rooms) makes create() raise OVERLAP_ERROR
+        return self.session.get_bind().dialect.name == "postgresql"
+
+    async def cancel(self, reservation_id: str) -> Reservation:
+        row = (await self.session.execute(cancel_stmt(ReservationModel.id == reservation_id))).first()
+        if not row:
+            await self.session.commit()
+            raise ValueError(cancel_error(await self.get_by_id(reservation_id)))
+        cancelled = Reservation(*row)
+        await self._record_occupancy([cancelled], -1)
+        await self._record_changes(RESERVATION_CANCELLED, [cancelled])
+        await self.session.commit()
+        return cancelled
+
+    async def cancel_in_window(self, room_id: str, date_from: date, date_to: date) -> Sequence[Reservation]:
+        result = await self.session.execute(
+            cancel_stmt(ReservationModel.room_id == room_id, active_overlap(date_from, date_to))
+        )
+        cancelled = rows_to_domain(result)
+        await self._record_occupancy(cancelled, -1)
+        await self._record_changes(RESERVATION_CANCELLED, cancelled)
+        await self.session.commit()
+        return cancelled
+
+    async def _record_occupancy(self, reservations: Sequence[Reservation], delta: int) -> None:
+        if reservations:
+            dialect_name = self.session.get_bind().dialect.name
+            await self.session.execute(upsert_deltas_stmt(dialect_name), occupancy_deltas(reservations, delta))
+
+    async def _record_changes(self, event: str, reservations: Sequence[Reservation]) -> None:
+        if reservations:
+            await self.session.execute(record_changes_stmt(), change_rows(event, reservations))
+            dialect_name = self.session.get_bind().dialect.name
+            await self.session.execute(bump_versions_stmt(dialect_name), version_bumps(reservations))
@@ -0,0 +1,126 @@
+"""Statements on the room_changes log and the room_versions counters, shared by both
+reservation repositories, the room repositories and the change relay.
+
+Ids follow insertion, not commit order, on PostgreSQL: readers there take changes from
+NOTIFY, which is delivered in commit order, and only SQLite (one writer at a time) is
+read back by id.
+"""
+import json
+import os
+import socket
+from collections import Counter
+from datetime import date
+from typing import List, Optional, Sequence
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+
+from ..application.reservation_events import ReservationChange
+from ..domain.reservation import Reservation
+from .room_change_model_psql import RoomChangeModel
+from .room_version_model_psql import RoomVersionModel
+
+version_table = RoomVersionModel.__table__
+
+# NOTIFY channel of the room_changes insert trigger (see its Alembic migration)
+CHANNEL = "room_changes"
+
+CHANGE_COLUMNS = (
+    RoomChangeModel.id,
+    RoomChangeModel.event,
+    RoomChangeModel.room_id,
+    RoomChangeModel.reservation_id,
+    RoomChangeModel.start_date,
+    RoomChangeModel.end_date,
+    RoomChangeModel.origin,
+)
+
+
+def process_origin() -> str:
+    # Not cached at import: gunicorn forks the workers from a preloaded master
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def record_changes_stmt():
+    # Executed with change_rows (executemany): one round trip whatever the number of rows
+    return insert(RoomChangeModel.__table__)
+
+
+def change_rows(event: str, reservations: Sequence[Reservation]) -> List[dict]:
+    origin = process_origin()
+    return [
+        {
+            "room_id": r.room_id,
+            "reservation_id": r.id,
+            "event": event,
+            "start_date": r.start_date,
+            "end_date": r.end_date,
+            "origin": origin,
+        }
+        for r in reservations
+    ]
+
+
+def bump_versions_stmt(dialect_name: str):
+    # Executed with version_bumps (executemany). On PostgreSQL the upsert locks the room's
+    # row until commit, so a room's versions are taken in commit order
+    insert = postgresql.insert if dialect_name == "postgresql" else sqlite.insert
+    stmt = insert(version_table)
+    return stmt.on_conflict_do_update(
+        index_elements=[version_table.c.room_id],
+        set_={"version": version_table.c.version + stmt.excluded.version},
+    )
+
+
+def version_bumps(reservations: Sequence[Reservation]) -> List[dict]:
+    # Sorted by room so concurrent multi-room writes lock the rows in the same order
+    counts = Counter(r.room_id for r in reservations)
+    return [{"room_id": room_id, "version": count} for room_id, count in sorted(counts.items())]
+
+
+def version_stmt(room_id: Optional[str] = None):
+    """Version of one room, or the sum over all rooms: it changes with any room's."""
+    if room_id is None:
+        return select(func.coalesce(func.sum(RoomVersionModel.version), 0))
+    return select(func.coalesce(func.max(RoomVersionModel.version), 0)).where(RoomVersionModel.room_id == room_id)
+
+
+def last_change_stmt():
+    return select(func.max(RoomChangeModel.id))
+
+
+def changes_after_stmt(after_id: int, limit: int):
+    return select(*CHANGE_COLUMNS).where(RoomChangeModel.id > after_id).order_by(RoomChangeModel.id).limit(limit)
+
+
+def prune_stmt(retain: int):
+    # Keeps the newest `retain` ids: enough for a relay that was briefly busy to catch up
+    newest = select(func.max(RoomChangeModel.id)).scalar_subquery()
+    return delete(RoomChangeModel).where(RoomChangeModel.id <= newest - retain)
+
+
+def to_change(row) -> ReservationChange:
+    """Change from a changes_after_stmt row."""
+    return ReservationChange(
+        id=row.id,
+        event=row.event,
+        room_id=row.room_id,
+        reservation_id=row.reservation_id,
+        start_date=row.start_date,
+        end_date=row.end_date,
+        local=row.origin == process_origin(),
+    )
+
+
+def notification_to_change(payload: str) -> ReservationChange:
+    """Change from a NOTIFY payload: the inserted row as JSON (row_to_json)."""
+    row = json.loads(payload)
+    return ReservationChange(
+        id=row["id"],
+        event=row["event"],
+        room_id=row["room_id"],
+        reservation_id=row["reservation_id"],
+        start_date=date.fromisoformat(row["start_date"]),
+        end_date=date.fromisoformat(row["end_date"]),
+        local=row["origin"] == process_origin(),
+    )
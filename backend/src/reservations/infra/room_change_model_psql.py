@@ -0,0 +1,22 @@
+from datetime import date
+from sqlalchemy import BigInteger, Date, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+from src.shared.infra.db import Base
+
+class RoomChangeModel(Base):
+    """Log of committed reservation changes, written by the reservation repositories in the
+    transaction that makes the change and read back by every worker's change relay.
+
+    AUTOINCREMENT on SQLite: ids of pruned rows are never handed out again.
+    """
+    __tablename__ = "room_changes"
+    __table_args__ = {"sqlite_autoincrement": True}
+
+    id: Mapped[int] = mapped_column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    room_id: Mapped[str] = mapped_column(String(36), nullable=False)
+    reservation_id: Mapped[str] = mapped_column(String(36), nullable=False)
+    event: Mapped[str] = mapped_column(String(20), nullable=False)
+    start_date: Mapped[date] = mapped_column(Date, nullable=False)
+    end_date: Mapped[date] = mapped_column(Date, nullable=False)
+    # host:pid of the writing process, so a relay can tell its own process's changes apart
+    origin: Mapped[str] = mapped_column(String(100), nullable=False)
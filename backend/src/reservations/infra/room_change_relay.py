@@ -0,0 +1,143 @@
+"""Relays the shared room_changes log to this process's reservation_changes subscribers.
+
+One daemon thread per worker, started by the app lifespan. On PostgreSQL it LISTENs on the
+channel notified by the room_changes insert trigger, so every worker receives each change
+as soon as it commits, in commit order. Other databases (SQLite) are polled by id every
+ROOM_CHANGES_POLL_SECONDS, and a change committed by this process wakes the poll early.
+"""
+import logging
+import os
+import select
+import threading
+import time
+from typing import Optional
+
+from sqlalchemy.engine import Engine
+
+from ..application.reservation_events import ReservationChanges, reservation_changes, reservation_events
+from ..domain.reservation import Reservation
+from .room_change_log import CHANNEL, changes_after_stmt, last_change_stmt, notification_to_change, prune_stmt, to_change
+from src.shared.infra.db import engine
+
+logger = logging.getLogger(__name__)
+
+
+class RoomChangeRelay:
+    """Reads every worker's committed changes and publishes them to `changes`.
+
+    The log is pruned to its newest `retain` rows every `prune_seconds`. Subscribers get
+    None after a gap: the LISTEN connection was re-established, or a poll found rows
+    pruned before it read them.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        changes: ReservationChanges,
+        poll_seconds: float = 0.5,
+        retain: int = 10000,
+        prune_seconds: float = 60.0,
+        batch_size: int = 500,
+    ):
+        self.engine = engine
+        self.changes = changes
+        self.poll_seconds = poll_seconds
+        self.retain = retain
+        self.prune_seconds = prune_seconds
+        self.batch_size = batch_size
+        self._last_id: Optional[int] = None
+        self._listened = False
+        self._pruned_at = 0.0
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="room-change-relay", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def wake(self) -> None:
+        self._wakeup.set()
+
+    def handle_event(self, event: str, reservation: Reservation) -> None:
+        # This process just committed a change: read it back now rather than on the next poll
+        self.wake()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                if self.engine.dialect.name == "postgresql":
+                    self._listen()
+                else:
+                    self._poll()
+            except Exception:
+                logger.exception("room change relay failed, retrying")
+                self._stopped.wait(self.poll_seconds)
+
+    def _listen(self) -> None:
+        connection = self.engine.raw_connection()
+        # Held for the life of the worker: keep it out of the pool's size and overflow
+        connection.detach()
+        try:
+            listener = connection.driver_connection
+            listener.autocommit = True
+            with listener.cursor() as cursor:
+                cursor.execute(f"LISTEN {CHANNEL}")
+            if self._listened:
+                # Notifications sent while the previous connection was down are lost
+                self.changes.publish(None)
+            self._listened = True
+            while not self._stopped.is_set():
+                if select.select([listener], [], [], self.poll_seconds)[0]:
+                    listener.poll()
+                    while listener.notifies:
+                        self.changes.publish(notification_to_change(listener.notifies.pop(0).payload))
+                self._prune()
+        finally:
+            connection.close()
+
+    def _poll(self) -> None:
+        if self._last_id is None:
+            with self.engine.connect() as conn:
+                self._last_id = conn.execute(last_change_stmt()).scalar() or 0
+        while not self._stopped.is_set():
+            self._wakeup.wait(self.poll_seconds)
+            self._wakeup.clear()
+            with self.engine.connect() as conn:
+                rows = conn.execute(changes_after_stmt(self._last_id, self.batch_size)).all()
+            # SQLite ids are contiguous (one writer at a time, AUTOINCREMENT): a jump means pruned rows
+            if rows and rows[0].id != self._last_id + 1:
+                self.changes.publish(None)
+            for row in rows:
+                self._last_id = row.id
+                self.changes.publish(to_change(row))
+            if len(rows) == self.batch_size:
+                self._wakeup.set()
+            self._prune()
+
+    def _prune(self) -> None:
+        now = time.monotonic()
+        if now - self._pruned_at < self.prune_seconds:
+            return
+        self._pruned_at = now
+        with self.engine.begin() as conn:
+            conn.execute(prune_stmt(self.retain))
+
+
+room_change_relay = RoomChangeRelay(
+    engine,
+    reservation_changes,
+    poll_seconds=float(os.getenv("ROOM_CHANGES_POLL_SECONDS", "0.5")),
+    retain=int(os.getenv("ROOM_CHANGES_RETAIN", "10000")),
+)
+reservation_events.subscribe(room_change_relay.handle_event)
@@ -0,0 +1,14 @@
+from sqlalchemy import BigInteger, String
+from sqlalchemy.orm import Mapped, mapped_column
+from src.shared.infra.db import Base
+
+class RoomVersionModel(Base):
+    """Per-room counter bumped by the reservation repositories in every transaction that
+    creates or cancels a reservation of the room; the room cache keys its entries on it.
+
+    Rooms never booked have no row (version 0).
+    """
+    __tablename__ = "room_versions"
+
+    room_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
@@ -2,7 +2,7 @@ from datetime import date
 from typing import List, Dict, Any
 from ..domain.room import Room
 
-from ..domain.room_repository import RoomRepository
+from ..domain.room_repository import AsyncRoomRepository, RoomRepository
 #from app.application.services.availability import AvailabilityService
 
 class ListRoomsUseCase:
@@ -25,4 +25,12 @@ class ListRoomsUseCase:
         #         "price_per_night": float(r.price_per_night),
         #         "available_today": available_today,
         #     })
-        return rooms
\ No newline at end of file
+        return rooms
+
+
+class ListRoomsUseCaseAsync:
+    def __init__(self, room_repo: AsyncRoomRepository):
+        self.room_repo = room_repo
+
+    async def execute(self) -> List[Room]:
+        return list(await self.room_repo.get_all())
\ No newline at end of file
@@ -1,8 +1,24 @@
-from ..domain.room_repository import RoomRepository
+from typing import Iterable, Set
+
+from ..domain.room_repository import AsyncRoomRepository, RoomRepository
 
 class RoomService:
     def __init__(self, room_repo: RoomRepository):
         self.room_repo = room_repo
 
     def exists(self, room_id: str) -> bool:
-        return self.room_repo.get_by_id(room_id) is not None
\ No newline at end of file
+        return self.room_repo.get_by_id(room_id) is not None
+
+    def existing(self, room_ids: Iterable[str]) -> Set[str]:
+        return self.room_repo.get_existing_ids(room_ids)
+
+
+class RoomServiceAsync:
+    def __init__(self, room_repo: AsyncRoomRepository):
+        self.room_repo = room_repo
+
+    async def exists(self, room_id: str) -> bool:
+        return await self.room_repo.get_by_id(room_id) is not None
+
+    async def existing(self, room_ids: Iterable[str]) -> Set[str]:
+        return await self.room_repo.get_existing_ids(room_ids)
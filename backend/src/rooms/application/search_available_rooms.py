@@ -0,0 +1,43 @@
+from datetime import date
+from decimal import Decimal
+from typing import List, Optional
+
+from ..domain.room import Room
+from ..domain.room_repository import AsyncRoomRepository, RoomRepository
+
+
+def _validate_search(start_date: date, end_date: date, min_price: Optional[Decimal], max_price: Optional[Decimal]) -> None:
+    if start_date > end_date:
+        raise ValueError("start_date must be less than or equal to end_date")
+    if min_price is not None and max_price is not None and min_price > max_price:
+        raise ValueError("min_price must be less than or equal to max_price")
+
+
+class SearchAvailableRoomsUseCase:
+    def __init__(self, room_repo: RoomRepository):
+        self.room_repo = room_repo
+
+    def execute(
+        self,
+        start_date: date,
+        end_date: date,
+        min_price: Optional[Decimal] = None,
+        max_price: Optional[Decimal] = None,
+    ) -> List[Room]:
+        _validate_search(start_date, end_date, min_price, max_price)
+        return list(self.room_repo.get_available(start_date, end_date, min_price=min_price, max_price=max_price))
+
+
+class SearchAvailableRoomsUseCaseAsync:
+    def __init__(self, room_repo: AsyncRoomRepository):
+        self.room_repo = room_repo
+
+    async def execute(
+        self,
+        start_date: date,
+        end_date: date,
+        min_price: Optional[Decimal] = None,
+        max_price: Optional[Decimal] = None,
+    ) -> List[Room]:
+        _validate_search(start_date, end_date, min_price, max_price)
+        return list(await self.room_repo.get_available(start_date, end_date, min_price=min_price, max_price=max_price))
\ No newline at end of file
@@ -3,12 +3,12 @@ from decimal import Decimal
 from datetime import date
 from typing import List
 
-@dataclass
+@dataclass(slots=True)
 class ReservationRange:
     start_date: date
     end_date: date
 
-@dataclass
+@dataclass(slots=True)
 class Room:
     id: str 
     name: str 
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Sequence, Optional
+from typing import Iterable, Sequence, Optional, Set
+from datetime import date
+from decimal import Decimal
 from .room import Room
 
 class RoomRepository(ABC):
@@ -11,7 +13,58 @@ class RoomRepository(ABC):
     def get_by_id(self, room_id: str) -> Optional[Room]:
         raise NotImplementedError
 
+    @abstractmethod
+    def get_available(
+        self,
+        start_date: date,
+        end_date: date,
+        min_price: Optional[Decimal] = None,
+        max_price: Optional[Decimal] = None,
+    ) -> Sequence[Room]:
+        """Return rooms with no ACTIVE reservation overlapping [start_date, end_date], within the price bounds."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_existing_ids(self, room_ids: Iterable[str]) -> Set[str]:
+        """Return the subset of room_ids that exist, in a single query."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_version(self, room_id: Optional[str] = None) -> int:
+        """Return a number that changes whenever a reservation of the room (of any room when
+        room_id is None) is created or cancelled, in any process."""
+        raise NotImplementedError
+
     @abstractmethod
     def create(self, room: Room) -> Room:
         raise NotImplementedError
-        
\ No newline at end of file
+
+
+class AsyncRoomRepository(ABC):
+    """asyncio counterpart of RoomRepository, used by the async request path."""
+
+    @abstractmethod
+    async def get_all(self) -> Sequence[Room]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_by_id(self, room_id: str) -> Optional[Room]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_available(
+        self,
+        start_date: date,
+        end_date: date,
+        min_price: Optional[Decimal] = None,
+        max_price: Optional[Decimal] = None,
+    ) -> Sequence[Room]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_existing_ids(self, room_ids: Iterable[str]) -> Set[str]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_version(self, room_id: Optional[str] = None) -> int:
+        raise NotImplementedError
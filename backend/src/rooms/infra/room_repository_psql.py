@@ -1,65 +1,114 @@
 
-from typing import Sequence, Optional
+from typing import Iterable, Sequence, Optional, Set
+from datetime import date
 from decimal import Decimal
+from sqlalchemy import and_, exists, select
 from sqlalchemy.orm import Session
 
 from ..domain.room import Room, ReservationRange
 from ..domain.room_repository import RoomRepository
 from .room_model_psql import RoomModel
 from src.reservations.infra.reservation_model_psql import ReservationModel
+from src.reservations.infra.reservation_repository_psql import active_overlap
+from src.reservations.infra.room_change_log import version_stmt
+
+# Statement builders shared with RoomRepositoryPsqlAsync
+
+def rooms_with_active_ranges_stmt(*criteria):
+    # Single query: rooms LEFT JOIN their active reservations, grouped in memory by
+    # group_room_rows. Keeps the statement count constant regardless of how many rooms exist.
+    # Ordered so every worker and replica renders identical bodies (and ETags) for the same data.
+    return (
+        select(
+            RoomModel.id,
+            RoomModel.name,
+            RoomModel.price_per_night,
+            ReservationModel.start_date,
+            ReservationModel.end_date,
+        )
+        .outerjoin(
+            ReservationModel,
+            and_(
+                ReservationModel.room_id == RoomModel.id,
+                ReservationModel.status == "active",
+            ),
+        )
+        .where(*criteria)
+        .order_by(RoomModel.id, ReservationModel.start_date)
+    )
+
+
+def group_room_rows(rows) -> list[Room]:
+    rooms: dict[str, Room] = {}
+    for room_id, name, price_per_night, start_date, end_date in rows:
+        room = rooms.get(room_id)
+        if room is None:
+            room = Room(
+                id=room_id,
+                name=name,
+                price_per_night=Decimal(str(price_per_night)),
+            )
+            rooms[room_id] = room
+        if start_date is not None:
+            room.reservation_ranges.append(
+                ReservationRange(start_date=start_date, end_date=end_date)
+            )
+    return list(rooms.values())
+
+
+def available_rooms_stmt(
+    start_date: date,
+    end_date: date,
+    min_price: Optional[Decimal] = None,
+    max_price: Optional[Decimal] = None,
+):
+    # Anti-join: one query, no reservation rows leave the database
+    conflict = exists().where(
+        ReservationModel.room_id == RoomModel.id,
+        active_overlap(start_date, end_date),
+    )
+    stmt = select(RoomModel.id, RoomModel.name, RoomModel.price_per_night).where(~conflict)
+    if min_price is not None:
+        stmt = stmt.where(RoomModel.price_per_night >= min_price)
+    if max_price is not None:
+        stmt = stmt.where(RoomModel.price_per_night <= max_price)
+    return stmt.order_by(RoomModel.price_per_night, RoomModel.name)
+
+
+def existing_ids_stmt(room_ids: Iterable[str]):
+    return select(RoomModel.id).where(RoomModel.id.in_(set(room_ids)))
+
+
+def available_room(row) -> Room:
+    return Room(id=row.id, name=row.name, price_per_night=Decimal(str(row.price_per_night)))
+
 
 class RoomRepositoryPsql(RoomRepository):
     def __init__(self, session: Session):
         self.session = session
 
     def get_all(self) -> Sequence[Room]:
-        rows = self.session.query(RoomModel).all()
-        rooms: list[Room] = []
-        for row in rows:
-            res_rows = (
-                self.session.query(ReservationModel)
-                .filter(
-                    ReservationModel.room_id == row.id,
-                    ReservationModel.status == "active",
-                )
-                .all()
-            )
-            reservation_ranges = [
-                ReservationRange(start_date=r.start_date, end_date=r.end_date)
-                for r in res_rows
-            ]
-            rooms.append(
-                Room(
-                    id=row.id,
-                    name=row.name,
-                    price_per_night=Decimal(str(row.price_per_night)),
-                    reservation_ranges=reservation_ranges,
-                )
-            )
-        return rooms
+        return group_room_rows(self.session.execute(rooms_with_active_ranges_stmt()))
 
     def get_by_id(self, room_id: str) -> Optional[Room]:
-        row = self.session.get(RoomModel, room_id)
-        if not row:
-            return None
-        res_rows = (
-            self.session.query(ReservationModel)
-            .filter(
-                ReservationModel.room_id == room_id,
-                ReservationModel.status == "active",
-            )
-            .all()
-        )
-        reservation_ranges = [
-            ReservationRange(start_date=r.start_date, end_date=r.end_date)
-            for r in res_rows
-        ]
-        return Room(
-            id=row.id,
-            name=row.name,
-            price_per_night=Decimal(str(row.price_per_night)),
-            reservation_ranges=reservation_ranges,
-        )
+        rooms = group_room_rows(self.session.execute(rooms_with_active_ranges_stmt(RoomModel.id == room_id)))
+        return rooms[0] if rooms else None
+
+    def get_available(
+        self,
+        start_date: date,
+        end_date: date,
+        min_price: Optional[Decimal] = None,
+        max_price: Optional[Decimal] = None,
+    ) -> Sequence[Room]:
+        rows = self.session.execute(available_rooms_stmt(start_date, end_date, min_price, max_price))
+        return [available_room(row) for row in rows]
+
+    def get_existing_ids(self, room_ids: Iterable[str]) -> Set[str]:
+        return set(self.session.execute(existing_ids_stmt(room_ids)).scalars())
+
+    def get_version(self, room_id: Optional[str] = None) -> int:
+        return int(self.session.execute(version_stmt(room_id)).scalar_one())
 
     def create(self, room: Room) -> Room:
         row = RoomModel(
@@ -70,4 +119,4 @@ class RoomRepositoryPsql(RoomRepository):
         self.session.add(row)
         self.session.flush()
         room.id = row.id
-        return room
\ No newline at end of file
+        return room
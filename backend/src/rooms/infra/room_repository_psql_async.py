@@ -0,0 +1,44 @@
+from typing import Iterable, Sequence, Optional, Set
+from datetime import date
+from decimal import Decimal
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..domain.room import Room
+from ..domain.room_repository import AsyncRoomRepository
+from .room_model_psql import RoomModel
+from .room_repository_psql import (
+    available_room,
+    available_rooms_stmt,
+    existing_ids_stmt,
+    group_room_rows,
+    rooms_with_active_ranges_stmt,
+)
+from src.reservations.infra.room_change_log import version_stmt
+
+class RoomRepositoryPsqlAsync(AsyncRoomRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_all(self) -> Sequence[Room]:
+        return group_room_rows(await self.session.execute(rooms_with_active_ranges_stmt()))
+
+    async def get_by_id(self, room_id: str) -> Optional[Room]:
+        result = await self.session.execute(rooms_with_active_ranges_stmt(RoomModel.id == room_id))
+        rooms = group_room_rows(result)
+        return rooms[0] if rooms else None
+
+    async def get_available(
+        self,
+        start_date: date,
+        end_date: date,
+        min_price: Optional[Decimal] = None,
+        max_price: Optional[Decimal] = None,
+    ) -> Sequence[Room]:
+        result = await self.session.execute(available_rooms_stmt(start_date, end_date, min_price, max_price))
+        return [available_room(row) for row in result]
+
+    async def get_existing_ids(self, room_ids: Iterable[str]) -> Set[str]:
+        return set((await self.session.execute(existing_ids_stmt(room_ids))).scalars())
+
+    async def get_version(self, room_id: Optional[str] = None) -> int:
+        return int((await self.session.execute(version_stmt(room_id))).scalar_one())
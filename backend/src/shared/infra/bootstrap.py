@@ -0,0 +1,42 @@
+"""One-off database initialization: local SQLite schema, derived tables and seed rooms.
+
+Runs once per deployment rather than in every worker: from `python manage.py init-db`,
+from the gunicorn master when the app is preloaded (see gunicorn.conf.py), or, for local
+development, from the app lifespan while STARTUP_INIT_ENABLED is on (the default).
+"""
+import os
+
+from sqlalchemy import inspect
+
+from .db import Base, SessionLocal, engine, is_sqlite, read_engine
+from .seed import seed_initial_rooms
+import src.rooms.infra.room_model_psql  # noqa: F401  (registers the rooms table)
+import src.reservations.infra.reservation_model_psql  # noqa: F401  (registers the reservations table)
+import src.payments.infra.payment_model_psql  # noqa: F401  (registers the payments table)
+import src.reports.infra.occupancy_model_psql  # noqa: F401  (registers the room_day_occupancy table)
+import src.reservations.infra.room_change_model_psql  # noqa: F401  (registers the room_changes table)
+import src.reservations.infra.room_version_model_psql  # noqa: F401  (registers the room_versions table)
+
+startup_init_enabled = os.getenv("STARTUP_INIT_ENABLED", "1").lower() in ("1", "true", "yes")
+
+# Set once init_database() has run in this process; workers forked from a preloading
+# gunicorn master inherit it and skip the work
+initialized = False
+
+
+def init_database() -> None:
+    global initialized
+    if is_sqlite:
+        # Local SQLite databases are not managed by Alembic
+        rollup_missing = not inspect(engine).has_table("room_day_occupancy")
+        Base.metadata.create_all(bind=engine)
+        if rollup_missing:
+            # Same as the Alembic migration on PostgreSQL: fill the new rollup from existing reservations
+            from src.reports.infra.occupancy_rollup import backfill
+
+            backfill(engine)
+    if read_engine is not engine and read_engine.dialect.name == "sqlite":
+        Base.metadata.create_all(bind=read_engine)
+    with SessionLocal() as session:
+        seed_initial_rooms(session)
+    initialized = True
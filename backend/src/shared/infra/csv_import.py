@@ -0,0 +1,309 @@
+"""Streaming, resumable CSV import of reservations and payments (`manage.py import-csv`).
+
+The file is read a chunk of rows at a time and every chunk goes through the batch use
+cases (CreateReservationBatchUseCase, CreatePaymentBatchUseCase): imported rows pass the
+same rules as the API, checked with a constant number of set-based queries per chunk and
+stored with bulk inserts in one transaction per chunk.
+
+Rejected rows are appended to a rejects CSV: the original columns plus `line` and `error`.
+After each chunk a checkpoint (JSON, replaced atomically) records the byte offset reached
+in the source and the size of the rejects file; running again with the same checkpoint
+resumes after the last recorded chunk.
+
+Before a chunk is stored the checkpoint also records where it ends and which of its ids
+were already in the database. A run that died between the chunk's commit and its
+checkpoint replays that chunk on resume: ids found stored now but not then were written by
+it and count as imported, the other rows go through the use case again, so the rejects
+and counts match an uninterrupted import.
+"""
+import csv
+import json
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import date
+from decimal import Decimal, InvalidOperation
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from .db import SessionLocal
+from src.payments.application.create_payment_batch import CreatePaymentBatchUseCase
+from src.payments.domain.payment import Payment
+from src.payments.infra.payment_repository_psql import PaymentRepositoryPsql
+from src.reservations.application.create_reservation_batch import CreateReservationBatchUseCase
+from src.reservations.application.reservation_events import ReservationEvents
+from src.reservations.domain.reservation import Reservation
+from src.reservations.infra.reservation_repository_psql import ReservationRepositoryPsql
+from src.rooms.application.room_service import RoomService
+from src.rooms.infra.room_repository_psql import RoomRepositoryPsql
+
+# Bounded by the bound-parameter limits of the IN (...) lookups each chunk runs
+MAX_CHUNK_SIZE = 10_000
+STATUSES = ("active", "cancelled")
+
+
+def _date(row: Dict[str, str], name: str) -> date:
+    try:
+        return date.fromisoformat(row[name])
+    except ValueError:
+        raise ValueError(f"{name} must be a date (YYYY-MM-DD)")
+
+
+def parse_reservation(row: Dict[str, str]) -> Reservation:
+    if not row["id"]:
+        raise ValueError("id is required")
+    status = row.get("status") or "active"
+    if status not in STATUSES:
+        raise ValueError("status must be active or cancelled")
+    return Reservation(
+        id=row["id"],
+        room_id=row["room_id"],
+        guest_email=row["guest_email"],
+        start_date=_date(row, "start_date"),
+        end_date=_date(row, "end_date"),
+        status=status,
+    )
+
+
+def parse_payment(row: Dict[str, str]) -> Payment:
+    if not row["id"]:
+        raise ValueError("id is required")
+    try:
+        amount = Decimal(row["amount"])
+    except InvalidOperation:
+        raise ValueError("amount must be a number")
+    if not amount.is_finite():
+        raise ValueError("amount must be a number")
+    return Payment(id=row["id"], reservation_id=row["reservation_id"], amount=amount)
+
+
+def import_reservations(session: Session, reservations: Sequence[Reservation]) -> List[Optional[str]]:
+    # A private publisher: API workers are other processes and learn about the imported
+    # bookings from the room change log the repository writes
+    use_case = CreateReservationBatchUseCase(
+        ReservationRepositoryPsql(session), RoomService(RoomRepositoryPsql(session)), events=ReservationEvents(),
+    )
+    return [r.error for r in use_case.execute(reservations)]
+
+
+def import_payments(session: Session, payments: Sequence[Payment]) -> List[Optional[str]]:
+    use_case = CreatePaymentBatchUseCase(PaymentRepositoryPsql(session), ReservationRepositoryPsql(session))
+    return [r.error for r in use_case.execute(payments)]
+
+
+@dataclass(frozen=True)
+class ImportKind:
+    columns: Tuple[str, ...]
+    optional: Tuple[str, ...]
+    parse: Callable[[Dict[str, str]], object]
+    store: Callable[[Session, Sequence], List[Optional[str]]]
+    # Repository with get_existing_ids() and get_by_id(), to recognize rows of a replayed chunk
+    repository: Callable[[Session], object]
+
+
+KINDS = {
+    "reservations": ImportKind(
+        ("id", "room_id", "guest_email", "start_date", "end_date", "status"), ("status",),
+        parse_reservation, import_reservations, ReservationRepositoryPsql,
+    ),
+    "payments": ImportKind(
+        ("id", "reservation_id", "amount"), (), parse_payment, import_payments, PaymentRepositoryPsql,
+    ),
+}
+
+
+@dataclass
+class Checkpoint:
+    kind: str
+    source: str
+    offset: int = 0
+    line: int = 1
+    imported: int = 0
+    rejected: int = 0
+    rejects_size: int = 0
+    # Set while a chunk is being stored: its last line and the ids stored before it
+    pending_line: int = 0
+    pending_ids: List[str] = field(default_factory=list)
+
+    @classmethod
+    def load(cls, path: str) -> Optional["Checkpoint"]:
+        if not os.path.exists(path):
+            return None
+        with open(path) as f:
+            return cls(**json.load(f))
+
+    def save(self, path: str) -> None:
+        # Written next to the target and renamed over it: a crash leaves the old or the new one
+        tmp = f"{path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(asdict(self), f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+
+@dataclass
+class ImportStats:
+    imported: int
+    rejected: int
+    lines: int
+    resumed_at_line: Optional[int]
+    seconds: float
+
+
+class _Source:
+    """Binary file read line by line, counting the bytes and lines handed to csv.reader."""
+
+    def __init__(self, f, offset: int, line: int):
+        self.f = f
+        self.offset = offset
+        self.line = line
+
+    def __iter__(self) -> Iterator[str]:
+        for raw in self.f:
+            self.offset += len(raw)
+            self.line += 1
+            yield raw.decode("utf-8")
+
+
+def _header(f) -> Tuple[List[str], int]:
+    first = f.readline()
+    header = next(csv.reader([first.decode("utf-8-sig")]), [])
+    return [name.strip() for name in header], len(first)
+
+
+def _records(source: _Source, header: List[str]) -> Iterator[Tuple[int, List[str], Optional[Dict[str, str]]]]:
+    """Yield (line, fields, row) per record; row is None when the field count does not match."""
+    reader = csv.reader(source)
+    while True:
+        line = source.line + 1
+        try:
+            fields = next(reader)
+        except StopIteration:
+            return
+        if not fields:
+            continue
+        yield line, fields, dict(zip(header, fields)) if len(fields) == len(header) else None
+
+
+def _written_before_crash(repository, items: Sequence, written: Set[str]) -> Set[int]:
+    """Indexes of the items a replayed chunk stored before the crash: one per id in `written`."""
+    rows: Dict[str, List[int]] = {}
+    for i, item in enumerate(items):
+        if item.id in written:
+            rows.setdefault(item.id, []).append(i)
+    done = set()
+    for item_id, indexes in rows.items():
+        if len(indexes) > 1:
+            # Repeated id: the stored row tells which of them was accepted
+            stored = repository.get_by_id(item_id)
+            indexes = [i for i in indexes if items[i] == stored] or indexes
+        done.add(indexes[0])
+    return done
+
+
+def import_csv(
+    kind: str,
+    source_path: str,
+    rejects_path: str,
+    checkpoint_path: str,
+    chunk_size: int = 5000,
+    restart: bool = False,
+    session_factory: Callable[[], Session] = SessionLocal,
+    progress: Callable[[str], None] = print,
+) -> ImportStats:
+    """Import `source_path` into the `kind` table, resuming from `checkpoint_path` unless `restart`.
+
+    Raises ValueError for a bad header or chunk size, and for a checkpoint that cannot be resumed.
+    """
+    spec = KINDS[kind]
+    if not 1 <= chunk_size <= MAX_CHUNK_SIZE:
+        raise ValueError(f"chunk size must be between 1 and {MAX_CHUNK_SIZE}")
+    source = os.path.abspath(source_path)
+    checkpoint = None if restart else Checkpoint.load(checkpoint_path)
+    if checkpoint and (checkpoint.kind, checkpoint.source) != (kind, source):
+        raise ValueError(
+            f"{checkpoint_path} belongs to the {checkpoint.kind} import of {checkpoint.source}; pass --restart to replace it"
+        )
+    resumed_at_line = checkpoint.line if checkpoint else None
+
+    started = time.perf_counter()
+    with open(source, "rb") as f:
+        header, header_size = _header(f)
+        missing = [c for c in spec.columns if c not in header and c not in spec.optional]
+        if missing:
+            raise ValueError(f"{source_path}: missing columns {', '.join(missing)}")
+        if checkpoint is None:
+            checkpoint = Checkpoint(kind=kind, source=source, offset=header_size)
+        f.seek(checkpoint.offset)
+        reader = _Source(f, checkpoint.offset, checkpoint.line)
+
+        if checkpoint.rejects_size and not os.path.exists(rejects_path):
+            raise ValueError(f"{rejects_path} is missing; pass --restart to import from the start")
+        with open(rejects_path, "r+" if checkpoint.rejects_size else "w", newline="", encoding="utf-8") as rejects:
+            # Rows written after the last checkpoint belong to a chunk that is replayed now
+            rejects.truncate(checkpoint.rejects_size)
+            rejects.seek(checkpoint.rejects_size)
+            out = csv.writer(rejects, lineterminator="\n")
+            if not checkpoint.rejects_size:
+                out.writerow([*header, "line", "error"])
+
+            def flush(chunk: List[Tuple[int, List[str], object]], errors: List[Tuple[int, List[str], str]]) -> None:
+                if chunk:
+                    items = [item for _, _, item in chunk]
+                    done: Set[int] = set()
+                    with session_factory() as session:
+                        repository = spec.repository(session)
+                        stored = repository.get_existing_ids(item.id for item in items)
+                        if checkpoint.pending_line:
+                            done = _written_before_crash(repository, items, stored - set(checkpoint.pending_ids))
+                        else:
+                            checkpoint.pending_line, checkpoint.pending_ids = reader.line, sorted(stored)
+                            checkpoint.save(checkpoint_path)
+                        rest = [i for i in range(len(items)) if i not in done]
+                        results: List[Optional[str]] = [None] * len(items)
+                        for i, error in zip(rest, spec.store(session, [items[i] for i in rest])):
+                            results[i] = error
+                    errors.extend((line, fields, error) for (line, fields, _), error in zip(chunk, results) if error)
+                    checkpoint.imported += len(chunk) - sum(1 for e in results if e)
+                errors.sort(key=lambda e: e[0])
+                for line, fields, error in errors:
+                    out.writerow([*fields, *[""] * (len(header) - len(fields)), line, error])
+                checkpoint.rejected += len(errors)
+                rejects.flush()
+                os.fsync(rejects.fileno())
+                checkpoint.rejects_size = rejects.tell()
+                checkpoint.offset, checkpoint.line = reader.offset, reader.line
+                checkpoint.pending_line, checkpoint.pending_ids = 0, []
+                checkpoint.save(checkpoint_path)
+                elapsed = time.perf_counter() - started
+                progress(
+                    f"line {checkpoint.line:>12,}: {checkpoint.imported:>12,} imported {checkpoint.rejected:>10,} rejected "
+                    f"({(reader.offset - header_size) / 2**20:,.1f} MiB read, {elapsed:,.1f}s)"
+                )
+
+            chunk: List[Tuple[int, List[str], object]] = []
+            errors: List[Tuple[int, List[str], str]] = []
+            for line, fields, row in _records(reader, header):
+                if row is None:
+                    errors.append((line, fields, f"expected {len(header)} fields, got {len(fields)}"))
+                    continue
+                try:
+                    chunk.append((line, fields, spec.parse(row)))
+                except ValueError as e:
+                    errors.append((line, fields, str(e)))
+                # A replayed chunk keeps the bounds it had when it was stored
+                full = reader.line >= checkpoint.pending_line if checkpoint.pending_line else len(chunk) >= chunk_size
+                if full:
+                    flush(chunk, errors)
+                    chunk, errors = [], []
+            flush(chunk, errors)
+
+    return ImportStats(
+        imported=checkpoint.imported,
+        rejected=checkpoint.rejected,
+        lines=checkpoint.line,
+        resumed_at_line=resumed_at_line,
+        seconds=round(time.perf_counter() - started, 1),
+    )
@@ -1,26 +1,187 @@
 import os
-from sqlalchemy import create_engine
+import time
+from sqlalchemy import create_engine, make_url
 from sqlalchemy.orm import sessionmaker, declarative_base
 
+from .metrics import db_pool_wait, register_pool_metrics
+from .query_profiler import SLOW_QUERY_MS, db_profiling_enabled, install as install_query_hooks
+
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./hotel.db")
 
 is_sqlite = DATABASE_URL.startswith("sqlite")
+
+
+def pool_options(url: str) -> dict:
+    """Pool sizing from DB_POOL_* environment variables (defaults match SQLAlchemy's).
+
+    Keep DB_POOL_SIZE + DB_MAX_OVERFLOW at or above the number of requests a worker
+    serves at once (40 threadpool slots on the sync path), or requests queue on the pool.
+    """
+    if url.startswith("sqlite") and (":memory:" in url or url.split("://", 1)[1] in ("", "/")):
+        # In-memory SQLite uses a single-connection pool that takes no sizing options
+        return {}
+    return {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "5")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "10")),
+        "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT", "30")),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "-1")),
+        "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "0").lower() in ("1", "true", "yes"),
+    }
+
+
+def timed_pool_class(url: str, label: str) -> type:
+    """The pool class SQLAlchemy picks for `url`, recording every checkout on db_pool_wait.
+
+    Sessions check a connection out on their first statement, so requests that never query
+    hold none and are not counted. Being the pool's class, it survives dispose().
+    """
+    parsed = make_url(url)
+    base = parsed.get_dialect().get_pool_class(parsed)
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return base.connect(self)
+        finally:
+            db_pool_wait.observe(time.perf_counter() - started, engine=label)
+
+    return type(f"Timed{base.__name__}", (base,), {"connect": connect})
+
+
 engine = create_engine(
     DATABASE_URL,
     future=True,
     echo=False,
     connect_args={"check_same_thread": False} if is_sqlite else {},
+    poolclass=timed_pool_class(DATABASE_URL, "primary"),
+    **pool_options(DATABASE_URL),
 )
+register_pool_metrics("primary", lambda: engine.pool)
+if db_profiling_enabled or SLOW_QUERY_MS is not None:
+    install_query_hooks()
 
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False, future=True)
 Base = declarative_base()
 
+# Optional read replica for pure read endpoints; without DATABASE_READ_URL reads use the primary.
+# Reads inside write use cases (overlap checks, payment checks) always use the primary session.
+DATABASE_READ_URL = os.getenv("DATABASE_READ_URL")
+if DATABASE_READ_URL:
+    read_engine = create_engine(
+        DATABASE_READ_URL,
+        future=True,
+        echo=False,
+        connect_args={"check_same_thread": False} if DATABASE_READ_URL.startswith("sqlite") else {},
+        poolclass=timed_pool_class(DATABASE_READ_URL, "replica"),
+        **pool_options(DATABASE_READ_URL),
+    )
+    register_pool_metrics("replica", lambda: read_engine.pool)
+else:
+    read_engine = engine
+ReadSessionLocal = sessionmaker(bind=read_engine, autoflush=False, autocommit=False, expire_on_commit=False, future=True)
+
 # FastAPI dependency
-from typing import Generator
+from typing import AsyncGenerator, Generator
 
 def get_session() -> Generator:
     session = SessionLocal()
     try:
         yield session
     finally:
-        session.close()
\ No newline at end of file
+        session.close()
+
+
+def get_read_session() -> Generator:
+    """Like get_session, on the read replica when one is configured. Only for endpoints that never write."""
+    session = ReadSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+# Async request path (ASYNC_DB_ENABLED=1): same database through an asyncio driver
+def _to_async_url(url: str) -> str:
+    if url.startswith("sqlite:"):
+        return url.replace("sqlite:", "sqlite+aiosqlite:", 1)
+    for prefix in ("postgresql+psycopg2:", "postgresql:", "postgres:"):
+        if url.startswith(prefix):
+            return url.replace(prefix, "postgresql+asyncpg:", 1)
+    return url
+
+async_db_enabled = os.getenv("ASYNC_DB_ENABLED", "0").lower() in ("1", "true", "yes")
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL", _to_async_url(DATABASE_URL))
+ASYNC_DATABASE_READ_URL = os.getenv(
+    "ASYNC_DATABASE_READ_URL", _to_async_url(DATABASE_READ_URL) if DATABASE_READ_URL else None
+)
+
+_async_engine = None
+_AsyncSessionLocal = None
+_async_read_engine = None
+_AsyncReadSessionLocal = None
+
+def get_async_engine():
+    # Created on first use so the sync deployment never needs aiosqlite/asyncpg installed
+    global _async_engine, _AsyncSessionLocal
+    if _async_engine is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        _async_engine = create_async_engine(
+            ASYNC_DATABASE_URL, echo=False, poolclass=timed_pool_class(ASYNC_DATABASE_URL, "async"),
+            **pool_options(ASYNC_DATABASE_URL),
+        )
+        _AsyncSessionLocal = async_sessionmaker(bind=_async_engine, autoflush=False, expire_on_commit=False)
+    return _async_engine
+
+def AsyncSessionLocal():
+    get_async_engine()
+    return _AsyncSessionLocal()
+
+def get_async_read_engine():
+    global _async_read_engine, _AsyncReadSessionLocal
+    if not ASYNC_DATABASE_READ_URL:
+        return get_async_engine()
+    if _async_read_engine is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        _async_read_engine = create_async_engine(
+            ASYNC_DATABASE_READ_URL, echo=False, poolclass=timed_pool_class(ASYNC_DATABASE_READ_URL, "async_replica"),
+            **pool_options(ASYNC_DATABASE_READ_URL),
+        )
+        _AsyncReadSessionLocal = async_sessionmaker(bind=_async_read_engine, autoflush=False, expire_on_commit=False)
+    return _async_read_engine
+
+def AsyncReadSessionLocal():
+    if not ASYNC_DATABASE_READ_URL:
+        return AsyncSessionLocal()
+    get_async_read_engine()
+    return _AsyncReadSessionLocal()
+
+async def get_async_session() -> AsyncGenerator:
+    async with AsyncSessionLocal() as session:
+        yield session
+
+async def get_async_read_session() -> AsyncGenerator:
+    async with AsyncReadSessionLocal() as session:
+        yield session
+
+register_pool_metrics("async", lambda: _async_engine.sync_engine.pool if _async_engine is not None else None)
+register_pool_metrics(
+    "async_replica", lambda: _async_read_engine.sync_engine.pool if _async_read_engine is not None else None
+)
+
+
+def dispose_engines(close: bool = True) -> None:
+    """Drop pooled connections of the sync engines.
+
+    close=False, in a process forked from one that used the engines (gunicorn post_fork),
+    discards the inherited pool without closing connections the parent still owns.
+    """
+    engine.dispose(close=close)
+    if read_engine is not engine:
+        read_engine.dispose(close=close)
+
+async def dispose_async_engines() -> None:
+    for async_engine in (_async_engine, _async_read_engine):
+        if async_engine is not None:
+            await async_engine.dispose()
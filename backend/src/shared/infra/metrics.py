@@ -0,0 +1,249 @@
+"""Minimal in-process metrics registry rendered in the Prometheus text exposition format.
+
+Metrics are per process: with several gunicorn workers each one exposes its own values.
+"""
+import functools
+import inspect
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return self.header() + [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_number(value)}" for key, value in items
+        ]
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        collect: Optional[Callable[[], Iterable[Tuple[LabelValues, float]]]] = None,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        # Optional callback reading the current values at scrape time
+        self._collect = collect
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def render(self) -> List[str]:
+        if self._collect is not None:
+            items = list(self._collect())
+        else:
+            with self._lock:
+                items = list(self._values.items())
+        return self.header() + [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_number(value)}" for key, value in items
+        ]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        self._series: Dict[LabelValues, List[float]] = {}  # bucket counts..., sum, count
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0.0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+                    break
+            series[-2] += value
+            series[-1] += 1
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = [(key, list(series)) for key, series in self._series.items()]
+        lines = self.header()
+        for key, series in items:
+            cumulative = 0.0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                le = f'le="{_format_number(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {_format_number(cumulative)}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_number(series[-2])}")
+            lines.append(f"{self.name}_count{labels} {_format_number(series[-1])}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+http_request_duration = registry.register(Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template.", ("method", "route", "status"),
+))
+http_requests_in_flight = registry.register(Gauge(
+    "http_requests_in_flight", "HTTP requests currently being served.", ("method",),
+))
+use_case_calls = registry.register(Counter(
+    "use_case_calls_total", "Use case executions by outcome.", ("use_case", "outcome"),
+))
+use_case_duration = registry.register(Histogram(
+    "use_case_duration_seconds", "Use case execution time.", ("use_case",),
+))
+db_pool_wait = registry.register(Histogram(
+    "db_pool_wait_seconds", "Time spent waiting for a pooled database connection.", ("engine",),
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+))
+
+
+_pools: Dict[str, Callable[[], Optional[object]]] = {}
+
+
+def _pool_reader(attribute: str) -> Callable[[], Iterable[Tuple[LabelValues, float]]]:
+    def collect() -> Iterable[Tuple[LabelValues, float]]:
+        for engine, get_pool in list(_pools.items()):
+            pool = get_pool()
+            method = getattr(pool, attribute, None) if pool is not None else None
+            if method is not None:
+                yield (engine,), float(method())
+    return collect
+
+
+for _name, _attribute, _documentation in (
+    ("db_pool_size", "size", "Configured number of persistent pooled connections."),
+    ("db_pool_checked_out", "checkedout", "Connections currently checked out of the pool."),
+    ("db_pool_checked_in", "checkedin", "Idle connections currently in the pool."),
+    ("db_pool_overflow", "overflow", "Connections open beyond pool_size (negative while below it)."),
+):
+    registry.register(Gauge(_name, _documentation, ("engine",), collect=_pool_reader(_attribute)))
+
+
+def register_pool_metrics(name: str, get_pool: Callable[[], Optional[object]]) -> None:
+    """Expose an engine's pool on the db_pool_* gauges; get_pool is read at scrape time."""
+    _pools[name] = get_pool
+
+
+def instrument_use_case(cls: type, name: Optional[str] = None) -> type:
+    """Wrap `cls.execute` (sync or async) with call counters and a duration histogram."""
+    use_case = name or cls.__name__
+    execute = cls.execute
+    if getattr(execute, "__instrumented__", False):
+        return cls
+
+    if inspect.iscoroutinefunction(execute):
+        @functools.wraps(execute)
+        async def wrapper(self, *args, **kwargs):
+            started = time.perf_counter()
+            outcome = "error"
+            try:
+                result = await execute(self, *args, **kwargs)
+                outcome = "ok"
+                return result
+            finally:
+                use_case_duration.observe(time.perf_counter() - started, use_case=use_case)
+                use_case_calls.inc(use_case=use_case, outcome=outcome)
+    else:
+        @functools.wraps(execute)
+        def wrapper(self, *args, **kwargs):
+            started = time.perf_counter()
+            outcome = "error"
+            try:
+                result = execute(self, *args, **kwargs)
+                outcome = "ok"
+                return result
+            finally:
+                use_case_duration.observe(time.perf_counter() - started, use_case=use_case)
+                use_case_calls.inc(use_case=use_case, outcome=outcome)
+
+    wrapper.__instrumented__ = True
+    cls.execute = wrapper
+    return cls
@@ -0,0 +1,94 @@
+"""Per-request SQL statement counts and timings, a slow-query log and a query budget guard.
+
+Cursor events are listened for on the Engine class, so every engine (primary, replica,
+the sync engines behind the async ones) is covered. Statements are attributed to the
+QueryStats in the current context: one per request when the profiling middleware is
+on, or the one opened by profile_queries()/query_budget(). Work in sync handlers is
+counted too, since the threadpool runs them in a copy of the request context.
+"""
+import logging
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+db_profiling_enabled = os.getenv("DB_PROFILING_ENABLED", "0").lower() in ("1", "true", "yes")
+# Statements slower than this are logged with their SQL; unset disables the log
+SLOW_QUERY_MS = float(os.environ["SLOW_QUERY_MS"]) if os.getenv("SLOW_QUERY_MS") else None
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    seconds: float = 0.0
+    statements: List[str] = field(default_factory=list)
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.seconds += elapsed
+        self.statements.append(statement)
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+_installed = False
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_started"].pop()
+    stats = _current.get()
+    if stats is not None:
+        stats.record(statement, elapsed)
+    if SLOW_QUERY_MS is not None and elapsed * 1000 >= SLOW_QUERY_MS:
+        logger.warning("slow query (%.1f ms): %s", elapsed * 1000, " ".join(statement.split()))
+
+
+def install() -> None:
+    """Listen for cursor executions on every engine; safe to call more than once."""
+    global _installed
+    if not _installed:
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        _installed = True
+
+
+@contextmanager
+def profile_queries() -> Iterator[QueryStats]:
+    """Count the statements run in the enclosed block (and tasks/threads started from it)."""
+    install()
+    stats = QueryStats()
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def query_budget(max_queries: int) -> Iterator[QueryStats]:
+    """Fail with QueryBudgetExceeded when the enclosed block runs more than max_queries statements.
+
+    Meant for tests and check scripts, e.g. to catch a per-row query loop (N+1) in a repository:
+
+        with query_budget(3):
+            client.get("/rooms")
+    """
+    with profile_queries() as stats:
+        yield stats
+    if stats.count > max_queries:
+        listing = "\n".join(f"  {' '.join(s.split())[:200]}" for s in stats.statements)
+        raise QueryBudgetExceeded(f"{stats.count} queries, budget is {max_queries}:\n{listing}")
@@ -0,0 +1,164 @@
+"""Deterministic synthetic rooms, reservations and payments for scale testing.
+
+Rows are produced as plain tuples in batches and written with the fastest bulk path of the
+backend: COPY on PostgreSQL (psycopg2), executemany inside large transactions on SQLite.
+The same spec and seed always produce the same rows.
+"""
+import csv
+import io
+import itertools
+import random
+import time
+from dataclasses import dataclass
+from datetime import date
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple
+
+from sqlalchemy.engine import Engine
+
+ROOM_COLUMNS = ("id", "name", "price_per_night")
+RESERVATION_COLUMNS = ("id", "room_id", "guest_email", "start_date", "end_date", "status")
+PAYMENT_COLUMNS = ("id", "reservation_id", "amount")
+
+# Nights per stay: mostly short stays with a long tail, as in typical hotel data
+STAY_NIGHTS = (1, 2, 3, 4, 5, 6, 7, 10, 14)
+STAY_WEIGHTS = (20, 25, 18, 12, 8, 5, 6, 4, 2)
+
+
+@dataclass
+class GenerationSpec:
+    rooms: int
+    reservations: int
+    cancel_ratio: float = 0.1
+    payment_ratio: float = 0.8
+    seed: int = 42
+    start_date: date = date(2025, 1, 1)
+    mean_gap_days: float = 2.0
+    batch_size: int = 100_000
+
+
+def _ids(seed: int, kind: int) -> Iterator[str]:
+    # Sequential UUID-formatted ids: unique per (seed, kind), and ascending so every insert
+    # appends to the primary key B-tree instead of splitting random pages
+    prefix = f"{seed & 0xFFFFFFFF:08x}-{kind:04x}-4000-8000-"
+    return (f"{prefix}{n:012x}" for n in itertools.count())
+
+
+def generate_rooms(spec: GenerationSpec) -> List[Tuple]:
+    rng = random.Random(f"{spec.seed}:rooms")
+    ids = _ids(spec.seed, 1)
+    return [
+        (next(ids), f"s{spec.seed}-room{i:07d}", float(rng.randrange(50, 400, 5)))
+        for i in range(spec.rooms)
+    ]
+
+
+def generate_bookings(spec: GenerationSpec, rooms: Sequence[Tuple]) -> Iterator[Tuple[List[Tuple], List[Tuple]]]:
+    """Yield (reservation rows, payment rows) batches.
+
+    Each room gets its share of the reservations laid out back to back with random gaps,
+    so no two reservations of a room overlap whatever their status. A share of them is
+    cancelled; a share of the active ones is paid (amount = nights * price).
+    """
+    per_room, extra = divmod(spec.reservations, max(spec.rooms, 1))
+    reservation_ids, payment_ids = _ids(spec.seed, 2), _ids(spec.seed, 3)
+    iso: Dict[int, str] = {}  # ordinal -> ISO date, shared by all rooms
+    reservations: List[Tuple] = []
+    payments: List[Tuple] = []
+    for index, (room_id, _, price) in enumerate(rooms):
+        # One random stream per room: rows do not depend on batch size
+        rng = random.Random(f"{spec.seed}:room:{index}")
+        count = per_room + (1 if index < extra else 0)
+        day = spec.start_date.toordinal() + rng.randrange(30)
+        for nights in rng.choices(STAY_NIGHTS, STAY_WEIGHTS, k=count):
+            end = day + nights
+            start_iso = iso.get(day) or iso.setdefault(day, date.fromordinal(day).isoformat())
+            end_iso = iso.get(end) or iso.setdefault(end, date.fromordinal(end).isoformat())
+            reservation_id = next(reservation_ids)
+            cancelled = rng.random() < spec.cancel_ratio
+            reservations.append((
+                reservation_id,
+                room_id,
+                f"guest{rng.randrange(10 * spec.reservations + 1)}@example.com",
+                start_iso,
+                end_iso,
+                "cancelled" if cancelled else "active",
+            ))
+            if not cancelled and rng.random() < spec.payment_ratio:
+                payments.append((next(payment_ids), reservation_id, round(nights * price, 2)))
+            # Inclusive end dates: the next stay starts the day after at the earliest
+            day = end + 1 + int(rng.expovariate(1 / spec.mean_gap_days))
+            if len(reservations) >= spec.batch_size:
+                yield reservations, payments
+                reservations, payments = [], []
+    if reservations or payments:
+        yield reservations, payments
+
+
+class _BulkWriter:
+    def __init__(self, engine: Engine):
+        self.connection = engine.raw_connection()
+        self.dialect = engine.dialect.name
+
+    def write(self, table: str, columns: Sequence[str], rows: Sequence[Tuple]) -> None:
+        if not rows:
+            return
+        cursor = self.connection.cursor()
+        try:
+            if self.dialect == "postgresql" and hasattr(cursor, "copy_expert"):
+                buffer = io.StringIO()
+                csv.writer(buffer).writerows(rows)
+                buffer.seek(0)
+                cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buffer)
+            else:
+                placeholder = "?" if self.dialect == "sqlite" else "%s"
+                cursor.executemany(
+                    f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join([placeholder] * len(columns))})",
+                    rows,
+                )
+        finally:
+            cursor.close()
+
+    def prepare(self) -> None:
+        if self.dialect == "sqlite":
+            # Bulk load: no fsync per transaction; the file is consistent again once loading ends
+            cursor = self.connection.cursor()
+            cursor.execute("PRAGMA synchronous = OFF")
+            cursor.close()
+
+    def commit(self) -> None:
+        self.connection.commit()
+
+    def close(self) -> None:
+        if self.dialect == "sqlite":
+            cursor = self.connection.cursor()
+            cursor.execute("PRAGMA synchronous = FULL")
+            cursor.close()
+        self.connection.close()
+
+
+def generate(engine: Engine, spec: GenerationSpec, progress: Callable[[str], None] = print) -> dict:
+    """Insert the synthetic data set described by `spec`; return row counts."""
+    started = time.perf_counter()
+    counts = {"rooms": 0, "reservations": 0, "payments": 0}
+    writer = _BulkWriter(engine)
+    try:
+        writer.prepare()
+        rooms = generate_rooms(spec)
+        writer.write("rooms", ROOM_COLUMNS, rooms)
+        writer.commit()
+        counts["rooms"] = len(rooms)
+        for reservations, payments in generate_bookings(spec, rooms):
+            writer.write("reservations", RESERVATION_COLUMNS, reservations)
+            writer.write("payments", PAYMENT_COLUMNS, payments)
+            writer.commit()
+            counts["reservations"] += len(reservations)
+            counts["payments"] += len(payments)
+            elapsed = time.perf_counter() - started
+            progress(
+                f"{counts['reservations']:>12,} reservations {counts['payments']:>12,} payments "
+                f"({counts['reservations'] / elapsed:,.0f} rows/s)"
+            )
+    finally:
+        writer.close()
+    counts["seconds"] = round(time.perf_counter() - started, 1)
+    return counts
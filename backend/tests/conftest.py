@@ -0,0 +1,92 @@
+"""Shared fixtures: the app on a throwaway SQLite database, and query budgets around its client.
+
+The environment is set before `main` is imported, so the engines point at the temporary
+database. The read replica is the same file opened read-only: it never lags, but a write
+routed to it fails, and tests can tell which engine ran a statement from its URL. Run from
+backend/ with `python -m pytest`; set ASYNC_DB_ENABLED=1 to test the async request path.
+"""
+import os
+import subprocess
+import sys
+import tempfile
+
+_database_path = os.path.join(tempfile.mkdtemp(), "test.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{_database_path}"
+os.environ["DATABASE_READ_URL"] = f"sqlite:///file:{_database_path}?mode=ro&uri=true"
+os.environ.pop("ASYNC_DATABASE_URL", None)
+os.environ.pop("ASYNC_DATABASE_READ_URL", None)
+os.environ["ROOM_CACHE_ENABLED"] = "0"  # cached reads would run no queries at all
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+import main  # noqa: E402
+from benchmarks.query_budgets import new_reservation  # noqa: E402
+from src.shared.infra.db import engine  # noqa: E402
+from src.shared.infra.query_profiler import query_budget  # noqa: E402
+from src.shared.infra.synthetic_data import GenerationSpec, generate  # noqa: E402
+
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Writes through the repository in a separate process, as another gunicorn worker would:
+# nothing is published to this process's in-process subscribers
+OTHER_WORKER = """
+import sys
+from datetime import date
+from src.reservations.domain.reservation import Reservation
+from src.reservations.infra.reservation_repository_psql import ReservationRepositoryPsql
+from src.shared.infra.db import SessionLocal
+
+action, reservation_id, room_id, start, end = sys.argv[1:]
+with SessionLocal() as session:
+    repo = ReservationRepositoryPsql(session)
+    if action == "create":
+        repo.create(Reservation(reservation_id, room_id, "worker@example.com", date.fromisoformat(start), date.fromisoformat(end)))
+    else:
+        repo.cancel(reservation_id)
+"""
+
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(main.app) as client:
+        # Enough rows that a per-room or per-reservation query shows up in the counts
+        generate(engine, GenerationSpec(rooms=50, reservations=2000), progress=lambda _: None)
+        yield client
+
+
+@pytest.fixture
+def budget_fixture(client) -> dict:
+    """Ids the budgeted requests refer to, with a fresh active reservation per test."""
+    room_ids = [room["id"] for room in client.get("/rooms").json()]
+    response = client.post("/reservations", json=new_reservation(room_ids[0]))
+    assert response.status_code == 201, response.text
+    return {"room_id": room_ids[0], "room_ids": room_ids, "reservation_id": response.json()["id"]}
+
+
+@pytest.fixture
+def within_budget(client):
+    """Call `request(client)` under query_budget(max_queries); return (response, QueryStats).
+
+    Raises QueryBudgetExceeded, listing the statements, when the request runs more.
+    """
+    def run(max_queries: int, request):
+        with query_budget(max_queries) as stats:
+            response = request(client)
+        return response, stats
+
+    return run
+
+
+@pytest.fixture
+def other_worker():
+    """`run(action, reservation)`: "create" or "cancel" a new_reservation() dict from another process."""
+    def run(action: str, reservation: dict) -> None:
+        subprocess.run(
+            [sys.executable, "-c", OTHER_WORKER, action, reservation["id"], reservation["room_id"],
+             reservation["start_date"], reservation["end_date"]],
+            cwd=BACKEND_DIR, env=dict(os.environ, PYTHONPATH=BACKEND_DIR), check=True,
+        )
+
+    return run
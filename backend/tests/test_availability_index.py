@@ -0,0 +1,124 @@
+import itertools
+import random
+import time
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.query_budgets import new_reservation
+from src.reservations.application.availability_index import AvailabilityIndex
+from src.reservations.application.create_reservation import OVERLAP_ERROR, CreateReservationUseCase
+from src.reservations.application.reservation_events import (
+    RESERVATION_CANCELLED,
+    RESERVATION_CREATED,
+    ReservationChange,
+    ReservationEvents,
+    reservation_changes,
+)
+from src.reservations.domain.reservation import Reservation
+from src.reservations.infra.reservation_repository_psql import ReservationRepositoryPsql
+from src.rooms.application.room_service import RoomService
+from src.rooms.infra.room_repository_psql import RoomRepositoryPsql
+from src.shared.infra.db import Base, SessionLocal
+from src.shared.infra.query_profiler import query_budget
+
+
+def random_range(rng: random.Random) -> tuple:
+    start = date(2025, 1, 1) + timedelta(days=rng.randrange(365))
+    return start, start + timedelta(days=rng.randrange(0, 6))
+
+
+def as_reservation(payload: dict) -> Reservation:
+    return Reservation(
+        payload["id"], payload["room_id"], payload["guest_email"],
+        date.fromisoformat(payload["start_date"]), date.fromisoformat(payload["end_date"]),
+    )
+
+
+_change_ids = itertools.count(1)
+
+
+def remote(event: str, reservation: Reservation) -> ReservationChange:
+    return ReservationChange(
+        id=next(_change_ids), event=event, room_id=reservation.room_id, reservation_id=reservation.id,
+        start_date=reservation.start_date, end_date=reservation.end_date, local=False,
+    )
+
+
+def wait_until(condition, timeout: float = 10) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.05)
+
+
+def test_index_agrees_with_the_database():
+    rng = random.Random(7)
+    engine = create_engine("sqlite://", future=True)
+    Base.metadata.create_all(bind=engine)
+    repo = ReservationRepositoryPsql(sessionmaker(bind=engine, future=True, expire_on_commit=False)())
+    index = AvailabilityIndex(ttl_seconds=float("inf"))
+    rooms = [f"room-{i}" for i in range(20)]
+
+    # Half of the rows are loaded before the index, the rest arrive afterwards: alternately as
+    # this process's events and as changes relayed from other workers. Overlapping active rows
+    # are allowed on purpose to cover legacy data.
+    created = []
+    for i in range(800):
+        start, end = random_range(rng)
+        created.append(repo.create(Reservation(f"r{i}", rng.choice(rooms), "g@example.com", start, end)))
+        if i == 400:
+            for room_id in rooms:
+                index.load(room_id, repo.get_by_room(room_id), index.generation(room_id))
+        elif i > 400:
+            if i % 2:
+                index.handle_event(RESERVATION_CREATED, created[-1])
+            else:
+                index.handle_change(remote(RESERVATION_CREATED, created[-1]))
+        if rng.random() < 0.2:
+            victim = rng.choice(created)
+            if victim.status == "active":
+                victim.status = "cancelled"
+                index.handle_change(remote(RESERVATION_CANCELLED, repo.cancel(victim.id)))
+
+    queries = [(rng.choice(rooms), *random_range(rng)) for _ in range(1000)]
+    expected = [repo.has_overlap(*query) for query in queries]
+    assert 0 < sum(expected) < len(queries), "queries must both overlap and miss"
+    assert [index.has_overlap(*query) for query in queries] == expected
+
+
+def test_index_rejects_overlaps_without_querying(client):
+    room_id = client.get("/rooms").json()[0]["id"]
+    index = AvailabilityIndex()
+    events = ReservationEvents()
+    events.subscribe(index.handle_event)
+    booked = as_reservation(new_reservation(room_id))
+    overlapping = Reservation("overlap-" + booked.id, room_id, "g@example.com", booked.end_date, booked.end_date)
+    with SessionLocal() as session:
+        use_case = CreateReservationUseCase(
+            ReservationRepositoryPsql(session), RoomService(RoomRepositoryPsql(session)),
+            availability_index=index, events=events,
+        )
+        use_case.execute(booked)
+        # Only the room lookup runs: the index answers for the reservations
+        with query_budget(1) as stats, pytest.raises(ValueError, match=OVERLAP_ERROR):
+            use_case.execute(overlapping)
+    assert "FROM rooms" in stats.statements[0]
+
+
+def test_index_follows_other_workers_bookings(client, other_worker):
+    room_id = client.get("/rooms").json()[0]["id"]
+    index = AvailabilityIndex(ttl_seconds=float("inf"))
+    reservation_changes.subscribe(index.handle_change)
+    with SessionLocal() as session:
+        index.load(room_id, ReservationRepositoryPsql(session).get_by_room(room_id), index.generation(room_id))
+    payload = new_reservation(room_id)
+    booked = as_reservation(payload)
+    assert index.has_overlap(room_id, booked.start_date, booked.end_date) is False
+
+    other_worker("create", payload)
+    wait_until(lambda: index.has_overlap(room_id, booked.start_date, booked.end_date))
+    other_worker("cancel", payload)
+    wait_until(lambda: not index.has_overlap(room_id, booked.start_date, booked.end_date))
@@ -0,0 +1,42 @@
+import random
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+from src.reservations.infra.reservation_repository_psql import ReservationRepositoryPsql
+from src.shared.infra.db import SessionLocal
+
+# Scaled-down benchmarks/stress_concurrent_bookings: many overlapping requests for a few rooms
+REQUESTS = 200
+THREADS = 16
+DAYS = 10
+
+
+def test_concurrent_overlapping_bookings_never_double_book(client):
+    rng = random.Random(1)
+    room_ids = [room["id"] for room in client.get("/rooms").json()[:3]]
+    # Well after the stays booked by the other tests
+    first_day = date(2300, 1, 1)
+    payloads = []
+    for i in range(REQUESTS):
+        start = first_day + timedelta(days=rng.randrange(DAYS))
+        payloads.append({
+            "id": str(uuid.uuid4()),
+            "room_id": rng.choice(room_ids),
+            "guest_email": f"stress{i}@example.com",
+            "start_date": start.isoformat(),
+            "end_date": (start + timedelta(days=rng.randrange(3))).isoformat(),
+        })
+
+    with ThreadPoolExecutor(max_workers=THREADS) as pool:
+        statuses = Counter(pool.map(lambda p: client.post("/reservations", json=p).status_code, payloads))
+
+    assert set(statuses) == {201, 409}
+    with SessionLocal() as session:
+        repo = ReservationRepositoryPsql(session)
+        booked = {room_id: repo.get_by_room(room_id, date_from=first_day) for room_id in room_ids}
+    assert sum(len(stays) for stays in booked.values()) == statuses[201]
+    for stays in booked.values():
+        # Ordered by start_date: a double booking starts before the previous stay ends
+        assert all(current.start_date > previous.end_date for previous, current in zip(stays, stays[1:]))
@@ -0,0 +1,87 @@
+import csv
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from src.reservations.infra.reservation_model_psql import ReservationModel
+from src.rooms.infra.room_model_psql import RoomModel
+from src.shared.infra.csv_import import Checkpoint, import_csv
+from src.shared.infra.db import Base
+from src.shared.infra.synthetic_data import GenerationSpec, generate
+
+CHUNK_SIZE = 10
+
+
+class Crash(Exception):
+    pass
+
+
+def database(path: str):
+    engine = create_engine(f"sqlite:///{path}", future=True)
+    Base.metadata.create_all(bind=engine)
+    generate(engine, GenerationSpec(rooms=5, reservations=0), progress=lambda _: None)
+    return sessionmaker(bind=engine, autoflush=False, expire_on_commit=False, future=True)
+
+
+def write_reservations(path: str, rooms: list) -> None:
+    start = date(2031, 1, 1)
+    with open(path, "w", newline="") as f:
+        out = csv.writer(f)
+        out.writerow(["id", "room_id", "guest_email", "start_date", "end_date", "status"])
+        for n in range(35):
+            room, first = rooms[n % len(rooms)], start + timedelta(days=3 * (n // len(rooms)))
+            out.writerow([f"imp-{n:03d}", room, f"guest{n}@example.com", first, first + timedelta(days=1), "active"])
+            if n == 13:
+                # In the chunk replayed below: a repeated id and an overlap, both rejected
+                out.writerow([f"imp-{n:03d}", rooms[0], "x@example.com", date(2040, 1, 1), date(2040, 1, 1), "active"])
+                out.writerow(["overlap", room, "x@example.com", first, first, "active"])
+
+
+def stored(factory) -> list:
+    with factory() as session:
+        return session.execute(
+            select(ReservationModel.id, ReservationModel.room_id, ReservationModel.start_date).order_by(ReservationModel.id)
+        ).all()
+
+
+def test_resume_after_a_chunk_committed_without_its_checkpoint(tmp_path, monkeypatch):
+    clean = database(str(tmp_path / "clean.db"))
+    with clean() as session:
+        rooms = list(session.scalars(select(RoomModel.id).order_by(RoomModel.id)))
+    source = str(tmp_path / "reservations.csv")
+    write_reservations(source, rooms)
+    expected = import_csv("reservations", source, str(tmp_path / "clean.rejects.csv"), str(tmp_path / "clean.json"),
+                          chunk_size=CHUNK_SIZE, session_factory=clean, progress=lambda _: None)
+    assert expected.rejected == 2
+
+    factory = database(str(tmp_path / "resumed.db"))
+    rejects, checkpoint = str(tmp_path / "resumed.rejects.csv"), str(tmp_path / "resumed.json")
+    save = Checkpoint.save
+    chunks_done = 0
+
+    def crashing_save(self: Checkpoint, path: str) -> None:
+        # The second chunk is committed, its checkpoint is never written
+        nonlocal chunks_done
+        if not self.pending_line:
+            chunks_done += 1
+            if chunks_done == 2:
+                raise Crash()
+        save(self, path)
+
+    monkeypatch.setattr(Checkpoint, "save", crashing_save)
+    with pytest.raises(Crash):
+        import_csv("reservations", source, rejects, checkpoint,
+                   chunk_size=CHUNK_SIZE, session_factory=factory, progress=lambda _: None)
+    monkeypatch.setattr(Checkpoint, "save", save)
+    assert len(stored(factory)) == 2 * CHUNK_SIZE - expected.rejected
+
+    # The resumed run replays the second chunk, with a different chunk size on purpose
+    resumed = import_csv("reservations", source, rejects, checkpoint,
+                         chunk_size=CHUNK_SIZE + 3, session_factory=factory, progress=lambda _: None)
+    assert resumed.resumed_at_line == CHUNK_SIZE + 1  # after the header and the first chunk
+    assert (resumed.imported, resumed.rejected) == (expected.imported, expected.rejected)
+    assert stored(factory) == stored(clean)
+    with open(rejects) as got, open(tmp_path / "clean.rejects.csv") as want:
+        assert got.read() == want.read()
@@ -0,0 +1,47 @@
+import pytest
+
+from api.pagination import NEXT_CURSOR_HEADER, encode_cursor
+
+
+@pytest.mark.parametrize("path", ["/reservations", "/payments"])
+def test_pages_cover_every_row_once(client, path):
+    ids, cursor = [], None
+    while True:
+        response = client.get(path, params={"limit": 100, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200
+        ids.extend(item["id"] for item in response.json())
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if not cursor:
+            break
+    assert len(ids) > 100
+    assert ids == sorted(set(ids))
+
+
+@pytest.mark.parametrize("path", ["/reservations", "/payments"])
+@pytest.mark.parametrize("cursor", [encode_cursor(42), encode_cursor(None), encode_cursor("a", "b"), "not-a-cursor!"])
+def test_malformed_cursor_is_a_400(client, path, cursor):
+    response = client.get(path, params={"cursor": cursor})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+def test_room_reservation_pages_follow_the_cursor(client):
+    room_id = max(client.get("/rooms").json(), key=lambda room: len(room["reservation_ranges"]))["id"]
+    everything = client.get(f"/rooms/{room_id}/reservations", params={"limit": 500}).json()
+    pages, cursor = [], None
+    while True:
+        response = client.get(f"/rooms/{room_id}/reservations", params={"limit": 10, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200
+        pages.extend(response.json())
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if not cursor:
+            break
+    assert len(everything) > 10
+    assert pages == everything
+    assert [(r["start_date"], r["id"]) for r in pages] == sorted((r["start_date"], r["id"]) for r in pages)
+
+
+def test_room_reservation_cursor_must_be_a_start_date_and_id(client):
+    room_id = client.get("/rooms").json()[0]["id"]
+    response = client.get(f"/rooms/{room_id}/reservations", params={"cursor": encode_cursor("a1")})
+    assert response.status_code == 400
@@ -0,0 +1,9 @@
+import pytest
+
+from benchmarks.query_budgets import BUDGETS
+
+
+@pytest.mark.parametrize("name, max_queries, request_", BUDGETS, ids=[name for name, _, _ in BUDGETS])
+def test_endpoint_stays_within_query_budget(within_budget, budget_fixture, name, max_queries, request_):
+    response, _ = within_budget(max_queries, lambda client: request_(client, budget_fixture))
+    assert response.status_code < 400, f"{name}: {response.text}"
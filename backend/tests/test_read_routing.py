@@ -0,0 +1,74 @@
+import uuid
+from contextvars import ContextVar
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+import main
+from benchmarks.query_budgets import new_reservation
+
+_used: ContextVar = ContextVar("engines_used", default=None)
+
+
+def _record_engine(conn, cursor, statement, parameters, context, executemany):
+    used = _used.get()
+    if used is not None:
+        used.add("replica" if conn.engine.url.query.get("mode") == "ro" else "primary")
+
+
+@pytest.fixture
+def engines_used(client):
+    """Call `request(client)`; return (response, the engines that ran its statements)."""
+    event.listen(Engine, "before_cursor_execute", _record_engine)
+
+    def run(request):
+        used = set()
+        token = _used.set(used)
+        try:
+            response = request(client)
+        finally:
+            _used.reset(token)
+        return response, used
+
+    yield run
+    event.remove(Engine, "before_cursor_execute", _record_engine)
+
+
+@pytest.mark.parametrize("path", ["/rooms", "/reservations", "/payments"])
+def test_list_reads_use_the_replica(engines_used, path):
+    response, used = engines_used(lambda c: c.get(path))
+    assert response.status_code == 200
+    assert used == {"replica"}
+
+
+def test_room_and_ndjson_reads_use_the_replica(engines_used, budget_fixture):
+    response, used = engines_used(lambda c: c.get(f"/rooms/{budget_fixture['room_id']}"))
+    assert response.status_code == 200 and used == {"replica"}
+    response, used = engines_used(lambda c: c.get("/payments", headers={"Accept": "application/x-ndjson"}))
+    assert response.status_code == 200 and used == {"replica"}
+
+
+def test_writes_and_the_reads_they_depend_on_use_the_primary(engines_used, budget_fixture):
+    booked = new_reservation(budget_fixture["room_id"])
+    response, used = engines_used(lambda c: c.post("/reservations", json=booked))
+    assert response.status_code == 201 and used == {"primary"}
+    # Read back right after the write: a lagging replica might not have it yet
+    response, used = engines_used(lambda c: c.get(f"/reservations/{booked['id']}"))
+    assert response.status_code == 200 and used == {"primary"}
+
+    overlapping = dict(booked, id=str(uuid.uuid4()))
+    response, used = engines_used(lambda c: c.post("/reservations", json=overlapping))
+    assert response.status_code == 409 and used == {"primary"}
+
+    payment = {"id": str(uuid.uuid4()), "reservation_id": booked["id"], "amount": 400.0}
+    response, used = engines_used(lambda c: c.post("/payments", json=payment))
+    assert response.status_code == 201 and used == {"primary"}
+    response, used = engines_used(lambda c: c.post("/payments", json=dict(payment, id=str(uuid.uuid4()))))
+    assert response.status_code == 409 and used == {"primary"}
+
+
+def test_pool_metrics_cover_the_replica(client):
+    client.get("/rooms")
+    engine = "async_replica" if main.async_db_enabled else "replica"
+    assert f'engine="{engine}"' in client.get("/metrics").text
@@ -0,0 +1,49 @@
+import pytest
+
+from api import room_cache as room_cache_module
+from api.room_cache import ResponseCache
+from benchmarks.query_budgets import new_reservation
+
+
+@pytest.fixture
+def room_cache(monkeypatch) -> ResponseCache:
+    # conftest turns the cache off for the query budgets; these tests run with a fresh one
+    cache = ResponseCache()
+    monkeypatch.setattr(room_cache_module, "room_cache", cache)
+    return cache
+
+
+def ranges(rooms: list, room_id: str) -> list:
+    return next(room for room in rooms if room["id"] == room_id)["reservation_ranges"]
+
+
+def test_cached_rooms_revalidate_with_etags(client, room_cache):
+    rooms = client.get("/rooms")
+    assert rooms.headers["cache-control"].startswith("public")
+    assert client.get("/rooms", headers={"If-None-Match": rooms.headers["etag"]}).status_code == 304
+    assert client.get("/rooms").content == rooms.content
+
+
+def test_cache_hit_only_reads_the_room_version(client, room_cache, within_budget):
+    room_id = client.get("/rooms").json()[0]["id"]
+    filled = client.get(f"/rooms/{room_id}")
+    response, stats = within_budget(1, lambda c: c.get(f"/rooms/{room_id}"))
+    assert response.content == filled.content
+    assert "room_versions" in stats.statements[0]
+
+
+def test_bookings_made_by_other_workers_show_up_immediately(client, room_cache, other_worker):
+    room_id = client.get("/rooms").json()[0]["id"]
+    rooms, room = client.get("/rooms"), client.get(f"/rooms/{room_id}")
+    reservation = new_reservation(room_id)
+    booked = {"from": reservation["start_date"], "to": reservation["end_date"]}
+
+    other_worker("create", reservation)
+    after = client.get("/rooms", headers={"If-None-Match": rooms.headers["etag"]})
+    assert after.status_code == 200 and booked in ranges(after.json(), room_id)
+    room_after = client.get(f"/rooms/{room_id}", headers={"If-None-Match": room.headers["etag"]})
+    assert room_after.status_code == 200 and booked in room_after.json()["reservation_ranges"]
+
+    other_worker("cancel", reservation)
+    assert booked not in ranges(client.get("/rooms").json(), room_id)
+    assert booked not in client.get(f"/rooms/{room_id}").json()["reservation_ranges"]
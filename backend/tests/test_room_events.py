@@ -0,0 +1,62 @@
+import asyncio
+import time
+import uuid
+
+from api.room_events import _stream, room_event_broker
+from benchmarks.query_budgets import new_reservation
+
+
+def parse_events(chunk: bytes) -> list:
+    events = []
+    for frame in chunk.decode().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in frame.splitlines() if ": " in line and not line.startswith(":"))
+        if "event" in fields:
+            events.append(fields)
+    return events
+
+
+def read_events(last_event_id: str, count: int) -> list:
+    async def collect():
+        events = []
+        stream = _stream(room_event_broker, last_event_id)
+        async for chunk in stream:
+            events += parse_events(chunk)
+            if len(events) >= count:
+                await stream.aclose()
+                return events
+
+    return asyncio.run(asyncio.wait_for(collect(), 10))
+
+
+def wait_for_event(seq: int, event: str, reservation_id: str) -> dict:
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        for _, frame in room_event_broker.frames_after(seq) or []:
+            for fields in parse_events(frame):
+                if fields["event"] == event and reservation_id in fields["data"]:
+                    return fields
+        time.sleep(0.05)
+    raise AssertionError(f"no {event} event for {reservation_id}")
+
+
+def test_stream_receives_changes_made_by_other_workers(client, other_worker):
+    room_id = client.get("/rooms").json()[0]["id"]
+    reservation = new_reservation(room_id)
+    seq = room_event_broker.last_seq
+
+    other_worker("create", reservation)
+    created = wait_for_event(seq, "created", reservation["id"])
+    assert created["data"] == (
+        f'{{"room_id":"{room_id}","reservation_id":"{reservation["id"]}",'
+        f'"from":"{reservation["start_date"]}","to":"{reservation["end_date"]}"}}'
+    )
+
+    # Missed while disconnected: replayed after the change id, which every worker shares
+    other_worker("cancel", reservation)
+    replayed = read_events(created["id"], 1)
+    assert replayed[0]["event"] == "cancelled" and reservation["id"] in replayed[0]["data"]
+
+
+def test_unknown_last_event_id_gets_a_reset(client):
+    events = read_events(str(uuid.uuid4().int), 1)
+    assert events[0]["event"] == "reset"
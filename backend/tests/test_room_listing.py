@@ -0,0 +1,19 @@
+from src.shared.infra.db import engine
+from src.shared.infra.synthetic_data import GenerationSpec, generate
+
+
+def test_rooms_listing_runs_the_same_statements_as_rooms_grow(client, within_budget):
+    response, before = within_budget(1, lambda c: c.get("/rooms"))
+    rooms = len(response.json())
+
+    generate(engine, GenerationSpec(rooms=200, reservations=4000, seed=1001), progress=lambda _: None)
+    response, after = within_budget(1, lambda c: c.get("/rooms"))
+
+    assert len(response.json()) == rooms + 200
+    assert after.count == before.count
+
+
+def test_rooms_listing_renders_identical_bodies(client):
+    first, second = client.get("/rooms"), client.get("/rooms")
+    assert first.content == second.content
+    assert first.headers["etag"] == second.headers["etag"]
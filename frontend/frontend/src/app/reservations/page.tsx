@@ -27,9 +27,17 @@ async function getBaseUrl() {
 async function fetchAllReservations(): Promise<Reservation[]> {
   try {
     const base = await getBaseUrl();
-    const res = await fetch(`${base}/api/reservations`, { cache: "no-store" });
-    if (!res.ok) throw new Error("Failed to fetch reservations");
-    return (await res.json()) as Reservation[];
+    const reservations: Reservation[] = [];
+    // The API returns pages of at most 100, with X-Next-Cursor while more remain
+    let cursor: string | null = null;
+    do {
+      const query: string = cursor ? `&cursor=${encodeURIComponent(cursor)}` : "";
+      const res: Response = await fetch(`${base}/api/reservations?limit=100${query}`, { cache: "no-store" });
+      if (!res.ok) throw new Error("Failed to fetch reservations");
+      reservations.push(...((await res.json()) as Reservation[]));
+      cursor = res.headers.get("X-Next-Cursor");
+    } while (cursor);
+    return reservations;
   } catch (e) {
     console.error(e);
     return [];
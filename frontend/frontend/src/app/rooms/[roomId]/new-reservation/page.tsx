@@ -117,10 +117,18 @@ export default function NewReservationPage({ params }: { params: Promise<{ roomI
   // Refresca las reservas ACTIVAS del backend para este roomId
   async function refreshExisting() {
     try {
-      const res = await fetch(`/api/rooms/${roomId}/reservations`, { cache: "no-store" });
-      const data = await res.json();
+      // Follow X-Next-Cursor: a room can have more active reservations than one page
+      const data: any[] = [];
+      let cursor: string | null = null;
+      do {
+        const query: string = cursor ? `&cursor=${encodeURIComponent(cursor)}` : "";
+        const res: Response = await fetch(`/api/rooms/${roomId}/reservations?limit=500${query}`, { cache: "no-store" });
+        if (!res.ok) throw new Error("Failed to fetch reservations");
+        data.push(...(await res.json()));
+        cursor = res.headers.get("X-Next-Cursor");
+      } while (cursor);
       setExisting(
-        (data || [])
+        data
           .filter((r: any) => (r?.status ? String(r.status).toLowerCase() === "active" : true))
           .map((r: any) => ({ start_date: r.start_date, end_date: r.end_date }))
       );
@@ -27,10 +27,20 @@ async function getBaseUrl() {
 
 async function fetchReservations(roomId: string) {
   try {
-      const base = await getBaseUrl();
-      const res = await fetch(`${base}/api/rooms/${roomId}/reservations`, { cache: "no-store" });
-    if (!res.ok) throw new Error("Failed to fetch reservations");
-    return (await res.json()) as Reservation[];
+    const base = await getBaseUrl();
+    const reservations: Reservation[] = [];
+    // Pages of at most 500, with X-Next-Cursor while more remain
+    let cursor: string | null = null;
+    do {
+      const query: string = cursor ? `&cursor=${encodeURIComponent(cursor)}` : "";
+      const res: Response = await fetch(`${base}/api/rooms/${roomId}/reservations?limit=500${query}`, {
+        cache: "no-store",
+      });
+      if (!res.ok) throw new Error("Failed to fetch reservations");
+      reservations.push(...((await res.json()) as Reservation[]));
+      cursor = res.headers.get("X-Next-Cursor");
+    } while (cursor);
+    return reservations;
   } catch (e) {
     console.error(e);
     return [] as Reservation[];